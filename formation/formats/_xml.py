@@ -5,16 +5,6 @@
 import re
 from collections import defaultdict
 
-try:
-    from lxml import etree
-    element_class = etree._Element
-    _using_lxml = True
-except ModuleNotFoundError:
-    # use default xml library; features may be limited
-    import xml.etree.ElementTree as etree
-    element_class = etree.Element
-    _using_lxml = False
-
 from formation.formats._base import BaseFormat, Node
 
 namespaces = {
@@ -27,12 +17,28 @@ _reversed_namespaces = dict(zip(namespaces.values(), namespaces.keys()))
 _attr_rgx = re.compile(r"{(?P<namespace>.+)}(?P<attr>.+)")
 
 
-def _register_namespaces():
+# xml library is only imported once an xml design is processed
+_etree = None
+_using_lxml = False
+
+
+def _register_namespaces(etree):
     for k in namespaces:
         etree.register_namespace(k, namespaces[k])
 
 
-_register_namespaces()
+def _get_etree():
+    global _etree, _using_lxml
+    if _etree is None:
+        try:
+            from lxml import etree
+            _using_lxml = True
+        except ModuleNotFoundError:
+            # use default xml library; features may be limited
+            import xml.etree.ElementTree as etree
+        _register_namespaces(etree)
+        _etree = etree
+    return _etree
 
 
 class XMLFormat(BaseFormat):
@@ -45,7 +51,7 @@ class XMLFormat(BaseFormat):
             return " ".join(map(str, value))
         return str(value)
 
-    def _load_node(self, parent, x_node: element_class):
+    def _load_node(self, parent, x_node):
         grouped = defaultdict(dict)
         # add required fields
         for attr in x_node.attrib:
@@ -65,6 +71,7 @@ class XMLFormat(BaseFormat):
         return node
 
     def _generate_node(self, parent, node: Node):
+        etree = _get_etree()
         if parent is None:
             x_node = etree.Element(node.type)
         else:
@@ -85,6 +92,7 @@ class XMLFormat(BaseFormat):
         return x_node
 
     def load(self):
+        etree = _get_etree()
         if self.path:
             with open(self.path, "rb") as file:
                 x_node = etree.parse(file).getroot()
@@ -94,6 +102,7 @@ class XMLFormat(BaseFormat):
         return self.root
 
     def generate(self, **kw):
+        etree = _get_etree()
         x_node = self._generate_node(None, self.root)
         if _using_lxml:
             etree.cleanup_namespaces(x_node, top_nsmap=namespaces)
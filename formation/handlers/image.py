@@ -3,8 +3,6 @@ import math
 import os
 import pathlib
 
-from PIL import ImageTk, Image
-
 from formation.utils import as_posix_path
 
 image_props = (
@@ -26,6 +24,7 @@ def _resolve_path(path, base=None):
 
 
 def parse_image(path, master=None, base_path=None):
+    from PIL import Image, ImageTk
     path = _resolve_path(path, base_path)
 
     image = Image.open(path)
@@ -34,6 +33,7 @@ def parse_image(path, master=None, base_path=None):
 
 
 def to_tk_image(image, widget=None):
+    from PIL import ImageTk
     root = None
     if widget:
         root = widget.winfo_toplevel()
@@ -53,6 +53,8 @@ def get_frames(image, widget=None):
 
 
 def load_image_to_widget(widget, image, prop, builder, handle_method=None):
+    # deferred so designs without images never import PIL
+    from PIL import Image
     # cancel any animate cycles present
     cycle_attr = '_{}_cycle'.format(prop)
     handle_method = widget.config if handle_method is None else handle_method
@@ -99,6 +101,7 @@ def handle(widget, config, **kwargs):
     props = kwargs.get("extra_config", {})
     handle_method = kwargs.get("handle_method")
     builder = kwargs.get("builder")
+    from PIL import Image
     for prop in props:
         if not props[prop]:
             # ignore empty values
@@ -19,7 +19,6 @@ from formation.meth import Meth
 from formation.handlers.image import parse_image
 from formation.handlers.scroll import apply_scroll_config
 from formation.utils import is_class_toplevel, is_class_root, callback_parse, event_handler
-from formation.themes import get_theme
 import formation
 
 logger = logging.getLogger(__name__)
@@ -316,6 +315,8 @@ class Builder:
         theme = self._meta.get("theme")
         # Only load theme if the node is the root i.e. no parent provided during init.
         if theme and not self._has_parent:
+            # themes are only imported when a design requires one
+            from formation.themes import get_theme
             theme, sub_theme = theme.get("theme"), theme.get("sub_theme")
             theme = get_theme(theme)
             if theme:
@@ -0,0 +1,117 @@
+"""
+Long running preview server used by the studio. Designs are received as
+newline delimited json messages on standard input and displayed without
+paying the cost of starting a new interpreter for every preview.
+
+Messages are json objects with a ``cmd`` key:
+
+* ``load``: display the design in ``design`` (a json formatted design string)
+  replacing any current preview. ``dir`` optionally sets the working directory
+  and ``paths`` lists custom widget paths to be added to ``sys.path``
+* ``close``: close the current preview
+* ``exit``: close the current preview and stop the server
+"""
+# ======================================================================= #
+# Copyright (c) 2024 Hoverset Group.                                      #
+# ======================================================================= #
+import json
+import logging
+import os
+import pathlib
+import queue
+import sys
+import threading
+import tkinter as tk
+
+from formation.formats import JSONFormat
+from formation.loader import AppBuilder
+
+# interval in milliseconds at which a displayed preview checks for new messages
+POLL_INTERVAL = 50
+
+
+def _read(stream, messages):
+    for line in stream:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            messages.put(json.loads(line))
+        except ValueError:
+            logging.error("Invalid preview message")
+    # the studio has closed the pipe
+    messages.put({"cmd": "exit"})
+
+
+def _prepare(message):
+    working_dir = message.get("dir")
+    if working_dir and os.path.exists(working_dir):
+        os.chdir(working_dir)
+
+    for c_path in message.get("paths", ()):
+        c_path = pathlib.Path(c_path).resolve()
+        if str(c_path.parent) not in sys.path:
+            sys.path.append(str(c_path.parent))
+
+
+def _show(message, messages):
+    """
+    Display a preview and run its event loop until it is closed or a new
+    message arrives. Returns the message that ended the preview if any
+    """
+    _prepare(message)
+    try:
+        app = AppBuilder(node=JSONFormat(data=message["design"]).load())
+    except Exception:
+        logging.exception("Could not load preview")
+        return None
+
+    window = app._app
+    # the preview window may be a toplevel with an implicitly created root
+    root = window._root()
+    pending = []
+
+    def on_destroy(event):
+        if event.widget is window:
+            root.quit()
+
+    def poll():
+        try:
+            pending.append(messages.get_nowait())
+        except queue.Empty:
+            root.after(POLL_INTERVAL, poll)
+            return
+        window.destroy()
+
+    window.bind("<Destroy>", on_destroy, add="+")
+    root.after(POLL_INTERVAL, poll)
+    root.mainloop()
+    try:
+        root.destroy()
+    except tk.TclError:
+        # already destroyed
+        pass
+    return pending[0] if pending else None
+
+
+def serve(stream=None):
+    """
+    Run the preview server until an ``exit`` message is received or the
+    input stream is closed
+
+    :param stream: input stream to read messages from, defaults to stdin
+    """
+    messages = queue.Queue()
+    reader = threading.Thread(target=_read, args=(stream or sys.stdin, messages), daemon=True)
+    reader.start()
+
+    message = messages.get()
+    while message.get("cmd") != "exit":
+        next_message = None
+        if message.get("cmd") == "load":
+            next_message = _show(message, messages)
+        message = next_message or messages.get()
+
+
+if __name__ == '__main__':
+    serve()
@@ -0,0 +1,83 @@
+import os
+import subprocess
+import sys
+import unittest
+
+import formation
+
+# root of the repository so the subprocess imports the same packages
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(formation.__file__)))
+
+# cumulative import time budgets in microseconds. They are deliberately
+# generous so they only trip on regressions such as a heavy module being
+# imported eagerly again and not on slow machines
+BUDGETS = {
+    "formation": 400_000,
+    "formation.loader": 400_000,
+    "formation.formats": 150_000,
+    "formation.handlers": 150_000,
+}
+
+# modules that should only be imported when a design actually needs them
+DEFERRED = (
+    "PIL",
+    "lxml",
+    "xml.etree.ElementTree",
+    "formation.themes",
+    "ctypes",
+)
+
+# take the best of several runs to reduce noise
+RUNS = 3
+
+
+def import_times(statement):
+    """
+    Run statement in a fresh interpreter with ``-X importtime`` and parse the result
+
+    :param statement: python statement performing the imports
+    :return: dict mapping module names to their cumulative import time in microseconds
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=_ROOT, capture_output=True, text=True, check=True
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        try:
+            _, cumulative, name = line[len("import time:"):].split("|")
+            times[name.strip()] = int(cumulative)
+        except ValueError:
+            # header line
+            continue
+    return times
+
+
+class ImportTimeTestCase(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        runs = [import_times("from formation import AppBuilder") for _ in range(RUNS)]
+        cls.times = {name: min(run.get(name, 0) for run in runs) for name in runs[0]}
+
+    def test_parse(self):
+        times = import_times("import json")
+        self.assertIn("json", times)
+        self.assertGreater(times["json"], 0)
+
+    def test_deferred(self):
+        for module in DEFERRED:
+            with self.subTest(module=module):
+                self.assertNotIn(module, self.times)
+
+    def test_budgets(self):
+        for module, budget in BUDGETS.items():
+            with self.subTest(module=module):
+                self.assertIn(module, self.times)
+                self.assertLessEqual(self.times[module], budget)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,38 @@
+import io
+import json
+import unittest
+
+from formation.formats import JSONFormat, infer_format
+from formation.preview import serve
+from formation.tests.support import get_resource
+
+
+def _messages(*messages):
+    return io.StringIO("".join(json.dumps(m) + "\n" for m in messages))
+
+
+class PreviewServerTestCase(unittest.TestCase):
+
+    def test_exit(self):
+        # server should stop without ever creating a window
+        serve(_messages({"cmd": "close"}, {"cmd": "exit"}))
+
+    def test_stream_closed(self):
+        serve(_messages({"cmd": "close"}))
+
+    def test_load(self):
+        path = get_resource("all_legacy.xml")
+        design = JSONFormat(node=infer_format(path)(path=path).load()).generate(compact=True)
+        # each load replaces the previous preview and exit closes the last one
+        serve(_messages(
+            {"cmd": "load", "design": design},
+            {"cmd": "load", "design": design},
+            {"cmd": "exit"}
+        ))
+
+    def test_invalid_design(self):
+        serve(_messages({"cmd": "load", "design": "{"}, {"cmd": "exit"}))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -25,7 +25,20 @@ class Routine:
         self.group = group
         self._func = func
         self._listeners = []
-        self.shortcut = shortcut
+        self._shortcut = shortcut
+
+    @property
+    def shortcut(self):
+        return self._shortcut
+
+    @shortcut.setter
+    def shortcut(self, shortcut):
+        if _all_actions.get(self.key) is self:
+            _unindex(self)
+            self._shortcut = shortcut
+            _index(self)
+        else:
+            self._shortcut = shortcut
 
     @property
     def accelerator(self):
@@ -59,6 +72,18 @@ class Routine:
 
 
 _all_actions = {}
+# maps the keycodes of shortcuts to the routines they invoke
+_shortcut_index = {}
+
+
+def _index(routine):
+    if routine.shortcut is not None and routine.shortcut.keycode:
+        _shortcut_index[routine.shortcut.keycode] = routine
+
+
+def _unindex(routine):
+    if routine.shortcut is not None and _shortcut_index.get(routine.shortcut.keycode) is routine:
+        _shortcut_index.pop(routine.shortcut.keycode)
 
 
 def add(*routines):
@@ -68,7 +93,10 @@ def add(*routines):
     :param routines: :py:class:`Routine` objects to be added
     """
     for routine in routines:
+        if routine.key in _all_actions:
+            _unindex(_all_actions[routine.key])
         _all_actions[routine.key] = routine
+        _index(routine)
 
 
 def get_routine(key):
@@ -91,7 +119,9 @@ def remove(*routines):
     :param routines: routines to be removed
     """
     for routine in routines:
-        _all_actions[routine.key] = routine
+        if _all_actions.get(routine.key) is routine:
+            _unindex(routine)
+            _all_actions.pop(routine.key)
 
 
 def all_routines():
@@ -110,7 +140,6 @@ def routine_from_shortcut(shortcut):
     :param shortcut: :py:class:`hoverset.data.keymap.Key` object
     :return: Routine object with given shortcut otherwise None
     """
-    search = list(filter(lambda r: r.shortcut == shortcut, _all_actions.values()))
-    if len(search) > 0:
-        return search[0]
-    return None
+    if shortcut is None:
+        return None
+    return _shortcut_index.get(shortcut.keycode)
@@ -0,0 +1,137 @@
+"""
+Packed icon atlas. All icons are stored in a single file made up of an index
+followed by the image data. The file is memory mapped once and icons are read
+straight from the mapping. Commonly used sizes are pre-rendered as raw RGBA
+pixels so they can be wrapped into images without decoding or copying.
+"""
+
+# ======================================================================= #
+# Copyright (C) 2024 Hoverset Group.                                      #
+# ======================================================================= #
+
+import io
+import json
+import mmap
+import os
+import struct
+
+from PIL import Image
+
+MAGIC = b"HSATLAS1"
+_HEADER = struct.Struct("<8sI")
+
+# bounding boxes pre-rendered by default, these are the sizes most used by the studio
+COMMON_SIZES = ((14, 14), (15, 15), (18, 18), (20, 20), (25, 25))
+
+
+def _size_key(width, height):
+    return f"{width}x{height}"
+
+
+def build_atlas(path, images, sizes=COMMON_SIZES):
+    """
+    Pack images into an atlas file
+
+    :param path: path of the atlas file to be created
+    :param images: dict mapping icon names to png encoded bytes
+    :param sizes: bounding boxes to be pre-rendered for every icon
+    """
+    index = {}
+    blobs = []
+    offset = 0
+
+    def add(data):
+        nonlocal offset
+        blobs.append(data)
+        entry = [offset, len(data)]
+        offset += len(data)
+        return entry
+
+    for name, data in images.items():
+        entry = {"png": add(data), "raw": {}}
+        image = Image.open(io.BytesIO(data)).convert("RGBA")
+        for width, height in sizes:
+            thumb = image.copy()
+            thumb.thumbnail((width, height), Image.LANCZOS)
+            entry["raw"][_size_key(width, height)] = [*add(thumb.tobytes()), *thumb.size]
+        index[name] = entry
+
+    index_bytes = json.dumps(index, separators=(",", ":")).encode("utf-8")
+    temp_path = path + ".tmp"
+    with open(temp_path, "wb") as file:
+        file.write(_HEADER.pack(MAGIC, len(index_bytes)))
+        file.write(index_bytes)
+        for blob in blobs:
+            file.write(blob)
+    os.replace(temp_path, path)
+
+
+class IconAtlas:
+    """
+    Read only memory mapped view of an atlas file created with :py:func:`build_atlas`
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, index_length = _HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            self._map.close()
+            raise ValueError(f"{path} is not an icon atlas")
+        start = _HEADER.size
+        self._index = json.loads(self._map[start:start + index_length].decode("utf-8"))
+        self._data_start = start + index_length
+        self._view = memoryview(self._map)
+
+    @staticmethod
+    def is_atlas(path):
+        """
+        Check whether the file at path is an icon atlas
+
+        :param path: file path
+        :return: ``True`` if file is an icon atlas
+        """
+        if not os.path.isfile(path):
+            return False
+        with open(path, "rb") as file:
+            return file.read(len(MAGIC)) == MAGIC
+
+    def _slice(self, offset, length):
+        start = self._data_start + offset
+        return self._view[start:start + length]
+
+    def __contains__(self, name):
+        return name in self._index
+
+    def names(self):
+        return self._index.keys()
+
+    def get_bytes(self, name):
+        """
+        Get the png encoded data of an icon without copying
+
+        :param name: icon name
+        :return: memoryview of the png data
+        """
+        return self._slice(*self._index[name]["png"])
+
+    def get_image(self, name, width, height):
+        """
+        Get an icon fitting in the given bounding box. Pre-rendered sizes are
+        wrapped directly around the mapped pixels and are read only; PIL copies
+        them transparently if they are modified.
+
+        :param name: icon name
+        :param width: maximum width
+        :param height: maximum height
+        :return: PIL image
+        """
+        entry = self._index[name]
+        raw = entry["raw"].get(_size_key(width, height))
+        if raw is not None:
+            offset, length, w, h = raw
+            return Image.frombuffer("RGBA", (w, h), self._slice(offset, length), "raw", "RGBA", 0, 1)
+        image = Image.open(io.BytesIO(self.get_bytes(name)))
+        image.thumbnail((width, height), Image.LANCZOS)
+        return image
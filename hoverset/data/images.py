@@ -6,14 +6,17 @@ Provides functions for global image access and processing by hoverset apps
 # Copyright (C) 2020 Hoverset Group.                                      #
 # ======================================================================= #
 
-import functools
 import io
 import itertools
 import os
 import shelve
 import math
 import hashlib
+import threading
+import weakref
+from collections import OrderedDict
 
+from hoverset.data.atlas import IconAtlas
 from hoverset.data.utils import get_resource_path
 from hoverset.util.color import to_rgb, luminosity
 
@@ -23,39 +26,134 @@ from PIL import Image, ImageTk
 _primary_location = get_resource_path('hoverset.data', "image")
 # path to theme recolored and cached image resources
 _secondary_location = _primary_location
+# memory mapped atlas of theme recolored image resources if available
+_atlas = None
 
 
 def set_image_resource_path(path):
     """
     Set the path at which to obtain image and icon resources at the start of the application
 
-    :param path: a valid path to a shelve resource without necessarily an extension
+    :param path: a valid path to an icon atlas or to a shelve resource without necessarily an extension
     :return: None
     """
-    global _secondary_location
-    if os.path.exists(os.path.dirname(path)):
-        _secondary_location = path
-    else:
+    global _secondary_location, _atlas
+    if not os.path.exists(os.path.dirname(path)):
         raise FileNotFoundError("Image shelve {} path does not exist", path)
+    _secondary_location = path
+    _atlas = IconAtlas(path) if IconAtlas.is_atlas(path) else None
+    image_cache.clear()
+
+
+def _image_size(image):
+    return image.width * image.height * len(image.getbands())
+
+
+class ImageCache:
+    """
+    Least recently used cache for decoded images bounded by the approximate
+    memory occupied by the images rather than their number. The cache can be
+    accessed from multiple threads.
+    """
+
+    def __init__(self, max_size=64 * 1024 * 1024):
+        """
+        :param max_size: maximum memory in bytes held by cached images, ``None`` for no limit
+        """
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._items = OrderedDict()
+        self._size = 0
+        self._lock = threading.RLock()
+
+    @property
+    def size(self):
+        """
+        Approximate memory in bytes held by cached images
+        """
+        return self._size
+
+    def get(self, key, default=None):
+        with self._lock:
+            if key not in self._items:
+                self.misses += 1
+                return default
+            self.hits += 1
+            self._items.move_to_end(key)
+            return self._items[key][0]
+
+    def put(self, key, image):
+        size = _image_size(image)
+        with self._lock:
+            if key in self._items:
+                self._size -= self._items.pop(key)[1]
+            self._items[key] = (image, size)
+            self._size += size
+            # the most recent image is always kept
+            while self.max_size is not None and self._size > self.max_size and len(self._items) > 1:
+                _, (_, evicted_size) = self._items.popitem(last=False)
+                self._size -= evicted_size
+        return image
+
+    def get_or_create(self, key, factory):
+        """
+        Get image cached under ``key`` creating and caching it if absent
+
+        :param key: hashable cache key
+        :param factory: callable returning the image on a cache miss
+        :return: cached image
+        """
+        image = self.get(key)
+        if image is None:
+            image = self.put(key, factory())
+        return image
+
+    def stats(self):
+        """
+        :return: dict with the ``hits``, ``misses``, number of ``items`` and
+          approximate ``size`` in bytes of the cache
+        """
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "items": len(self._items), "size": self._size}
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+            self._size = 0
+
+    def __contains__(self, key):
+        return key in self._items
+
+    def __len__(self):
+        return len(self._items)
+
+
+# shared by all image helpers in this module
+image_cache = ImageCache()
+
+
+def _get_atlas_image(identifier, width, height):
+    for name in (identifier, "_" + identifier, "default"):
+        if name in _atlas:
+            return _atlas.get_image(name, width, height)
+    return None
 
 
 def _recolor(image, color):
     color = to_rgb(color) if isinstance(color, str) else color
     # expand to RGBA color
     color = (*color, 255)
-    pix = image.load()
-
-    for x in range(image.size[0]):
-        for y in range(image.size[1]):
-            if pix[x, y][3] != 0:
-                pix[x, y] = color
-
+    if image.mode != "RGBA":
+        image = image.convert("RGBA")
+    # every pixel that is not fully transparent takes up the color
+    mask = image.getchannel("A").point(lambda a: 255 if a else 0)
+    image.paste(color, mask=mask)
     return image
 
 
 # We want to enable memoization to reduce the number of times we read the image database
 # An image can be accessed multiple times in the application lifetime hence a cache can improve performance greatly
-@functools.lru_cache()
 def get_image(identifier: str, width=25, height=25, **kwargs):
     """
     Fetches a PIL image object with a given dimension from the image database.
@@ -68,6 +166,17 @@ def get_image(identifier: str, width=25, height=25, **kwargs):
     :return: PIL image
     """
     color = kwargs.get("color")
+    location = _primary_location if color else _secondary_location
+    key = ("icon", location, identifier, width, height, color)
+    return image_cache.get_or_create(key, lambda: _get_image(identifier, width, height, color))
+
+
+def _get_image(identifier, width, height, color):
+    if _atlas is not None and not color:
+        image = _get_atlas_image(identifier, width, height)
+        if image is None:
+            raise FileNotFoundError("Image atlas {} has no default image".format(_atlas.path))
+        return image
     image: Image
     loc = _secondary_location
     if color:
@@ -114,51 +223,77 @@ def load_image(path, **kwargs):
     return image
 
 
-_hash_image_cache = dict()
-_hash_image_with_size_cache = dict()
-_hash_tk_image_cache = dict()
+def _file_key(path):
+    stat = os.stat(path)
+    return os.path.abspath(path), stat.st_mtime_ns, stat.st_size
 
 
 def load_image_cached(path, **kwargs):
-    with open(path, "rb") as image_file:
-        h = hashlib.md5(image_file.read()).hexdigest()
+    """
+    Load image from file described by path. The decoded image is cached
+    until the file is modified.
 
-    if h in _hash_image_cache:
-        image = _hash_image_cache[h]
-    else:
-        image = Image.open(path)
-        _hash_image_cache[h] = image
+    :param path: Image file path
+    :param kwargs: ``width`` and ``height`` of bounding box to which the image is scaled
+    :return: PIL image
+    """
+    file_key = _file_key(path)
 
+    def load():
+        loaded = Image.open(path)
+        loaded.load()
+        return loaded
+
+    image = image_cache.get_or_create(("file", *file_key), load)
     width = kwargs.get("width", image.width)
     height = kwargs.get("height", image.height)
-    size_key = (h, width, height)
 
     if (width, height) != image.size:
-        if size_key in _hash_image_with_size_cache:
-            image = _hash_image_with_size_cache[size_key]
-        else:
-            image = image.copy()
-            image.thumbnail((width, height))
-            _hash_image_with_size_cache[size_key] = image
+        def resize():
+            resized = image.copy()
+            resized.thumbnail((width, height))
+            return resized
+
+        key = ("file", *file_key, width, height)
+        image = image_cache.get_or_create(key, resize)
+        image._cache_key = key
+    else:
+        image._cache_key = ("file", *file_key)
 
     return image
 
 
-def _get_image_hash(image):
+def _get_image_key(image):
+    # images from load_image_cached are identified by their file
+    if hasattr(image, "_cache_key"):
+        return image._cache_key
     if not hasattr(image, "_img_hash"):
         h = hashlib.md5(image.tobytes()).hexdigest()
         setattr(image, "_img_hash", h)
     return image._img_hash
 
 
+# tk images are shared only while something references them. They are kept out of
+# image_cache since evicting one would blank every widget still displaying it
+_tk_images = weakref.WeakValueDictionary()
+_tk_images_lock = threading.Lock()
+
+
 def to_tk_image_cached(image):
-    h = _get_image_hash(image)
-    if h not in _hash_tk_image_cache:
-        _hash_tk_image_cache[h] = ImageTk.PhotoImage(image)
-        print("Image cache: miss")
-    else:
-        print("Image cache: hit")
-    return _hash_tk_image_cache[h]
+    """
+    Convert a PIL image to a tkinter image reusing a tkinter image created
+    earlier for the same image if it is still in use. Callers must hold a
+    reference to the returned image for as long as it is displayed
+
+    :param image: PIL image
+    :return: tkinter compatible image
+    """
+    key = _get_image_key(image)
+    with _tk_images_lock:
+        tk_image = _tk_images.get(key)
+        if tk_image is None:
+            tk_image = _tk_images[key] = ImageTk.PhotoImage(image)
+    return tk_image
 
 
 def get_frames(image):
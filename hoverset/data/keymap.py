@@ -252,8 +252,14 @@ class ShortcutManager(KeyMap):
         preferences.set_default('allow_hotkeys', True)
         preferences.set_default('hotkeys', {})
         self.preferences = preferences
+        # avoid reading preferences on every key press
+        self._allow_hotkeys = preferences.get('allow_hotkeys')
+        preferences.add_listener('allow_hotkeys', self._on_allow_hotkeys)
         self.update_bindings()
 
+    def _on_allow_hotkeys(self, value):
+        self._allow_hotkeys = value
+
     def add_routines(self, *routines):
         """
         Utility method that adds the routine to action manager for you
@@ -276,7 +282,7 @@ class ShortcutManager(KeyMap):
 
     def _dispatch(self, event, with_alt=False):
         # allow dispatch if and only if hotkeys are allowed
-        if self.preferences.get("allow_hotkeys"):
+        if self._allow_hotkeys:
             super()._dispatch(event, with_alt)
 
     def _invoke(self, routine_key):
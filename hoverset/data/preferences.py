@@ -10,6 +10,7 @@ import typing
 from pathlib import Path
 from collections import defaultdict
 
+from hoverset.data.prefstore import PreferenceStore, StoreLockedError, read_section
 from hoverset.data.utils import make_path
 from hoverset.data.images import get_tk_image
 from hoverset.data.actions import get_routine
@@ -40,6 +41,29 @@ def open_raw_shelve(app, author, file, *args):
     return shelve.open(path, *args)
 
 
+def read_raw(app, author, file, path):
+    """
+    Read a preference value without acquiring the preference file. Useful
+    for preferences needed before the preferences are loaded
+
+    :param app: application name
+    :param author: application author
+    :param file: preference file name
+    :param path: config path for instance 'locale::language'
+    :return: value at path
+    """
+    section, *keys = path.split(SharedPreferences.PATH_SEP)
+    file_path = os.path.join(platformdirs.AppDirs(app, author).user_config_dir, file)
+    value = read_section(file_path, section)
+    if value is None:
+        # preferences not yet migrated from the legacy shelve
+        with shelve.open(file_path, "r") as legacy:
+            value = legacy[section]
+    for key in keys:
+        value = value[key]
+    return value
+
+
 class _PreferenceInstanceCreator(type):
     """
     We need to ensure only one config handler exists for a given config file
@@ -65,34 +89,18 @@ class SharedPreferences(metaclass=_PreferenceInstanceCreator):
         self._file = file
         self._app_dir = platformdirs.AppDirs(app, author)
         self._listeners = defaultdict(list)
-        files = self._get_files()
-
-        if files:
-            self.data = self._get_shelve()
-            try:
-                self._deep_update(self.data, defaults)
-            except pickle.UnpicklingError:
-                if len(files) > 1:
-                    # we cannot tell whether the config file is really
-                    # corrupted if there are multiple possibly non-pickle files
-                    raise Exception("Cannot perform recovery, multiple config files found!")
-                # The pickle file is corrupted
-                logging.error("Config file is corrupted, attempting recovery.")
-                # the cache contains the data that was recoverable
-                recovered = self.data.cache
-                self.data.close()
-                # delete all the generated pickle files
-                for f in self._get_generated_files():
-                    Path(f).unlink(True)
-                self.data = self._get_shelve()
-                self._deep_update(self.data, defaults)
-                # restore the little we could recover
-                self._deep_update(self.data, recovered)
-
-        else:
-            make_path(self.get_dir())
-            self.data = self._get_shelve()
-            self.data.update(defaults)
+        make_path(self.get_dir())
+        path = os.path.join(self.get_dir(), self._file)
+        try:
+            self._store = PreferenceStore(path)
+        except StoreLockedError:
+            raise SharedPreferences.ConfigFileInUseError(path) from None
+        self.data = self._store.data
+
+        if not self._store.exists and self._get_files():
+            self._migrate()
+        self._deep_update(self.data, defaults)
+        self._store.touch()
         atexit.register(self._release)
 
     def __del__(self):
@@ -101,10 +109,36 @@ class SharedPreferences(metaclass=_PreferenceInstanceCreator):
 
     def _release(self):
         try:
-            self.data.close()
+            self._store.close()
         except:
             pass
 
+    def _migrate(self):
+        # copy preferences from the legacy shelve recovering whatever we can
+        try:
+            with shelve.open(os.path.join(self.get_dir(), self._file), "r") as legacy:
+                for key in list(legacy.keys()):
+                    try:
+                        self.data[key] = legacy[key]
+                    except (pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+                        logging.error("Config section %s is corrupted and could not be recovered", key)
+        except Exception as e:
+            logging.error("Could not migrate legacy config file: %s", e)
+
+    def sync(self, path=None):
+        """
+        Schedule a write of the section containing path. Call this after
+        modifying a value obtained through :py:meth:`get` in place
+        :param path: config path, if not provided all sections are written
+        """
+        self._store.touch(None if path is None else path.split(SharedPreferences.PATH_SEP)[0])
+
+    def flush(self):
+        """
+        Write all pending changes immediately
+        """
+        self._store.flush()
+
     def get_dir(self):
         return self._app_dir.user_config_dir
 
@@ -120,21 +154,6 @@ class SharedPreferences(metaclass=_PreferenceInstanceCreator):
         files.extend(glob.glob(os.path.join(self.get_dir(), f"{self._file}")))
         return files
 
-    def _get_generated_files(self):
-        files = glob.glob(os.path.join(self.get_dir(), f'{self._file}.*'))
-        files.extend(glob.glob(os.path.join(self.get_dir(), f'{self._file}')))
-        return files
-
-    def _get_shelve(self):
-        path = os.path.join(self.get_dir(), self._file)
-        try:
-            return shelve.open(path, writeback=True)
-        except IOError as e:
-            if e.errno == 11:
-                raise SharedPreferences.ConfigFileInUseError(path)
-            else:
-                raise e from None
-
     def exists(self, path):
         """
         Check whether a config path exists.
@@ -184,7 +203,11 @@ class SharedPreferences(metaclass=_PreferenceInstanceCreator):
         *dicts, prop = path.split(SharedPreferences.PATH_SEP)
         ref_dict = self.get_dict(dicts)
         if prop in ref_dict:
-            return ref_dict[prop]
+            value = ref_dict[prop]
+            if isinstance(value, (dict, list, set)):
+                # the value may be modified in place by the caller
+                self.sync(path)
+            return value
         raise ValueError("No such value {}".format(prop))
 
     def set(self, path, value):
@@ -196,9 +219,10 @@ class SharedPreferences(metaclass=_PreferenceInstanceCreator):
         :return: None
         """
         *dicts, prop = path.split(SharedPreferences.PATH_SEP)
-        ref_dict = self.get_dict(dicts)
-        ref_dict[prop] = value
-        self.data.sync()
+        with self._store.mutex:
+            ref_dict = self.get_dict(dicts)
+            ref_dict[prop] = value
+        self.sync(path)
         # call all listeners associated to path
         for listener in self._listeners.get(path, []):
             listener(value)
@@ -210,13 +234,14 @@ class SharedPreferences(metaclass=_PreferenceInstanceCreator):
         :return:
         """
         *dicts, key = path.split(SharedPreferences.PATH_SEP)
-        ref_dict = self.data
-        for d in dicts:
-            if d not in ref_dict:
-                ref_dict[d] = {}
-            ref_dict = ref_dict[d]
-        ref_dict[key] = ref_dict.get(key)
-        self.data.sync()
+        with self._store.mutex:
+            ref_dict = self.data
+            for d in dicts:
+                if d not in ref_dict:
+                    ref_dict[d] = {}
+                ref_dict = ref_dict[d]
+            ref_dict[key] = ref_dict.get(key)
+        self.sync(path)
 
     def set_default(self, path, value):
         """
@@ -228,7 +253,6 @@ class SharedPreferences(metaclass=_PreferenceInstanceCreator):
         """
         if not self.exists(path):
             self.set(path, value)
-            self.data.sync()
 
     def append(self, path, *values):
         """
@@ -251,7 +275,9 @@ class SharedPreferences(metaclass=_PreferenceInstanceCreator):
         *dicts, prop = path.split(SharedPreferences.PATH_SEP)
         ref_dict = self.get_dict(dicts)
         if prop in ref_dict:
-            del ref_dict[prop]
+            with self._store.mutex:
+                del ref_dict[prop]
+            self.sync(path)
         else:
             raise ValueError("No such value {}".format(prop))
 
@@ -302,7 +328,8 @@ class SharedPreferences(metaclass=_PreferenceInstanceCreator):
         if not self.exists(path):
             self.set(path, defaults)
             return
-        self._deep_update(self.get(path), defaults)
+        with self._store.mutex:
+            self._deep_update(self.get(path), defaults)
 
 
 class Component:
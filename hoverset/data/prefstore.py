@@ -0,0 +1,214 @@
+"""
+Persistent storage backend for :py:class:`hoverset.data.preferences.SharedPreferences`.
+Preferences are held in memory as a tree of dictionaries whose top level keys
+form sections. Each section is stored as a separate row of an SQLite database
+so only the sections that actually changed are written. Writes are batched and
+delayed so a burst of changes results in a single atomic transaction.
+"""
+
+# ======================================================================= #
+# Copyright (C) 2024 Hoverset Group.                                      #
+# ======================================================================= #
+
+import logging
+import os
+import pickle
+import sqlite3
+import threading
+
+try:
+    import fcntl
+except ImportError:
+    # windows
+    fcntl = None
+    import msvcrt
+
+logger = logging.getLogger(__name__)
+
+EXTENSION = ".sqlite"
+
+
+class StoreLockedError(OSError):
+    """
+    Raised when the store is already open in another process
+    """
+
+
+def _lock(path):
+    file = open(path, "a+")
+    try:
+        if fcntl is not None:
+            fcntl.flock(file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:
+            msvcrt.locking(file.fileno(), msvcrt.LK_NBLCK, 1)
+    except OSError:
+        file.close()
+        raise StoreLockedError(f"{path} is locked by another process") from None
+    return file
+
+
+def _unlock(file):
+    try:
+        if fcntl is not None:
+            fcntl.flock(file.fileno(), fcntl.LOCK_UN)
+        else:
+            file.seek(0)
+            msvcrt.locking(file.fileno(), msvcrt.LK_UNLCK, 1)
+    finally:
+        file.close()
+
+
+def _connect(path, read_only=False):
+    if read_only:
+        return sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+    connection = sqlite3.connect(path, check_same_thread=False)
+    connection.execute("CREATE TABLE IF NOT EXISTS sections (name TEXT PRIMARY KEY, value BLOB)")
+    return connection
+
+
+def read_section(path, section):
+    """
+    Read a single section from a store without opening or locking it.
+    Useful for reading preferences before the store is opened
+
+    :param path: path of the store without extension
+    :param section: name of the section
+    :return: section value or ``None`` if not found
+    """
+    if not os.path.exists(path + EXTENSION):
+        return None
+    connection = _connect(path + EXTENSION, read_only=True)
+    try:
+        row = connection.execute("SELECT value FROM sections WHERE name = ?", (section,)).fetchone()
+    finally:
+        connection.close()
+    return pickle.loads(row[0]) if row else None
+
+
+class PreferenceStore:
+    """
+    Preference tree backed by an SQLite database. The store holds an
+    exclusive lock so only one process can have it open at a time.
+    Sections are marked with :py:meth:`touch` when they are modified, or
+    may have been modified in place, and are written after :py:attr:`delay`
+    seconds. Touched sections whose content turns out unchanged are skipped.
+    """
+
+    # delay in seconds between a change and the write
+    DELAY = 1.0
+
+    def __init__(self, path, delay=DELAY):
+        """
+        :param path: path of the store without extension
+        :param delay: seconds to wait for more changes before writing
+        """
+        self.path = path
+        self.delay = delay
+        self.data = {}
+        self.writes = 0
+        self._written = {}
+        self._dirty = set()
+        self._timer = None
+        self._mutex = threading.RLock()
+        self._lock_file = _lock(path + ".lock")
+        try:
+            self._connection = _connect(path + EXTENSION)
+        except sqlite3.Error:
+            _unlock(self._lock_file)
+            raise
+        self._load()
+
+    @property
+    def mutex(self):
+        """
+        Lock to be held while modifying the preference tree
+        """
+        return self._mutex
+
+    @property
+    def exists(self):
+        """
+        ``True`` if the store contained any data when opened
+        """
+        return bool(self._written)
+
+    def _load(self):
+        for name, value in self._connection.execute("SELECT name, value FROM sections"):
+            try:
+                self.data[name] = pickle.loads(value)
+                self._written[name] = value
+            except Exception:
+                # a corrupted section is dropped and later restored from defaults
+                logger.error("Preference section %s is corrupted and has been reset", name)
+
+    def touch(self, section=None):
+        """
+        Mark a section as modified and schedule a write
+
+        :param section: top level key of the section, ``None`` to mark all sections
+        """
+        with self._mutex:
+            if section is None:
+                self._dirty.update(self.data)
+                self._dirty.update(self._written)
+            else:
+                self._dirty.add(section)
+            if self._timer is None and self._connection is not None:
+                self._timer = threading.Timer(self.delay, self._scheduled_flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def _scheduled_flush(self):
+        with self._mutex:
+            self._timer = None
+            try:
+                self.flush()
+            except RuntimeError:
+                # the tree was modified in place while being serialized, try again later
+                self.touch()
+
+    def flush(self):
+        """
+        Write all modified sections in a single transaction
+        """
+        with self._mutex:
+            if self._connection is None or not self._dirty:
+                return
+            changed, removed = {}, []
+            for name in self._dirty:
+                if name not in self.data:
+                    if name in self._written:
+                        removed.append(name)
+                    continue
+                value = pickle.dumps(self.data[name], pickle.HIGHEST_PROTOCOL)
+                if self._written.get(name) != value:
+                    changed[name] = value
+            self._dirty.clear()
+            if not changed and not removed:
+                return
+            with self._connection:
+                self._connection.executemany(
+                    "INSERT OR REPLACE INTO sections (name, value) VALUES (?, ?)", changed.items()
+                )
+                self._connection.executemany("DELETE FROM sections WHERE name = ?", ((n,) for n in removed))
+            self._written.update(changed)
+            for name in removed:
+                self._written.pop(name)
+            self.writes += 1
+
+    def close(self):
+        """
+        Write pending changes and release the store
+        """
+        with self._mutex:
+            if self._connection is None:
+                return
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            try:
+                self.flush()
+            finally:
+                self._connection.close()
+                self._connection = None
+                _unlock(self._lock_file)
@@ -0,0 +1,105 @@
+# ======================================================================= #
+# Copyright (C) 2024 Hoverset Group.                                      #
+# ======================================================================= #
+"""
+Incremental indexes for fast case-insensitive substring search
+"""
+from collections import defaultdict
+
+
+class SearchIndex:
+    """
+    Incremental index mapping keys to one or more searchable terms. Every
+    substring of up to :py:attr:`GRAM` characters of each term is indexed
+    so short queries are answered with a single lookup while longer queries
+    only need to verify the keys sharing all their grams with the query.
+    Keys can be any hashable object and are added, updated and removed
+    individually so the index never has to be rebuilt.
+    """
+
+    GRAM = 3
+
+    def __init__(self):
+        self._terms = {}
+        self._grams = defaultdict(set)
+
+    def _grams_of(self, term):
+        grams = set()
+        for size in range(1, self.GRAM + 1):
+            for i in range(len(term) - size + 1):
+                grams.add(term[i:i + size])
+        return grams
+
+    def add(self, key, *terms):
+        """
+        Index ``key`` under the given terms replacing any terms the key
+        was previously indexed under
+
+        :param key: hashable object returned in search results
+        :param terms: strings the key should be searchable by
+        """
+        terms = tuple(str(t).lower() for t in terms if t)
+        if self._terms.get(key) == terms:
+            return
+        if key in self._terms:
+            self.remove(key)
+        self._terms[key] = terms
+        for term in terms:
+            for gram in self._grams_of(term):
+                self._grams[gram].add(key)
+
+    update = add
+
+    def remove(self, key):
+        """
+        Remove ``key`` from the index. Does nothing if key is not indexed
+
+        :param key: key to be removed
+        """
+        terms = self._terms.pop(key, None)
+        if not terms:
+            return
+        for term in terms:
+            for gram in self._grams_of(term):
+                keys = self._grams.get(gram)
+                if keys is None:
+                    continue
+                keys.discard(key)
+                if not keys:
+                    self._grams.pop(gram)
+
+    def clear(self):
+        self._terms.clear()
+        self._grams.clear()
+
+    def keys(self):
+        return self._terms.keys()
+
+    def search(self, query):
+        """
+        Get all keys with at least one term containing ``query``
+
+        :param query: string to search for. An empty query matches all keys
+        :return: set of matching keys
+        """
+        query = query.lower()
+        if not query:
+            return set(self._terms)
+        if len(query) <= self.GRAM:
+            return set(self._grams.get(query, ()))
+        candidates = sorted(
+            (self._grams.get(query[i:i + self.GRAM], ()) for i in range(len(query) - self.GRAM + 1)),
+            key=len
+        )
+        matches = set(candidates[0])
+        for keys in candidates[1:]:
+            if not matches:
+                break
+            matches &= keys
+        return {k for k in matches if any(query in term for term in self._terms[k])}
+
+    def __contains__(self, key):
+        return key in self._terms
+
+    def __len__(self):
+        return len(self._terms)
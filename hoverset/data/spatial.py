@@ -0,0 +1,212 @@
+# ======================================================================= #
+# Copyright (C) 2024 Hoverset Group.                                      #
+# ======================================================================= #
+"""
+Incremental index for fast lookup of rectangles by position
+"""
+from collections import defaultdict
+
+
+def _normalize(bbox):
+    x1, y1, x2, y2 = bbox
+    return min(x1, x2), min(y1, y2), max(x1, x2), max(y1, y2)
+
+
+class SpatialIndex:
+    """
+    Incremental index mapping keys to bounding boxes. Space is divided into
+    square cells of :py:attr:`CELL` units and each key is recorded in every
+    cell its bounding box touches so point and region queries only check
+    keys sharing a cell with the query. Keys spanning more than
+    :py:attr:`MAX_CELLS` cells are kept aside and checked directly to keep
+    updates of very large boxes cheap. Keys can be any hashable object.
+    """
+
+    CELL = 64
+    MAX_CELLS = 256
+
+    def __init__(self, cell=None):
+        """
+        :param cell: size of a cell, defaults to :py:attr:`CELL`
+        """
+        self.cell = cell or self.CELL
+        self._boxes = {}
+        self._spans = {}
+        self._cells = defaultdict(set)
+        self._large = set()
+
+    def _span(self, bbox):
+        cell = self.cell
+        return (
+            int(bbox[0] // cell), int(bbox[1] // cell),
+            int(bbox[2] // cell), int(bbox[3] // cell)
+        )
+
+    @staticmethod
+    def _span_size(span):
+        return (span[2] - span[0] + 1) * (span[3] - span[1] + 1)
+
+    @staticmethod
+    def _cells_of(span):
+        for cx in range(span[0], span[2] + 1):
+            for cy in range(span[1], span[3] + 1):
+                yield cx, cy
+
+    def add(self, key, bbox):
+        """
+        Index ``key`` under ``bbox`` replacing any box the key was
+        previously indexed under
+
+        :param key: hashable object returned in query results
+        :param bbox: tuple ``(x1, y1, x2, y2)``. If ``None`` the key is
+            removed from the index
+        """
+        if bbox is None:
+            self.remove(key)
+            return
+        bbox = _normalize(bbox)
+        span = self._span(bbox)
+        old_span = self._spans.get(key)
+        self._boxes[key] = bbox
+        if old_span == span:
+            # still touches the same cells
+            return
+        if old_span is not None:
+            self._unlink(key, old_span)
+        self._spans[key] = span
+        if self._span_size(span) > self.MAX_CELLS:
+            self._large.add(key)
+            return
+        for cell in self._cells_of(span):
+            self._cells[cell].add(key)
+
+    update = add
+
+    def _unlink(self, key, span):
+        if key in self._large:
+            self._large.discard(key)
+            return
+        for cell in self._cells_of(span):
+            keys = self._cells.get(cell)
+            if keys is None:
+                continue
+            keys.discard(key)
+            if not keys:
+                self._cells.pop(cell)
+
+    def remove(self, key):
+        """
+        Remove ``key`` from the index. Does nothing if key is not indexed
+
+        :param key: key to be removed
+        """
+        span = self._spans.pop(key, None)
+        if span is None:
+            return
+        self._boxes.pop(key)
+        self._unlink(key, span)
+
+    def move(self, keys, delta_x, delta_y):
+        """
+        Shift the boxes of several keys by the same amount. Keys that are
+        not indexed are ignored
+
+        :param keys: iterable of keys to be moved
+        :param delta_x: horizontal displacement
+        :param delta_y: vertical displacement
+        """
+        for key in keys:
+            bbox = self._boxes.get(key)
+            if bbox is None:
+                continue
+            self.add(key, (bbox[0] + delta_x, bbox[1] + delta_y, bbox[2] + delta_x, bbox[3] + delta_y))
+
+    def clear(self):
+        self._boxes.clear()
+        self._spans.clear()
+        self._cells.clear()
+        self._large.clear()
+
+    def keys(self):
+        return self._boxes.keys()
+
+    def bbox(self, key):
+        """
+        Get the box ``key`` is indexed under or ``None`` if not indexed
+        """
+        return self._boxes.get(key)
+
+    def bounds(self, keys=None):
+        """
+        Get the smallest box containing the boxes of ``keys``
+
+        :param keys: iterable of keys, defaults to all indexed keys
+        :return: tuple ``(x1, y1, x2, y2)`` or ``None`` if none of the keys
+            is indexed
+        """
+        keys = self._boxes if keys is None else keys
+        boxes = [self._boxes[k] for k in keys if k in self._boxes]
+        if not boxes:
+            return None
+        return (
+            min(b[0] for b in boxes), min(b[1] for b in boxes),
+            max(b[2] for b in boxes), max(b[3] for b in boxes)
+        )
+
+    def _candidates(self, bbox):
+        span = self._span(bbox)
+        found = set(self._large)
+        if self._span_size(span) > len(self._cells):
+            # the query covers more cells than are occupied
+            for (cx, cy), keys in self._cells.items():
+                if span[0] <= cx <= span[2] and span[1] <= cy <= span[3]:
+                    found |= keys
+            return found
+        for cell in self._cells_of(span):
+            keys = self._cells.get(cell)
+            if keys:
+                found |= keys
+        return found
+
+    def at(self, x, y, halo=0):
+        """
+        Get all keys whose box contains the point ``(x, y)``
+
+        :param x: x coordinate
+        :param y: y coordinate
+        :param halo: distance by which boxes are grown before testing
+        :return: set of matching keys
+        """
+        return self.overlapping(x - halo, y - halo, x + halo, y + halo)
+
+    def overlapping(self, x1, y1, x2, y2):
+        """
+        Get all keys whose box overlaps or touches a region
+
+        :return: set of matching keys
+        """
+        x1, y1, x2, y2 = _normalize((x1, y1, x2, y2))
+        boxes = self._boxes
+        return {
+            k for k in self._candidates((x1, y1, x2, y2))
+            if boxes[k][0] <= x2 and boxes[k][2] >= x1 and boxes[k][1] <= y2 and boxes[k][3] >= y1
+        }
+
+    def enclosed(self, x1, y1, x2, y2):
+        """
+        Get all keys whose box lies completely within a region
+
+        :return: set of matching keys
+        """
+        x1, y1, x2, y2 = _normalize((x1, y1, x2, y2))
+        boxes = self._boxes
+        return {
+            k for k in self._candidates((x1, y1, x2, y2))
+            if boxes[k][0] >= x1 and boxes[k][2] <= x2 and boxes[k][1] >= y1 and boxes[k][3] <= y2
+        }
+
+    def __contains__(self, key):
+        return key in self._boxes
+
+    def __len__(self):
+        return len(self._boxes)
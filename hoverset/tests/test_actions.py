@@ -0,0 +1,105 @@
+import types
+import unittest
+
+from hoverset.data import actions
+from hoverset.data.actions import Routine
+from hoverset.data.keymap import Key, BlankKey, ShortcutManager
+
+
+class ActionsTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.ctrl_a = Key("Ctrl+A", 1001, 1002)
+        self.ctrl_b = Key("Ctrl+B", 1001, 1003)
+        self.first = Routine(lambda: "first", "TEST_FIRST", "First", "test", self.ctrl_a)
+        self.second = Routine(lambda: "second", "TEST_SECOND", "Second", "test", self.ctrl_b)
+        actions.add(self.first, self.second)
+
+    def tearDown(self):
+        actions.remove(self.first, self.second)
+
+    def test_lookup(self):
+        self.assertIs(actions.routine_from_shortcut(Key("Ctrl+A", 1002, 1001)), self.first)
+        self.assertIs(actions.routine_from_shortcut(self.ctrl_b), self.second)
+        self.assertIsNone(actions.routine_from_shortcut(Key("Ctrl+C", 1001, 1004)))
+        self.assertIsNone(actions.routine_from_shortcut(BlankKey))
+        self.assertIsNone(actions.routine_from_shortcut(None))
+
+    def test_rebind(self):
+        ctrl_c = Key("Ctrl+C", 1001, 1004)
+        self.first.shortcut = ctrl_c
+        self.assertIs(actions.routine_from_shortcut(ctrl_c), self.first)
+        self.assertIsNone(actions.routine_from_shortcut(self.ctrl_a))
+        self.first.shortcut = BlankKey
+        self.assertIsNone(actions.routine_from_shortcut(ctrl_c))
+
+    def test_remove(self):
+        actions.remove(self.first)
+        self.assertIsNone(actions.get_routine("TEST_FIRST"))
+        self.assertIsNone(actions.routine_from_shortcut(self.ctrl_a))
+        # shortcut changes of removed routines are not indexed
+        self.first.shortcut = self.ctrl_a
+        self.assertIsNone(actions.routine_from_shortcut(self.ctrl_a))
+        self.assertIs(actions.routine_from_shortcut(self.ctrl_b), self.second)
+
+    def test_replace(self):
+        replacement = Routine(lambda: "replacement", "TEST_FIRST", "First", "test", self.ctrl_b)
+        actions.add(replacement)
+        self.assertIs(actions.get_routine("TEST_FIRST"), replacement)
+        self.assertIsNone(actions.routine_from_shortcut(self.ctrl_a))
+        self.assertIs(actions.routine_from_shortcut(self.ctrl_b), replacement)
+        self.assertEqual(actions.routine_from_shortcut(self.ctrl_b).invoke(), "replacement")
+        actions.remove(replacement)
+
+
+
+class _Preferences:
+
+    def __init__(self, hotkeys):
+        self.data = {"allow_hotkeys": True, "hotkeys": hotkeys}
+
+    def set_default(self, path, value):
+        self.data.setdefault(path, value)
+
+    def get(self, path):
+        return self.data[path]
+
+    def add_listener(self, path, callback):
+        pass
+
+
+def _event(keysym, keycode):
+    return types.SimpleNamespace(state=0, keysym=keysym, keycode=keycode)
+
+
+class ShortcutManagerTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.calls = []
+        self.bound = Routine(lambda: self.calls.append("bound"), "TEST_BOUND", "Bound", "test", Key("F1", 1101))
+        # registered globally but bound to another keymap
+        self.local = Routine(lambda: self.calls.append("local"), "TEST_LOCAL", "Local", "test", Key("Delete", 1102))
+        actions.add(self.bound, self.local)
+        self.manager = ShortcutManager(object(), _Preferences({"TEST_BOUND": Key("F1", 1101)}))
+
+    def tearDown(self):
+        actions.remove(self.bound, self.local)
+        ShortcutManager.instances.remove(self.manager)
+
+    def test_dispatch_bound(self):
+        self.manager._dispatch(_event("F1", 1101))
+        self.assertEqual(self.calls, ["bound"])
+
+    def test_dispatch_unbound(self):
+        self.manager._dispatch(_event("Delete", 1102))
+        self.assertEqual(self.calls, [])
+
+    def test_hotkeys_disabled(self):
+        self.manager._allow_hotkeys = False
+        self.manager._dispatch(_event("F1", 1101))
+        self.assertEqual(self.calls, [])
+
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+import io
+import os
+import tempfile
+import unittest
+
+from PIL import Image
+
+from hoverset.data.atlas import IconAtlas, build_atlas
+
+
+def _png(size, color):
+    data = io.BytesIO()
+    Image.new("RGBA", size, color).save(data, format="PNG")
+    return data.getvalue()
+
+
+class IconAtlasTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.dir.name, "image.atlas")
+        build_atlas(self.path, {
+            "add": _png((50, 50), (255, 0, 0, 255)),
+            "_logo": _png((40, 20), (0, 255, 0, 255)),
+            "default": _png((30, 30), (0, 0, 255, 255)),
+        })
+        self.atlas = IconAtlas(self.path)
+
+    def tearDown(self):
+        self.atlas = None
+        self.dir.cleanup()
+
+    def test_is_atlas(self):
+        self.assertTrue(IconAtlas.is_atlas(self.path))
+        other = os.path.join(self.dir.name, "other")
+        with open(other, "wb") as file:
+            file.write(b"not an atlas")
+        self.assertFalse(IconAtlas.is_atlas(other))
+        self.assertFalse(IconAtlas.is_atlas(os.path.join(self.dir.name, "missing")))
+        with self.assertRaises(ValueError):
+            IconAtlas(other)
+
+    def test_names(self):
+        self.assertEqual(set(self.atlas.names()), {"add", "_logo", "default"})
+        self.assertIn("add", self.atlas)
+        self.assertNotIn("remove", self.atlas)
+
+    def test_prerendered(self):
+        image = self.atlas.get_image("add", 18, 18)
+        self.assertEqual(image.size, (18, 18))
+        self.assertEqual(image.mode, "RGBA")
+        self.assertEqual(image.getpixel((9, 9)), (255, 0, 0, 255))
+
+    def test_other_size(self):
+        image = self.atlas.get_image("add", 32, 32)
+        self.assertEqual(image.size, (32, 32))
+        self.assertEqual(image.convert("RGBA").getpixel((0, 0)), (255, 0, 0, 255))
+
+    def test_underscore_names_resized(self):
+        # the prefix only exempts icons from recoloring
+        image = self.atlas.get_image("_logo", 18, 18)
+        self.assertEqual(image.size, (18, 9))
+        self.assertEqual(image.getpixel((9, 4)), (0, 255, 0, 255))
+        self.assertEqual(self.atlas.get_image("_logo", 32, 32).size, (32, 16))
+
+    def test_bytes(self):
+        image = Image.open(io.BytesIO(self.atlas.get_bytes("default")))
+        self.assertEqual(image.size, (30, 30))
+
+
+if __name__ == '__main__':
+    unittest.main()
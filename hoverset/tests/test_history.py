@@ -0,0 +1,80 @@
+import unittest
+from hoverset.util.execution import Action
+from hoverset.util.history import History, estimate_size
+
+
+class HistoryTestCase(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.log = []
+        self.released = []
+
+    def action(self, name, payload=None, **kwargs):
+        payload = payload or []
+        return Action(
+            lambda _: self.log.append(("undo", name, len(payload))),
+            lambda _: self.log.append(("redo", name, len(payload))),
+            release_undo=lambda _: self.released.append(("undo", name)),
+            release_redo=lambda _: self.released.append(("redo", name)),
+            **kwargs
+        )
+
+    def test_undo_redo(self):
+        history = History()
+        history.push(self.action("a"))
+        history.push(self.action("b"))
+        history.undo()
+        history.undo()
+        self.assertIsNone(history.undo())
+        history.redo()
+        self.assertEqual(
+            [i[:2] for i in self.log], [("undo", "b"), ("undo", "a"), ("redo", "a")]
+        )
+        self.assertTrue(history.has_redo())
+        # new actions discard and release the redo stack
+        history.push(self.action("c"))
+        self.assertFalse(history.has_redo())
+        self.assertEqual(self.released, [("redo", "b")])
+
+    def test_depth_limit(self):
+        history = History(max_depth=2)
+        for name in "abc":
+            history.push(self.action(name))
+        self.assertEqual(len(history), 2)
+        self.assertEqual(self.released, [("undo", "a")])
+
+    def test_size_limit(self):
+        big = list(range(10000))
+        history = History(max_size=estimate_size(big))
+        history.push(self.action("a", big))
+        history.push(self.action("b", list(big)))
+        # the most recent action is kept even if it exceeds the budget
+        self.assertEqual(len(history), 1)
+        self.assertEqual(self.released, [("undo", "a")])
+        self.assertLessEqual(history.size, 2 * estimate_size(big))
+
+    def test_extra_size(self):
+        history = History()
+        history.push(self.action("a"))
+        size = history.size
+        history.push(self.action("b", size=10000))
+        self.assertGreater(history.size - size, 10000)
+        history.pop_last()
+        self.assertEqual(history.size, size)
+
+    def test_pop_last(self):
+        history = History()
+        history.push(self.action("a", key="key"))
+        history.pop_last("other")
+        self.assertEqual(len(history), 1)
+        history.pop_last("key")
+        self.assertEqual(len(history), 0)
+        self.assertEqual(history.size, 0)
+
+    def test_estimate_size_shared(self):
+        data = list(range(1000))
+        self.assertLess(estimate_size([data, data]), 2 * estimate_size(data))
+
+
+if __name__ == '__main__':
+    unittest.main()
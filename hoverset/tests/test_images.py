@@ -0,0 +1,107 @@
+import gc
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from PIL import Image
+
+from hoverset.data import images
+from hoverset.data.images import _recolor, ImageCache, image_cache, load_image_cached, to_tk_image_cached
+
+
+class RecolorTestCase(unittest.TestCase):
+
+    def test_recolor(self):
+        image = Image.new("RGBA", (4, 4), (0, 0, 0, 0))
+        image.putpixel((1, 1), (10, 20, 30, 40))
+        image.putpixel((2, 3), (10, 20, 30, 255))
+        image = _recolor(image, (61, 138, 255))
+        self.assertEqual(image.getpixel((1, 1)), (61, 138, 255, 255))
+        self.assertEqual(image.getpixel((2, 3)), (61, 138, 255, 255))
+        # transparent pixels are untouched
+        self.assertEqual(image.getpixel((0, 0)), (0, 0, 0, 0))
+
+    def test_recolor_hex(self):
+        image = _recolor(Image.new("RGBA", (2, 2), (1, 1, 1, 1)), "#ff0000")
+        self.assertEqual(image.getpixel((1, 1)), (255, 0, 0, 255))
+
+
+class ImageCacheTestCase(unittest.TestCase):
+
+    def test_hits_and_misses(self):
+        cache = ImageCache()
+        self.assertIsNone(cache.get("a"))
+        image = Image.new("RGBA", (2, 2))
+        self.assertIs(cache.get_or_create("a", lambda: image), image)
+        self.assertIs(cache.get("a"), image)
+        self.assertEqual(cache.stats(), {"hits": 1, "misses": 2, "items": 1, "size": 16})
+
+    def test_size_bounded_lru(self):
+        # room for exactly two 4x4 RGBA images
+        cache = ImageCache(max_size=128)
+        cache.put("a", Image.new("RGBA", (4, 4)))
+        cache.put("b", Image.new("RGBA", (4, 4)))
+        cache.get("a")
+        cache.put("c", Image.new("RGBA", (4, 4)))
+        self.assertIn("a", cache)
+        self.assertNotIn("b", cache)
+        self.assertIn("c", cache)
+        self.assertEqual(cache.size, 128)
+        # an image larger than the cache is still kept as the most recent
+        cache.put("d", Image.new("RGBA", (10, 10)))
+        self.assertEqual(len(cache), 1)
+        self.assertIn("d", cache)
+
+    def test_load_image_cached(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "image.png")
+            Image.new("RGB", (20, 20), (255, 0, 0)).save(path)
+            first = load_image_cached(path)
+            self.assertIs(load_image_cached(path), first)
+            small = load_image_cached(path, width=10, height=10)
+            self.assertEqual(small.size, (10, 10))
+            self.assertIs(load_image_cached(path, width=10, height=10), small)
+            # modifying the file invalidates the cached image
+            Image.new("RGB", (30, 30), (0, 255, 0)).save(path)
+            stat = os.stat(path)
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+            self.assertEqual(load_image_cached(path).size, (30, 30))
+        image_cache.clear()
+
+class _PhotoImage:
+    # creating real tk images requires a display
+
+    def __init__(self, image):
+        self.image = image
+
+
+class TkImageCacheTestCase(unittest.TestCase):
+
+    def setUp(self):
+        patcher = mock.patch.object(images.ImageTk, "PhotoImage", _PhotoImage)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_shared_while_referenced(self):
+        image = Image.new("RGBA", (4, 4), (1, 2, 3, 4))
+        tk_image = to_tk_image_cached(image)
+        self.assertIs(to_tk_image_cached(image), tk_image)
+        # identical content maps to the same tk image
+        self.assertIs(to_tk_image_cached(image.copy()), tk_image)
+        self.assertIsNot(to_tk_image_cached(Image.new("RGBA", (4, 4))), tk_image)
+
+    def test_not_evicted(self):
+        image = Image.new("RGBA", (4, 4), (5, 6, 7, 8))
+        tk_image = to_tk_image_cached(image)
+        # tk images never enter the evicting cache
+        self.assertNotIn(("tk", images._get_image_key(image)), image_cache)
+        image_cache.clear()
+        self.assertIs(to_tk_image_cached(image), tk_image)
+        del tk_image
+        gc.collect()
+        self.assertNotIn(images._get_image_key(image), images._tk_images)
+
+
+if __name__ == '__main__':
+    unittest.main()
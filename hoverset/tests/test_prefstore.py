@@ -0,0 +1,82 @@
+import os
+import sqlite3
+import tempfile
+import time
+import unittest
+
+from hoverset.data.prefstore import PreferenceStore, StoreLockedError, read_section
+
+
+class PreferenceStoreTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.dir.name, "config")
+        self.store = PreferenceStore(self.path, delay=0.05)
+
+    def tearDown(self):
+        self.store.close()
+        self.dir.cleanup()
+
+    def reopen(self):
+        self.store.close()
+        self.store = PreferenceStore(self.path, delay=0.05)
+
+    def test_persist(self):
+        self.assertFalse(self.store.exists)
+        self.store.data["studio"] = {"theme": "dark", "recent": ["a"]}
+        self.store.touch("studio")
+        self.reopen()
+        self.assertTrue(self.store.exists)
+        self.assertEqual(self.store.data, {"studio": {"theme": "dark", "recent": ["a"]}})
+
+    def test_batched_write(self):
+        self.store.data.update(studio={"x": 1}, features={"y": 2})
+        for i in range(50):
+            self.store.data["studio"]["x"] = i
+            self.store.touch("studio")
+        self.store.touch("features")
+        self.store.flush()
+        self.assertEqual(self.store.writes, 1)
+        # unchanged sections are not written again
+        self.store.touch()
+        self.store.flush()
+        self.assertEqual(self.store.writes, 1)
+
+    def test_delayed_write(self):
+        self.store.data["studio"] = {"x": 1}
+        self.store.touch("studio")
+        self.assertIsNone(read_section(self.path, "studio"))
+        deadline = time.time() + 5
+        while self.store.writes == 0 and time.time() < deadline:
+            time.sleep(0.02)
+        self.assertEqual(read_section(self.path, "studio"), {"x": 1})
+
+    def test_remove_section(self):
+        self.store.data.update(studio={"x": 1}, features={"y": 2})
+        self.store.touch()
+        self.store.flush()
+        del self.store.data["features"]
+        self.store.touch("features")
+        self.reopen()
+        self.assertEqual(self.store.data, {"studio": {"x": 1}})
+
+    def test_corrupted_section(self):
+        self.store.data.update(studio={"x": 1}, features={"y": 2})
+        self.store.touch()
+        self.store.close()
+        connection = sqlite3.connect(self.path + ".sqlite")
+        with connection:
+            connection.execute("UPDATE sections SET value = ? WHERE name = 'features'", (b"garbage",))
+        connection.close()
+        with self.assertLogs("hoverset.data.prefstore", "ERROR"):
+            self.store = PreferenceStore(self.path)
+        self.assertEqual(self.store.data, {"studio": {"x": 1}})
+
+    def test_locked(self):
+        with self.assertRaises(StoreLockedError):
+            PreferenceStore(self.path)
+
+
+if __name__ == '__main__':
+    unittest.main()
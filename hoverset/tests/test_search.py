@@ -0,0 +1,44 @@
+import unittest
+from hoverset.data.search import SearchIndex
+
+
+class SearchIndexTestCase(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.index = SearchIndex()
+        self.index.add(1, "button1", "Button")
+        self.index.add(2, "label1", "Label")
+        self.index.add(3, "frame1", "Frame")
+
+    def test_short_query(self):
+        self.assertEqual(self.index.search("b"), {1, 2})
+        self.assertEqual(self.index.search("1"), {1, 2, 3})
+        self.assertEqual(self.index.search("RAM"), {3})
+
+    def test_long_query(self):
+        self.assertEqual(self.index.search("button"), {1})
+        self.assertEqual(self.index.search("abel1"), {2})
+        self.assertEqual(self.index.search("buttons"), set())
+        # shares all grams with "label1" but is not a substring
+        self.assertEqual(self.index.search("belabel"), set())
+
+    def test_empty_query(self):
+        self.assertEqual(self.index.search(""), {1, 2, 3})
+
+    def test_update(self):
+        self.index.update(1, "submit", "Button")
+        self.assertEqual(self.index.search("button1"), set())
+        self.assertEqual(self.index.search("submit"), {1})
+        self.assertEqual(self.index.search("butt"), {1})
+
+    def test_remove(self):
+        self.index.remove(2)
+        self.assertNotIn(2, self.index)
+        self.assertEqual(self.index.search("1"), {1, 3})
+        self.assertEqual(len(self.index), 2)
+        # removing a key that is not indexed is harmless
+        self.index.remove(2)
+
+
+if __name__ == '__main__':
+    unittest.main()
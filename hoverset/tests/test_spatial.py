@@ -0,0 +1,76 @@
+import unittest
+from hoverset.data.spatial import SpatialIndex
+
+
+class SpatialIndexTestCase(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.index = SpatialIndex(cell=10)
+        self.index.add(1, (0, 0, 5, 5))
+        self.index.add(2, (20, 20, 40, 30))
+        # given in reverse order
+        self.index.add(3, (45, 35, 25, 25))
+
+    def test_at(self):
+        self.assertEqual(self.index.at(2, 2), {1})
+        self.assertEqual(self.index.at(30, 28), {2, 3})
+        self.assertEqual(self.index.at(100, 100), set())
+        self.assertEqual(self.index.at(7, 7), set())
+        self.assertEqual(self.index.at(7, 7, halo=2), {1})
+
+    def test_overlapping(self):
+        self.assertEqual(self.index.overlapping(0, 0, 20, 20), {1, 2})
+        self.assertEqual(self.index.overlapping(42, 32, 50, 50), {3})
+        self.assertEqual(self.index.overlapping(-100, -100, 1000, 1000), {1, 2, 3})
+
+    def test_enclosed(self):
+        self.assertEqual(self.index.enclosed(-1, -1, 41, 31), {1, 2})
+        self.assertEqual(self.index.enclosed(0, 0, 4, 4), set())
+
+    def test_update(self):
+        self.index.update(1, (100, 100, 110, 110))
+        self.assertEqual(self.index.at(2, 2), set())
+        self.assertEqual(self.index.at(105, 105), {1})
+        # within the same cells
+        self.index.update(1, (101, 101, 109, 109))
+        self.assertEqual(self.index.at(100, 100), set())
+        self.assertEqual(self.index.bbox(1), (101, 101, 109, 109))
+
+    def test_move(self):
+        self.index.move([1, 2, 4], 100, 0)
+        self.assertEqual(self.index.bbox(1), (100, 0, 105, 5))
+        self.assertEqual(self.index.at(130, 25), {2})
+        self.assertEqual(self.index.at(30, 28), {3})
+        self.assertNotIn(4, self.index)
+
+    def test_large(self):
+        self.index.add(4, (-1000, -1000, 1000, 1000))
+        self.assertEqual(self.index.at(2, 2), {1, 4})
+        self.index.update(4, (0, 0, 1, 1))
+        self.assertEqual(self.index.at(500, 500), set())
+        self.assertEqual(self.index.at(1, 1), {1, 4})
+
+    def test_bounds(self):
+        self.assertEqual(self.index.bounds([2, 3]), (20, 20, 45, 35))
+        self.assertEqual(self.index.bounds(), (0, 0, 45, 35))
+        self.assertIsNone(self.index.bounds([4]))
+
+    def test_remove(self):
+        self.index.remove(2)
+        self.assertNotIn(2, self.index)
+        self.assertEqual(self.index.at(30, 28), {3})
+        self.assertEqual(len(self.index), 2)
+        # removing with an empty box
+        self.index.add(3, None)
+        self.assertEqual(self.index.at(30, 28), set())
+        # removing a key that is not indexed is harmless
+        self.index.remove(2)
+
+    def test_clear(self):
+        self.index.clear()
+        self.assertEqual(len(self.index), 0)
+        self.assertEqual(self.index.overlapping(0, 0, 100, 100), set())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1255,7 +1255,8 @@ class ScrolledFrame(ContainerMixin, Widget, ScrollableInterface, ContextMenuMixi
         self._canvas.grid(row=0, column=0, sticky='nswe')
         self.columnconfigure(0, weight=1)  # Ensure the _canvas gets the rest of the left horizontal space
         self.rowconfigure(0, weight=1)  # Ensure the _canvas gets the rest of the left vertical space
-        self._canvas.config(yscrollcommand=self._scroll_y.set, xscrollcommand=self._scroll_x.set)  # attach scrollbars
+        self._canvas.config(yscrollcommand=self._on_scroll_y, xscrollcommand=self._scroll_x.set)  # attach scrollbars
+        self._scroll_listeners = []
         self.body = Frame(self._canvas, **cnf)
         self.body.config(self.style.surface)
         self._window = self._canvas.create_window(0, 0, anchor='nw', window=self.body)
@@ -1384,6 +1385,29 @@ class ScrolledFrame(ContainerMixin, Widget, ScrollableInterface, ContextMenuMixi
     def scroll_position(self):
         return self._scroll_y.get()
 
+    def _on_scroll_y(self, first, last):
+        self._scroll_y.set(first, last)
+        for listener in self._scroll_listeners:
+            listener()
+
+    def on_scroll(self, callback):
+        """
+        Register a callback to be invoked whenever the vertical view or
+        the scroll region changes
+
+        :param callback: a callable that takes no arguments
+        """
+        self._scroll_listeners.append(callback)
+
+    def viewport(self):
+        """
+        Get the vertical extent of the region currently visible
+
+        :return: tuple of top and bottom y coordinates relative to the body
+        """
+        top = self._canvas.canvasy(0)
+        return top, top + self._canvas.winfo_height()
+
     def set_scrollbars(self, flag):
         """
         :param flag: set to tkinter.X to enable horizontal scrollbar, tkinter.Y to enable vertical scrollbar,
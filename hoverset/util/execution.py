@@ -17,13 +17,7 @@ import importlib.util
 import pathlib
 from hoverset.platform import platform_is, WINDOWS, MAC
 
-if platform_is(WINDOWS):
-    import ctypes
-    from ctypes import POINTER, c_ulong, c_char_p, c_int, c_void_p
-    from ctypes.wintypes import HANDLE, BOOL, DWORD, HWND, HINSTANCE, HKEY
-    from ctypes import windll
-    import subprocess
-else:
+if not platform_is(WINDOWS):
     try:
         from shlex import quote
     except ImportError:
@@ -72,11 +66,24 @@ class Action:
         Initialize the action object with the undo and redo callbacks
         :param undo: The undo callback
         :param redo: The redo callback
+        :param kwargs: Optional extras
+
+          * **data**: data passed to the undo and redo callbacks
+          * **key**: key used to identify and merge related actions
+          * **release_undo**: called when the action is dropped from history
+            and can no longer be undone
+          * **release_redo**: called when the action is dropped from history
+            and can no longer be redone
+          * **size**: approximate memory in bytes held by the action that is
+            not reachable from its callbacks and data, for instance deleted widgets
         """
         self._undo = undo
         self._redo = redo
         self._data = kwargs.get("data", {})
         self.key = kwargs.get("key", None)
+        self._release_undo = kwargs.get("release_undo")
+        self._release_redo = kwargs.get("release_redo")
+        self.extra_size = kwargs.get("size", 0)
 
     def undo(self):
         self._undo(self._data)
@@ -90,6 +97,14 @@ class Action:
     def update(self, data):
         self._data.update(data)
 
+    def release_undo(self):
+        if self._release_undo:
+            self._release_undo(self._data)
+
+    def release_redo(self):
+        if self._release_redo:
+            self._release_redo(self._data)
+
 
 # Copyright (C) 2018 Barney Gale
 # Core elevation code adapted from https://github.com/barneygale/elevate
@@ -147,6 +162,12 @@ def _elevate_posix():
 
 
 def _elevate_win(args=None):
+    # ctypes is only set up when elevation is actually requested
+    import ctypes
+    import subprocess
+    from ctypes import POINTER, c_ulong, c_char_p, c_int, c_void_p, windll
+    from ctypes.wintypes import HANDLE, BOOL, DWORD, HWND, HINSTANCE, HKEY
+
     if windll.shell32.IsUserAnAdmin() and args is None:
         return
     # Constant definitions
@@ -242,6 +263,7 @@ def is_admin():
     ``False`` is returned
     """
     if platform_is(WINDOWS):
+        from ctypes import windll
         return windll.shell32.IsUserAnAdmin()
     return os.getuid() == 0
 
@@ -0,0 +1,177 @@
+"""
+Memory bounded undo/redo history for :py:class:`hoverset.util.execution.Action`
+"""
+
+# ======================================================================= #
+# Copyright (C) 2024 Hoverset Group.                                      #
+# ======================================================================= #
+
+import sys
+import tkinter
+import types
+from collections import deque
+
+_ATOMIC = (str, bytes, int, float, complex, bool, type(None))
+
+
+def estimate_size(obj):
+    """
+    Estimate the memory in bytes held by an object and everything reachable from
+    it through containers and function closures. Instances of other classes like
+    widgets are shared with the rest of the application and are only counted as
+    references. Objects reachable through multiple paths are counted once.
+
+    :param obj: object to be measured
+    :return: approximate size in bytes
+    """
+    seen = set()
+    stack = [obj]
+    total = 0
+    while stack:
+        item = stack.pop()
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+        if isinstance(item, tkinter.Misc):
+            continue
+        total += sys.getsizeof(item, 64)
+        if isinstance(item, _ATOMIC):
+            continue
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset, deque)):
+            stack.extend(item)
+        elif isinstance(item, types.MethodType):
+            stack.append(item.__func__)
+        elif isinstance(item, types.FunctionType):
+            for cell in item.__closure__ or ():
+                try:
+                    stack.append(cell.cell_contents)
+                except ValueError:
+                    # empty cell
+                    pass
+            stack.extend(item.__defaults__ or ())
+    return total
+
+
+class History:
+    """
+    Undo/redo store that limits the number of actions held as well as the
+    approximate memory they occupy. The oldest actions are evicted first
+    and are given a chance to release resources only they keep alive
+    through :py:meth:`~hoverset.util.execution.Action.release_undo`.
+    Actions discarded from the redo stack are likewise released through
+    :py:meth:`~hoverset.util.execution.Action.release_redo`
+    """
+
+    def __init__(self, max_depth=None, max_size=None):
+        """
+        :param max_depth: maximum number of actions that can be undone, ``None`` for no limit
+        :param max_size: maximum memory in bytes held by all actions, ``None`` for no limit
+        """
+        self.max_depth = max_depth
+        self.max_size = max_size
+        self._undo = deque()
+        self._redo = []
+        self._sizes = {}
+        self._size = 0
+
+    @property
+    def size(self):
+        """
+        Approximate memory in bytes held by all actions in the history
+        """
+        return self._size
+
+    def _track(self, action):
+        size = estimate_size((action._undo, action._redo, action._data)) + action.extra_size
+        self._sizes[id(action)] = size
+        self._size += size
+
+    def _untrack(self, action):
+        self._size -= self._sizes.pop(id(action), 0)
+
+    def _clear_redo(self):
+        while self._redo:
+            action = self._redo.pop()
+            self._untrack(action)
+            action.release_redo()
+
+    def _evict(self):
+        # the most recent action is always kept
+        while len(self._undo) > 1 and (
+                (self.max_depth is not None and len(self._undo) > self.max_depth)
+                or (self.max_size is not None and self._size > self.max_size)):
+            action = self._undo.popleft()
+            self._untrack(action)
+            action.release_undo()
+
+    def push(self, action):
+        """
+        Add a new undo point discarding any actions that could be redone
+
+        :param action: action to be added
+        """
+        self._clear_redo()
+        self._undo.append(action)
+        self._track(action)
+        self._evict()
+
+    def undo(self):
+        """
+        Undo the most recent action
+
+        :return: action undone or ``None`` if there was nothing to undo
+        """
+        if not self._undo:
+            return None
+        action = self._undo.pop()
+        action.undo()
+        self._redo.append(action)
+        return action
+
+    def redo(self):
+        """
+        Redo the most recently undone action
+
+        :return: action redone or ``None`` if there was nothing to redo
+        """
+        if not self._redo:
+            return None
+        action = self._redo.pop()
+        action.redo()
+        self._undo.append(action)
+        return action
+
+    def has_undo(self):
+        return bool(self._undo)
+
+    def has_redo(self):
+        return bool(self._redo)
+
+    def last(self):
+        if self._undo:
+            return self._undo[-1]
+        return None
+
+    def pop_last(self, key=None):
+        """
+        Remove the most recent action without undoing it
+
+        :param key: if provided, the action is only removed if its key matches
+        """
+        last = self.last()
+        if last is None or (key is not None and last.key != key):
+            return
+        self._undo.pop()
+        self._untrack(last)
+
+    def clear(self):
+        self._undo.clear()
+        self._redo.clear()
+        self._sizes.clear()
+        self._size = 0
+
+    def __len__(self):
+        return len(self._undo)
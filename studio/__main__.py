@@ -1,7 +1,14 @@
 import sys
 
 if __name__ == '__main__':
-    if len(sys.argv) > 1:
+    if sys.argv[1:] == ["--profile-startup"]:
+        from studio.profiling import startup_profiler
+        startup_profiler.enable()
+        startup_profiler.import_package("studio.feature")
+        with startup_profiler.measure("import studio.main"):
+            from studio import main
+        main.main()
+    elif len(sys.argv) > 1:
         from studio import cli
         cli.main()
     else:
@@ -1,4 +1,7 @@
+import time
+
 from hoverset.util.execution import Action
+from hoverset.util.history import History
 from hoverset.ui.widgets import Frame, TabView
 from hoverset.ui.icons import get_icon_image as icon
 from hoverset.ui.menu import EnableIf
@@ -13,14 +16,15 @@ class BaseContext(Frame):
         self.tab_view: TabView = master
         self.studio = studio
         self.pref = studio.pref
-        self._undo_stack = []
-        self._redo_stack = []
+        self._history = History()
         self.tab_handle = None
         self.name = "tab"
         self.icon = icon("file", 15, 15)
         self.bind("<<TabDeleted>>", self._close_context)
         self.bind("<<TabToClose>>", self._close_check)
         self._force_close = False
+        # time the context was last selected or deselected
+        self.last_active = time.time()
 
     def _close_context(self, *_):
         self.studio.on_context_close(self)
@@ -79,42 +83,32 @@ class BaseContext(Frame):
         :param action: An action object implementing undo and redo methods
         :return:
         """
-        self._redo_stack.clear()
-        if len(self._undo_stack) >= self.pref.get("studio::undo_depth") and self.pref.get("studio::use_undo_depth"):
-            self._undo_stack.pop(0)
-        self._undo_stack.append(action)
+        # limits are read on every action so preference changes apply immediately
+        if self.pref.get("studio::use_undo_depth"):
+            self._history.max_depth = self.pref.get("studio::undo_depth")
+        else:
+            self._history.max_depth = None
+        # memory limit is set in megabytes, 0 means no limit
+        self._history.max_size = self.pref.get("studio::undo_memory") * 1024 * 1024 or None
+        self._history.push(action)
 
     def undo(self):
-        # Let's avoid popping an empty list to prevent raising IndexError
-        if self._undo_stack:
-            action = self._undo_stack.pop()
-            action.undo()
-            self._redo_stack.append(action)
+        self._history.undo()
 
     def redo(self):
-        if self._redo_stack:
-            action = self._redo_stack.pop()
-            action.redo()
-            self._undo_stack.append(action)
+        self._history.redo()
 
     def has_redo(self) -> bool:
-        return bool(self._redo_stack)
+        return self._history.has_redo()
 
     def has_undo(self) -> bool:
-        return bool(self._undo_stack)
+        return self._history.has_undo()
 
     def last_action(self):
-        if self._undo_stack:
-            return self._undo_stack[-1]
-        return None
+        return self._history.last()
 
     def pop_last_action(self, key=None):
-        last = self.last_action()
-        if last is not None:
-            # verify action key first
-            if key is not None and last.key != key:
-                return
-            self._undo_stack.remove(last)
+        self._history.pop_last(key)
 
     def select(self):
         if self.tab_handle:
@@ -133,6 +127,22 @@ class BaseContext(Frame):
     def can_persist(self):
         return False
 
+    def can_hibernate(self):
+        """
+        Override to return ``True`` if the context is holding resources that
+        can be released through :py:meth:`hibernate`
+        """
+        return False
+
+    def hibernate(self):
+        """
+        Override to release the resources held by an inactive context. The
+        context should restore itself when it is set again.
+
+        :return: ``True`` if the context was hibernated
+        """
+        return False
+
     def on_app_close(self):
         return True
 
@@ -0,0 +1,164 @@
+# ======================================================================= #
+# Copyright (C) 2024 Hoverset Group.                                      #
+# ======================================================================= #
+
+import itertools
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# events that only signal that the current state of a widget should be
+# re-read. Repeated occurrences carry no extra information and can be merged
+COALESCED_EVENTS = frozenset((
+    "<<WidgetModified>>",
+    "<<WidgetLayoutChanged>>",
+    "<<CanvasItemsModified>>",
+    "<<MenuItemModified>>",
+))
+
+
+class EventBatcher:
+    """
+    Collects events pushed by the debugger hook and sends them in batches
+    from a background thread. Events listed in :py:data:`COALESCED_EVENTS`
+    are merged with an identical pending event for the same widget. Any
+    other event acts as a barrier, events pushed after it are never merged
+    with events pushed before it so the ordering seen by the debugger is
+    preserved.
+
+    Pushing never blocks on the connection. While a batch is being sent,
+    new events accumulate and coalesce in the pending buffer so a slow
+    debugger receives fewer, larger batches instead of stalling the
+    application.
+    """
+
+    # seconds to wait for more events before sending a batch
+    WINDOW = 0.03
+    # maximum number of events sent in a single message
+    MAX_BATCH = 500
+
+    def __init__(self, send, window=WINDOW, max_batch=MAX_BATCH):
+        """
+        :param send: callable accepting a list of event payloads, called from
+            the sender thread
+        :param window: seconds to wait for more events before sending
+        :param max_batch: maximum number of events per call to send
+        """
+        self._send = send
+        self.window = window
+        self.max_batch = max_batch
+        self._pending = {}
+        self._barrier = 0
+        self._counter = itertools.count()
+        self._condition = threading.Condition()
+        self._flush_lock = threading.Lock()
+        self._thread = None
+        self._closed = False
+        self.pushed = 0
+        self.coalesced = 0
+        self.batches = 0
+
+    def key(self, event, widget, data=None):
+        """
+        Get the coalescing key of an event
+
+        :param event: event name
+        :param widget: widget or widget path the event relates to
+        :param data: event data as a string
+        :return: a hashable key or ``None`` if the event cannot be coalesced
+        """
+        if event not in COALESCED_EVENTS or widget is None:
+            return None
+        # widget paths are only unique within a single interpreter
+        return self._barrier, event, getattr(widget, "_w", widget), getattr(widget, "tk", None), data
+
+    def __contains__(self, key):
+        return key is not None and key in self._pending
+
+    def merge(self, key):
+        """
+        Merge an event into an identical pending event if one exists. This
+        allows callers to skip building the payload of a redundant event
+
+        :param key: coalescing key as returned by :py:meth:`key`
+        :return: ``True`` if the event was merged
+        """
+        if key is None:
+            return False
+        with self._condition:
+            if key in self._pending:
+                self.pushed += 1
+                self.coalesced += 1
+                return True
+        return False
+
+    def __len__(self):
+        return len(self._pending)
+
+    def push(self, payload, key=None):
+        """
+        Queue an event payload for sending
+
+        :param payload: marshalled event payload
+        :param key: coalescing key as returned by :py:meth:`key`
+        :return: ``False`` if the event was merged with a pending one
+        """
+        with self._condition:
+            self.pushed += 1
+            if key is None:
+                # barrier, later events must not be merged into earlier ones
+                self._barrier += 1
+                key = next(self._counter)
+            elif key in self._pending:
+                self.coalesced += 1
+                return False
+            self._pending[key] = payload
+            self._condition.notify()
+        return True
+
+    def start(self):
+        """
+        Start the sender thread if not already running
+        """
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._pending and not self._closed:
+                    self._condition.wait()
+                if self._closed:
+                    return
+            # allow events to accumulate before sending
+            time.sleep(self.window)
+            self.flush()
+
+    def flush(self):
+        """
+        Send all pending events immediately. A batch that fails to send is
+        logged and dropped so the sender thread keeps running
+        """
+        with self._flush_lock:
+            with self._condition:
+                pending, self._pending = self._pending, {}
+            events = list(pending.values())
+            for i in range(0, len(events), self.max_batch):
+                try:
+                    self._send(events[i: i + self.max_batch])
+                except Exception:
+                    logger.exception("Failed to send a batch of %d events", len(events[i: i + self.max_batch]))
+                    continue
+                self.batches += 1
+
+    def close(self):
+        """
+        Send pending events and stop the sender thread
+        """
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+        self.flush()
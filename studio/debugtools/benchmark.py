@@ -0,0 +1,199 @@
+# ======================================================================= #
+# Copyright (C) 2024 Hoverset Group.                                      #
+# ======================================================================= #
+
+"""
+Benchmarks for the debugger.
+
+``hook`` measures the overhead the debugger hook adds to a widget heavy
+application. The same workload is timed without the hook, with the hook set
+up but no debugger attached and with a debugger attached.
+
+``codec`` compares the message codec against pickling messages, which is
+what :py:class:`multiprocessing.connection.Connection` does by default.
+
+Run with::
+
+    python -m studio.debugtools.benchmark hook --widgets 500
+    python -m studio.debugtools.benchmark codec
+"""
+
+import argparse
+import atexit
+import pickle
+import time
+import tkinter
+from tkinter import ttk
+
+from studio.debugtools.codec import Encoder, Decoder
+from studio.debugtools.defs import Message, WidgetMessage, unmarshal
+from studio.debugtools.hook import DebuggerHook
+
+
+class _NullClient:
+    # stands in for a debugger stream channel, pays the serialization cost only
+
+    def __init__(self):
+        self.encoder = Encoder()
+        self.messages = 0
+        self.frames = 0
+
+    def send(self, *messages):
+        if not messages:
+            return
+        self.encoder.encode(messages)
+        self.messages += len(messages)
+        self.frames += 1
+
+
+def workload(root, count):
+    frame = tkinter.Frame(root)
+    frame.pack(fill="both", expand=True)
+    canvas = tkinter.Canvas(frame, width=200, height=200)
+    canvas.pack(side="top")
+    menu = tkinter.Menu(root, tearoff=False)
+    for i in range(count):
+        button = tkinter.Button(frame, text=str(i))
+        button.pack(side="left")
+        button.configure(text=f"button {i}", relief="flat")
+        label = ttk.Label(frame, text=str(i))
+        label.place(x=i, y=0)
+        label.place_configure(y=10)
+        item = canvas.create_rectangle(i, i, i + 10, i + 10)
+        canvas.itemconfigure(item, fill="red")
+        menu.add_command(label=str(i))
+        menu.entryconfigure(i, label=f"item {i}")
+    root.update_idletasks()
+    canvas.delete("all")
+    frame.destroy()
+    menu.destroy()
+
+
+def measure(root, count, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        workload(root, count)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(count, repeat):
+    results = []
+    root = tkinter.Tk()
+    root.withdraw()
+    results.append(("no hook", measure(root, count, repeat)))
+    root.destroy()
+
+    hook = DebuggerHook()
+    atexit.unregister(hook.terminate)
+    hook.setup_hooks()
+    root = tkinter.Tk()
+    root.withdraw()
+    hook.root = root
+    results.append(("hook, detached", measure(root, count, repeat)))
+
+    client = _NullClient()
+    hook._stream_clients.append(client)
+    hook.install_hooks()
+    hook.batcher.start()
+    results.append(("hook, attached", measure(root, count, repeat)))
+    hook.batcher.flush()
+    hook.uninstall_hooks()
+    hook._stream_clients.clear()
+    results.append(("hook, after detach", measure(root, count, repeat)))
+    root.destroy()
+    return results
+
+
+class _Resolver:
+    # resolves widget messages the way the debugger does, minus the widget creation
+
+    @staticmethod
+    def widget_from_message(message):
+        return message
+
+
+def sample_messages(count):
+    """
+    Messages representative of the debugger traffic: a batch of events and a
+    large property dump as returned by ``configure()``
+    """
+    events = [
+        Message("EVENT", payload={
+            "event": "<<WidgetModified>>",
+            "widget": WidgetMessage(f".!frame.!button{i % 50}", 0),
+            "data": None,
+            "event_obj": None,
+        })
+        for i in range(count)
+    ]
+    options = {
+        f"option{i}": (f"option{i}", f"option{i}", f"Option{i}", "", f"value {i}")
+        for i in range(40)
+    }
+    dump = [Message("WIDGET", payload=options) for _ in range(count // 10)]
+    return events, dump
+
+
+def _time(func, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run_codec(count, repeat):
+    results = []
+    for label, messages in zip(("events", "property dump"), sample_messages(count)):
+        def pickle_path():
+            for msg in messages:
+                received = pickle.loads(pickle.dumps(msg, pickle.HIGHEST_PROTOCOL))
+                received.payload = unmarshal(received.payload, _Resolver)
+
+        encoder, decoder = Encoder(), Decoder(_Resolver.widget_from_message)
+
+        def codec_path():
+            for msg in messages:
+                decoder.decode(encoder.encode((msg,)))
+
+        def codec_framed():
+            decoder.decode(encoder.encode(messages))
+
+        pickle_size = sum(len(pickle.dumps(msg, pickle.HIGHEST_PROTOCOL)) for msg in messages)
+        results.append((f"{label}, pickle", _time(pickle_path, repeat), pickle_size))
+        # tables are filled during the first run, sizes reflect a warm connection
+        codec_time = _time(codec_path, repeat)
+        results.append((f"{label}, codec", codec_time, sum(len(encoder.encode((msg,))) for msg in messages)))
+        results.append((f"{label}, codec framed", _time(codec_framed, repeat), len(encoder.encode(messages))))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Formation debugger benchmarks")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per scenario, the best is reported")
+    benchmarks = parser.add_subparsers(dest="benchmark", required=True)
+    hook_parser = benchmarks.add_parser("hook", help="overhead of the debugger hook")
+    hook_parser.add_argument("--widgets", type=int, default=500, help="widgets created per run")
+    codec_parser = benchmarks.add_parser("codec", help="message codec against pickle")
+    codec_parser.add_argument("--messages", type=int, default=1000, help="messages encoded per run")
+    args = parser.parse_args()
+
+    if args.benchmark == "hook":
+        results = run(args.widgets, args.repeat)
+        baseline = results[0][1]
+        print(f"{'scenario':<20}{'time (ms)':>12}{'overhead':>12}")
+        for label, elapsed in results:
+            overhead = (elapsed - baseline) / baseline * 100
+            print(f"{label:<20}{elapsed * 1000:>12.1f}{overhead:>11.1f}%")
+    else:
+        results = run_codec(args.messages, args.repeat)
+        print(f"{'scenario':<30}{'time (ms)':>12}{'bytes':>12}")
+        for label, elapsed, size in results:
+            print(f"{label:<30}{elapsed * 1000:>12.1f}{size:>12}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,211 @@
+# ======================================================================= #
+# Copyright (C) 2024 Hoverset Group.                                      #
+# ======================================================================= #
+
+"""
+Compact binary encoding for messages exchanged between the debugger and
+the hook. Widget references are replaced by integer handles and dictionary
+keys by integer ids. Both are assigned by the sender the first time they
+are seen and the definitions travel once, in the frame where they are
+first used. Several messages can be sent in a single frame. The encoded
+structure only contains builtin types and is serialized with :py:mod:`marshal`
+while anything else falls back to :py:mod:`pickle`.
+"""
+
+import collections
+import marshal
+import pickle
+import threading
+
+from studio.debugtools.defs import Message, WidgetMessage
+
+# values written as is
+_PRIMITIVES = frozenset((str, int, float, bool, type(None), bytes))
+
+# any other value is encoded as a tuple starting with one of these tags
+T_TUPLE = 0
+T_DICT = 1
+T_KEYED_DICT = 2
+T_SET = 3
+T_WIDGET = 4
+T_MESSAGE = 5
+T_OBJECT = 6
+# tuple made up of primitives only, can be used without decoding the items
+T_FLAT_TUPLE = 7
+
+
+class Encoder:
+    """
+    Encodes messages into frames. Holds the key and widget tables of the
+    sending side of a connection
+    """
+
+    def __init__(self):
+        self._keys = {}
+        self._widgets = {}
+        self._new_keys = []
+        self._new_widgets = []
+
+    def _intern(self, key):
+        index = self._keys.get(key)
+        if index is None:
+            index = self._keys[key] = len(self._keys)
+            self._new_keys.append(key)
+        return index
+
+    def _handle(self, widget):
+        key = (widget.id, widget.root)
+        handle = self._widgets.get(key)
+        if handle is None:
+            handle = self._widgets[key] = len(self._widgets)
+            self._new_widgets.append(key)
+        return handle
+
+    def _encode(self, value):
+        kind = type(value)
+        if kind in _PRIMITIVES:
+            return value
+        if kind is list:
+            return [self._encode(v) for v in value]
+        if kind is dict:
+            encoded = [T_KEYED_DICT]
+            for k, v in value.items():
+                if type(k) is not str:
+                    break
+                encoded.append(self._intern(k))
+                encoded.append(self._encode(v))
+            else:
+                return tuple(encoded)
+            encoded = [T_DICT]
+            for k, v in value.items():
+                encoded.append(self._encode(k))
+                encoded.append(self._encode(v))
+            return tuple(encoded)
+        if kind is tuple:
+            for v in value:
+                if type(v) not in _PRIMITIVES:
+                    return (T_TUPLE, *(self._encode(v) for v in value))
+            return (T_FLAT_TUPLE, *value)
+        if kind is WidgetMessage:
+            return T_WIDGET, self._handle(value)
+        if kind is Message:
+            return T_MESSAGE, self._intern(value.key), self._encode(value.payload)
+        if kind is set or kind is frozenset:
+            return (T_SET, *(self._encode(v) for v in value))
+        return T_OBJECT, pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+
+    def encode(self, messages):
+        """
+        Encode messages into a single frame
+
+        :param messages: sequence of messages
+        :return: frame as bytes
+        """
+        try:
+            encoded = [self._encode(msg) for msg in messages]
+        except Exception:
+            # the frame will not be sent, forget definitions made for it
+            for key in self._new_keys:
+                self._keys.pop(key)
+            for key in self._new_widgets:
+                self._widgets.pop(key)
+            raise
+        finally:
+            new_keys, new_widgets = self._new_keys, self._new_widgets
+            self._new_keys, self._new_widgets = [], []
+        return marshal.dumps((new_keys, new_widgets, encoded))
+
+
+class Decoder:
+    """
+    Decodes frames produced by :py:class:`Encoder`. Holds the key and widget
+    tables of the receiving side of a connection
+    """
+
+    def __init__(self, resolve=None):
+        """
+        :param resolve: callable converting a :py:class:`WidgetMessage` into a
+            widget. If not provided widget messages are returned as is
+        """
+        self.resolve = resolve
+        self._keys = []
+        self._widgets = []
+
+    def _decode(self, value):
+        kind = type(value)
+        if kind is list:
+            return [self._decode(v) for v in value]
+        if kind is not tuple:
+            return value
+        tag = value[0]
+        if tag == T_KEYED_DICT:
+            keys = self._keys
+            return {keys[k]: self._decode(v) for k, v in zip(value[1::2], value[2::2])}
+        if tag == T_FLAT_TUPLE:
+            return value[1:]
+        if tag == T_WIDGET:
+            widget = self._widgets[value[1]]
+            return self.resolve(widget) if self.resolve else widget
+        if tag == T_TUPLE:
+            return tuple(self._decode(v) for v in value[1:])
+        if tag == T_MESSAGE:
+            return Message(self._keys[value[1]], self._decode(value[2]))
+        if tag == T_DICT:
+            return {self._decode(k): self._decode(v) for k, v in zip(value[1::2], value[2::2])}
+        if tag == T_SET:
+            return {self._decode(v) for v in value[1:]}
+        if tag == T_OBJECT:
+            return pickle.loads(value[1])
+        raise ValueError(f"Unknown tag {tag} in frame")
+
+    def decode(self, frame):
+        """
+        Decode a frame
+
+        :param frame: bytes produced by :py:meth:`Encoder.encode`
+        :return: list of messages
+        """
+        new_keys, new_widgets, encoded = marshal.loads(frame)
+        # tables are updated first so they stay in sync even if decoding fails
+        self._keys.extend(new_keys)
+        self._widgets.extend(WidgetMessage(id_, root) for id_, root in new_widgets)
+        return [self._decode(msg) for msg in encoded]
+
+
+class Channel:
+    """
+    Wraps a :py:class:`multiprocessing.connection.Connection` so messages
+    are sent and received as encoded frames. Both ends of the connection
+    must be wrapped
+    """
+
+    def __init__(self, conn, resolve=None):
+        """
+        :param conn: connection to wrap
+        :param resolve: callable converting received widget messages to widgets
+        """
+        self.conn = conn
+        self.encoder = Encoder()
+        self.decoder = Decoder(resolve)
+        self._received = collections.deque()
+        self._lock = threading.Lock()
+
+    def send(self, *messages):
+        """
+        Send one or more messages in a single frame
+        """
+        if not messages:
+            return
+        with self._lock:
+            self.conn.send_bytes(self.encoder.encode(messages))
+
+    def recv(self):
+        """
+        Receive the next message, blocking until one is available
+        """
+        while not self._received:
+            self._received.extend(self.decoder.decode(self.conn.recv_bytes()))
+        return self._received.popleft()
+
+    def close(self):
+        self.conn.close()
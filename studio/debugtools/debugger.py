@@ -18,8 +18,11 @@ from studio.debugtools.element_pane import ElementPane
 from studio.debugtools.style_pane import StylePane
 from studio.debugtools.selection import DebugSelection
 from studio.debugtools.console import Console
+from studio.debugtools.profiler_pane import ProfilerPane
+from studio.debugtools.memory_pane import MemoryPane
 from studio.debugtools.common import get_logging_level
-from studio.debugtools.defs import RemoteWidget, Message, unmarshal, marshal
+from studio.debugtools.defs import RemoteWidget, Message, marshal
+from studio.debugtools.codec import Channel
 
 from studio.resource_loader import ResourceLoader
 from studio.i18n import _
@@ -31,6 +34,11 @@ logging.basicConfig()
 logger = logging.getLogger("[DEBG]")
 logger.setLevel(get_logging_level())
 
+# events adding or removing menu and canvas items
+ITEM_EVENTS = (
+    "<<MenuItemAdded>>", "<<MenuItemRemoved>>", "<<CanvasItemCreated>>", "<<CanvasItemsDeleted>>"
+)
+
 
 class Elements(PanedWindow):
 
@@ -45,6 +53,14 @@ class Elements(PanedWindow):
 
 class Debugger(Application):
     _instance = None
+    # events handled by the debugger, the hook will not send any other
+    EVENTS = (
+        "<<WidgetCreated>>", "<<WidgetDeleted>>", "<<WidgetModified>>",
+        "<<WidgetLayoutChanged>>", "<<WidgetMapped>>", "<<WidgetUnmapped>>",
+        "<<MenuItemAdded>>", "<<MenuItemRemoved>>", "<<MenuItemModified>>",
+        "<<CanvasItemCreated>>", "<<CanvasItemsDeleted>>", "<<CanvasItemsModified>>",
+        "<<SelectionChanged>>",
+    )
 
     def __init__(self):
         self.pref = Preferences.acquire()
@@ -54,8 +70,12 @@ class Debugger(Application):
         self.geometry(self.pref.get("debugger::geometry"))
         Debugger._instance = self
         self._widget_map = {}
+        self._watch_queue = {}
         self._server_client = None
         self.start_server_client()
+        self.transmit(Message(
+            "HOOK", payload={"meth": "subscribe", "args": (self.EVENTS,)}), response=True
+        )
         self.root = self.transmit(Message(
             "HOOK", payload={"get": "root"}), response=True
         )
@@ -80,6 +100,10 @@ class Debugger(Application):
         self.tabs.add(self.elements, text=_("Elements"))
         self.console = Console(self.tabs, self.exit, self)
         self.tabs.add(self.console, text=_("Console"))
+        self.profiler = ProfilerPane(self.tabs, self)
+        self.tabs.add(self.profiler, text=_("Profiler"))
+        self.memory = MemoryPane(self.tabs, self)
+        self.tabs.add(self.memory, text=_("Memory"))
 
         self.configure(**self.style.surface)
         self.active_widget = None
@@ -93,20 +117,22 @@ class Debugger(Application):
 
     def start_server_client(self):
         logger.debug("[MISC]: Starting server client...")
-        self._server_client = Client(
+        client = Client(
             ("localhost", 6999), authkey=self.pref.get("IPC::authkey")
         )
-        self._server_client.send("SERVER")
+        client.send("SERVER")
+        self._server_client = Channel(client, self.widget_from_message)
         self._server_client.send(Message(
             "HOOK", payload={"set": "styles", "value": self.style}
         ))
 
     def stream_client(self):
         logger.debug("[MISC]: Starting stream client...")
-        self._stream_client = Client(
+        client = Client(
             ("localhost", 6999), authkey=self.pref.get("IPC::authkey")
         )
-        self._stream_client.send("STREAM")
+        client.send("STREAM")
+        self._stream_client = Channel(client, self.widget_from_message)
         while True:
             try:
                 msg = self._stream_client.recv()
@@ -116,8 +142,6 @@ class Debugger(Application):
             if msg == "TERMINATE":
                 self.terminate()
                 break
-            if hasattr(msg, "payload"):
-                msg.payload = unmarshal(msg.payload, self)
             self.handle_msg(msg)
 
     def close_clients(self):
@@ -148,48 +172,124 @@ class Debugger(Application):
             logger.debug("[RECV]: %s", result)
             if isinstance(result, Exception):
                 raise result
-            return unmarshal(result, self)
+            return result
 
     def handle_msg(self, msg):
         if not hasattr(msg, "key"):
             return
         if msg.key == "EVENT":
-            event = msg.payload["event"]
-            widget = msg.payload["widget"]
-            suppress = False
-            if event == "<<WidgetMapped>>" and widget._dbg_node:
-                widget._dbg_node.on_map()
-            if event == "<<WidgetUnmapped>>" and widget._dbg_node:
-                widget._dbg_node.on_unmap()
-            if event == "<<WidgetDeleted>>":
-                widget.deleted = True
-            if event == "<<SelectionChanged>>":
-                self.elements.element_pane.on_widget_tap(
-                    widget, msg.payload["event_obj"], msg.payload.get("data")
-                )
-                suppress = True
-            if event == "<<WidgetModified>>":
-                widget.invalidate_conf()
-            if event == "<<MenuItemModified>>":
-                index = int(msg.payload["data"])
-                if widget._menu_items:
-                    item = widget._menu_items[index]
-                    item.invalidate_conf()
-
-            if not suppress:
-                self.active_widget = widget
-                dat = [(widget.id or ""), str(widget.root), (msg.payload["data"] or "")]
-                self.event_generate(
-                    event, data=" ".join(dat)
-                )
+            self.handle_event(msg.payload)
         if msg.key == "CONSOLE":
             self.console.handle_msg(msg.payload)
 
+    def handle_event(self, payload):
+        event = payload["event"]
+        widget = payload["widget"]
+        suppress = False
+        if isinstance(widget, RemoteWidget):
+            self._invalidate_cache(event, widget)
+        if event == "<<WidgetMapped>>" and widget._dbg_node:
+            widget._dbg_node.on_map()
+        if event == "<<WidgetUnmapped>>" and widget._dbg_node:
+            widget._dbg_node.on_unmap()
+        if event == "<<WidgetDeleted>>":
+            widget.deleted = True
+        if event == "<<SelectionChanged>>":
+            self.elements.element_pane.on_widget_tap(
+                widget, payload["event_obj"], payload.get("data")
+            )
+            suppress = True
+        if event == "<<WidgetModified>>":
+            widget.invalidate_conf()
+        if event == "<<MenuItemModified>>":
+            index = int(payload["data"])
+            if widget._menu_items:
+                item = widget._menu_items[index]
+                item.invalidate_conf()
+
+        if not suppress:
+            self.active_widget = widget
+            dat = [(widget.id or ""), str(widget.root), (payload["data"] or "")]
+            self.event_generate(
+                event, data=" ".join(dat)
+            )
+
+    def _invalidate_cache(self, event, widget):
+        if event in ("<<WidgetCreated>>", "<<WidgetDeleted>>"):
+            parent = self.known_parent(widget)
+            if parent:
+                parent.invalidate("winfo_children")
+            if event == "<<WidgetCreated>>":
+                # a widget may be recreated with the path of a deleted one
+                widget.deleted = False
+            widget.invalidate()
+        elif event in ("<<WidgetMapped>>", "<<WidgetUnmapped>>", "<<WidgetLayoutChanged>>"):
+            widget.invalidate("winfo_ismapped", "winfo_manager", "layout_info")
+        elif event in ITEM_EVENTS:
+            widget.invalidate("has_items")
+
+    def known_parent(self, widget):
+        """
+        Get the parent of a widget from its path without a round trip to the
+        hook. Only parents the debugger has already seen are returned
+
+        :param widget: remote widget
+        :return: parent remote widget or ``None`` if not known
+        """
+        if widget.id == ".":
+            return None
+        # the path of a widget is that of its parent followed by its name
+        return self._widget_map.get((widget.id.rsplit(".", 1)[0] or ".", widget.root))
+
+    def query(self, widgets, fields):
+        """
+        Fetch and cache several fields for several widgets in a single round
+        trip. Only widgets missing any of the fields are queried and cached
+        values are kept until invalidated by an event
+
+        :param widgets: iterable of widgets, items that are not remote widgets are ignored
+        :param fields: names of the fields to fetch
+        """
+        widgets = [
+            w for w in widgets
+            if isinstance(w, RemoteWidget) and not w.deleted and any(f not in w._cache for f in fields)
+        ]
+        if not widgets:
+            return
+        results = self.transmit(Message(
+            "HOOK", payload={"meth": "query", "args": ([(w.id, w.root) for w in widgets], tuple(fields))}
+        ), response=True)
+        for widget, values in zip(widgets, results or ()):
+            if values is not None:
+                widget.update_cache(values)
+
     def set_hover(self, value):
         self.transmit(Message(
             "HOOK", payload={"set": "allow_hover", "value": value}
         ))
 
+    def watch(self, widget):
+        self._queue_watch(widget, True)
+
+    def unwatch(self, widget):
+        self._queue_watch(widget, False)
+
+    def _queue_watch(self, widget, watched):
+        # watch requests are sent together once the debugger is idle
+        # only the last request made for a widget counts
+        if not self._watch_queue:
+            self.after_idle(self._send_watch_queue)
+        self._watch_queue[(widget.id, widget.root)] = watched
+
+    def _send_watch_queue(self):
+        queue, self._watch_queue = self._watch_queue, {}
+        for meth, watched in (("watch", True), ("unwatch", False)):
+            widgets = [key for key, value in queue.items() if value == watched]
+            if widgets:
+                self.transmit(Message(
+                    "HOOK", payload={"meth": meth, "args": (widgets,)}), response=True
+                )
+
     def widget_from_message(self, message):
         key = (message.id, message.root)
         if key in self._widget_map:
@@ -110,6 +110,10 @@ class RemoteCanvasItem:
             self._equiv_class = self._item_type_map.get(self.type(), canvas_lib.CanvasItem)
         return self._equiv_class
 
+    @property
+    def property_class(self):
+        return self.equiv_class
+
     @property
     def name(self):
         if self._name is None:
@@ -196,6 +200,10 @@ class RemoteMenuItem:
             self._equiv_class = self._item_type_map.get(self.type(), menu_lib.MenuItem)
         return self._equiv_class
 
+    @property
+    def property_class(self):
+        return self.equiv_class
+
     @property
     def name(self):
         if self._name is None:
@@ -285,6 +293,8 @@ class RemoteWidget:
         self._dbg_node = None
         self._prop_map = {}
         self._attr_cache = None
+        # values of query fields, invalidated by the event stream
+        self._cache = {}
         self._menu_items = None
         self._canvas_items = None
         self.deleted = False
@@ -309,9 +319,12 @@ class RemoteWidget:
 
     @property
     def _class(self):
-        return self.debugger.transmit(
-            Message("HOOK", payload={"meth": "extract_base_class", "args": (self,)}), response=True
-        )
+        return self._cached("_class")
+
+    @property
+    def property_class(self):
+        # all remote widgets share a python class, properties depend on the remote class
+        return self._class
 
     @property
     def equiv_class(self):
@@ -321,13 +334,32 @@ class RemoteWidget:
 
     @property
     def _true_class_name(self):
-        return self.debugger.transmit(
-            Message("HOOK", payload={"meth": "extract_true_class_name", "args": (self,)}), response=True
-        )
+        return self._cached("_true_class_name")
 
     @property
     def _dbg_ignore(self):
-        return self._get("_dbg_ignore", cache=True)
+        return self._cached("_dbg_ignore")
+
+    def _cached(self, field):
+        if field not in self._cache:
+            self.debugger.query([self], (field,))
+        return self._cache.get(field)
+
+    def update_cache(self, values):
+        self._cache.update(values)
+        if isinstance(values.get("configure"), dict):
+            self._set_attr_cache(values["configure"])
+
+    def invalidate(self, *fields):
+        """
+        Discard cached values of the fields provided or all fields if none is provided
+        """
+        if not fields:
+            self._cache.clear()
+            self._attr_cache = None
+            return
+        for field in fields:
+            self._cache.pop(field, None)
 
     def _call(self, meth, *args, **kwargs):
         return self.debugger.transmit(
@@ -353,16 +385,23 @@ class RemoteWidget:
         )
 
     def configure(self, **kwargs):
-        ret = self._call("configure", **kwargs)
-        if ret is None and not kwargs:
+        if kwargs:
+            self.invalidate_conf()
+            return self._call("configure", **kwargs)
+        ret = self._cached("configure")
+        if ret is None:
             # fallback if configure behaviour is not implemented correctly
             ret = self._configure()
-        if not kwargs and isinstance(ret, dict):
-            self._attr_cache = {k: v[-1] if isinstance(v, (tuple, list, set)) else v for k, v in ret.items()}
+            if isinstance(ret, dict):
+                self.update_cache({"configure": ret})
         return ret
 
+    def _set_attr_cache(self, conf):
+        self._attr_cache = {k: v[-1] if isinstance(v, (tuple, list, set)) else v for k, v in conf.items()}
+
     def invalidate_conf(self):
         self._attr_cache = None
+        self._cache.pop("configure", None)
 
     def _configure(self, cmd="configure", cnf=None, kw=None):
         return self._call("_configure", cmd, cnf, kw)
@@ -376,6 +415,7 @@ class RemoteWidget:
         return self._call("__getitem__", item)
 
     def __setitem__(self, key, value):
+        self.invalidate_conf()
         return self._call("__setitem__", key, value)
 
     def get_prop(self, prop):
@@ -464,6 +504,16 @@ class RemoteWidget:
             self._init_canvas_items()
         return list(self._canvas_items.values())
 
+    def has_extra_items(self):
+        """
+        Check whether the widget has menu or canvas items without loading them
+        """
+        if self._class == tkinter.Menu and self._menu_items is not None:
+            return bool(self._menu_items)
+        if self._class == tkinter.Canvas and self._canvas_items is not None:
+            return bool(self._canvas_items)
+        return bool(self._cached("has_items"))
+
     @property
     def extra_items(self):
         if self._class == tkinter.Menu:
@@ -479,7 +529,7 @@ class RemoteWidget:
         return self._call("keys")
 
     def winfo_children(self):
-        return self._call("winfo_children")
+        return self._cached("winfo_children") or []
 
     def winfo_parent(self):
         return self._call("winfo_parent")
@@ -488,25 +538,30 @@ class RemoteWidget:
         return self.debugger.widget_from_message(WidgetMessage(name, root=self.root))
 
     def winfo_ismapped(self):
-        return self._call("winfo_ismapped")
+        return self._cached("winfo_ismapped")
 
     def winfo_manager(self):
-        return self._call("winfo_manager")
+        return self._cached("winfo_manager")
+
+    def _layout_info(self, manager, **kwargs):
+        if not kwargs and self.winfo_manager() == manager:
+            return self._cached("layout_info")
+        return self._call(f"{manager}_info", **kwargs)
 
     def pack_info(self, **kwargs):
-        return self._call("pack_info", **kwargs)
+        return self._layout_info("pack", **kwargs)
 
     def pack_configure(self, **kwargs):
         return self._call("pack_configure", **kwargs)
 
     def grid_info(self, **kwargs):
-        return self._call("grid_info", **kwargs)
+        return self._layout_info("grid", **kwargs)
 
     def grid_configure(self, **kwargs):
         return self._call("grid_configure", **kwargs)
 
     def place_info(self, **kwargs):
-        return self._call("place_info", **kwargs)
+        return self._layout_info("place", **kwargs)
 
     def place_configure(self, **kwargs):
         return self._call("place_configure", **kwargs)
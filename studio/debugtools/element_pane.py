@@ -5,55 +5,130 @@ from hoverset.ui.widgets import Button, ToggleButton, Label
 from studio.debugtools.defs import RemoteWidget
 from studio.feature.component_tree import ComponentTreeView
 from studio.i18n import _
-from studio.ui.tree import MalleableTreeView
+from studio.ui.tree import VirtualTreeView
 from studio.ui.widgets import Pane
 
+# fields needed to display a node, fetched in bulk for all children of a node
+NODE_FIELDS = ("_class", "_dbg_ignore", "winfo_children", "winfo_ismapped", "has_items")
+
+CREATED = "created"
+DELETED = "deleted"
+
+
+def coalesce(events):
+    """
+    Reduce a batch of widget creation and deletion events to the net change.
+    Only the last event of a widget counts and widgets keep the position of
+    their first event so parents stay ahead of their children
+
+    :param events: list of ``(kind, widget)`` tuples in the order received
+    :return: tuple of lists of created and deleted widgets
+    """
+    last = {}
+    for kind, widget in events:
+        last[widget] = kind
+    created = [w for w, kind in last.items() if kind == CREATED]
+    deleted = [w for w, kind in last.items() if kind == DELETED]
+    return created, deleted
+
 
 class ElementTreeView(ComponentTreeView):
 
-    class Node(MalleableTreeView.Node):
+    class Row(ComponentTreeView.Row):
+
+        def refresh(self):
+            super().refresh()
+            node = self.node
+            if not node.nodes and node.expandable:
+                self.expander.configure(image=self.COLLAPSED_ICON)
+            style = self.style.text if node.mapped else self.style.text_passive
+            self.name_pad.configure(foreground=style["foreground"])
+
+    class Node(VirtualTreeView.Node):
         # debugger widget to be ignored during loading
         # will be set at runtime
         debugger = None
 
-        def __init__(self, master=None, **config):
-            super().__init__(master, **config)
+        def __init__(self, tree, **config):
+            super().__init__(tree, **config)
             self.widget = config.get("widget")
+            self._loaded = False
+            self._mapped = True
+            # children exist but are yet to be loaded
+            self._expandable = False
             setattr(self.widget, "_dbg_node", self)
             self.set_widget(self.widget)
 
         def set_widget(self, widget):
             self.widget = widget
+            self._mapped = bool(self.widget.winfo_ismapped())
+            self.name = self.extract_name(self.widget)
+
+        def get_icon(self):
+            # only fetched when the node is rendered
             equiv = self.widget.equiv_class
-            icon = equiv.icon if equiv else 'play'
-            self.name_pad.configure(text=self.extract_name(self.widget))
-            self.icon_pad.configure(image=get_icon_image(icon, 15, 15))
-            if not self.widget.winfo_ismapped():
-                self.on_unmap()
-            self._loaded = False
+            return get_icon_image(equiv.icon if equiv else 'play', 15, 15)
+
+        @property
+        def mapped(self):
+            return self._mapped
+
+        @property
+        def expandable(self):
+            return self._expandable and not self._loaded
 
         def on_map(self, *_):
-            self.name_pad.configure(**self.style.text)
-            if self.selected:
-                self.name_pad.configure(**self.style.hover)
+            self._mapped = True
+            self._refresh()
 
         def on_unmap(self, *_):
-            self.name_pad.configure(**self.style.text_passive)
-            if self.selected:
-                self.name_pad.configure(**self.style.hover)
+            self._mapped = False
+            self._refresh()
 
         @property
         def loaded(self):
             return self._loaded
 
+        @property
+        def shown(self):
+            # all ancestors are expanded
+            parent = self.parent_node
+            while isinstance(parent, VirtualTreeView.Node):
+                if not parent._expanded:
+                    return False
+                parent = parent.parent_node
+            return True
+
+        def shown_descendants(self):
+            if not self._expanded:
+                return
+            for node in self.nodes:
+                yield node
+                if isinstance(node, ElementTreeView.Node):
+                    yield from node.shown_descendants()
+
+        def set_watched(self, watched):
+            # receive events for this widget and its children
+            if not isinstance(self.widget, RemoteWidget) or self.widget.deleted:
+                return
+            if watched:
+                self.debugger.watch(self.widget)
+            else:
+                self.debugger.unwatch(self.widget)
+
+        def sync_watch(self):
+            # only widgets visible in the tree or selected are watched
+            self.set_watched(self._selected or self.shown)
+
         def update_preload_status(self, added):
             if self._loaded or self.widget.deleted:
                 return
-            if added or self.widget.winfo_children() or self.widget.extra_items:
-                # widget can expand
-                self._set_expander(self.COLLAPSED_ICON)
-            else:
-                self._set_expander(self.BLANK)
+            expandable = added
+            if not expandable and isinstance(self.widget, RemoteWidget):
+                expandable = bool(self.widget.winfo_children()) or self.widget.has_extra_items()
+            if expandable != self._expandable:
+                self._expandable = expandable
+                self._refresh()
 
         def extract_name(self, widget):
             if isinstance(widget, RemoteWidget):
@@ -65,7 +140,9 @@ class ElementTreeView(ComponentTreeView):
             # nodes will be loaded when parent node is expanded
             if self._loaded or self.widget.deleted:
                 return
-            for child in self.widget.winfo_children():
+            children = self.widget.winfo_children()
+            self.debugger.query(children, NODE_FIELDS)
+            for child in children:
                 if getattr(child, "_dbg_ignore", False):
                     continue
                 self.add_as_node(widget=child).update_preload_status(False)
@@ -73,21 +150,54 @@ class ElementTreeView(ComponentTreeView):
             for item in self.widget.extra_items:
                 if item._dbg_node:
                     self.add(item._dbg_node)
-                    self.set_widget(item)
-                    item._dbg_node.update_preload_status(False)
+                    item._dbg_node.set_widget(item)
                 else:
-                    self.add_as_node(widget=item).update_preload_status(False)
+                    self.add_as_node(widget=item)
             self._loaded = True
+            self._refresh()
 
         def expand(self):
             # load widgets first
             self.load()
+            expanded = self._expanded
             super().expand()
+            if self._expanded and not expanded:
+                for node in self.shown_descendants():
+                    node.sync_watch()
+
+        def collapse(self):
+            hidden = list(self.shown_descendants())
+            super().collapse()
+            for node in hidden:
+                node.sync_watch()
+
+        def select(self, event=None, silently=False):
+            super().select(event, silently)
+            self.sync_watch()
+
+        def deselect(self, *_):
+            super().deselect()
+            self.sync_watch()
 
     def initialize_tree(self):
         super(ElementTreeView, self).initialize_tree()
         self._show_empty(_("No items detected"))
 
+    def _search_terms(self, node):
+        return node.name,
+
+    def _adopt(self, node):
+        super()._adopt(node)
+        for item in self._subtree(node):
+            if isinstance(item, ElementTreeView.Node):
+                item.sync_watch()
+
+    def _orphan(self, node):
+        super()._orphan(node)
+        for item in self._subtree(node):
+            if isinstance(item, ElementTreeView.Node):
+                item.set_watched(False)
+
     def expand_to(self, widget):
         parent = widget.nametowidget(widget.winfo_parent())
         hierarchy = [parent]
@@ -106,10 +216,13 @@ class ElementPane(Pane):
     name = "Widget tree"
     display_name = _("Widget tree")
     MAX_STARTING_DEPTH = 4
+    # milliseconds over which widget creation and deletion events are batched
+    BATCH_INTERVAL = 50
 
     def __init__(self, master, debugger):
         super(ElementPane, self).__init__(master)
         self.debugger = debugger
+        self._pending = []
         Label(self._header, **self.style.text_accent, text=self.display_name).pack(side="left")
 
         ElementTreeView.Node.debugger = debugger
@@ -147,6 +260,7 @@ class ElementPane(Pane):
         self._select_btn.on_change(self.debugger.set_hover)
         self._select_btn.tooltip(_("select element to inspect"))
 
+        debugger.query(debugger.roots, NODE_FIELDS)
         for root in debugger.roots:
             self._tree.add_as_node(widget=root).update_preload_status(False)
 
@@ -168,6 +282,9 @@ class ElementPane(Pane):
 
     def on_widget_tap(self, widget, event, data=None):
         self._select_btn.toggle()
+        if self._pending:
+            # the widget may be among those yet to be added
+            self._apply_pending()
         if widget:
             # bring debugger to front
             self.debugger.attributes('-topmost', True)
@@ -185,28 +302,71 @@ class ElementPane(Pane):
                 node.select(event)
 
     def on_widget_created(self, _):
-        widget = self.debugger.active_widget
-        parent_node = getattr(widget.master, "_dbg_node", None)
-        if parent_node:
-            if parent_node.loaded:
-                parent_node.add_as_node(widget=widget)
-            else:
-                parent_node.update_preload_status(True)
+        self._queue(CREATED, self.debugger.active_widget)
 
     def on_widget_deleted(self, _):
-        widget = self.debugger.active_widget
-        node = widget._dbg_node
-        parent_node = node.parent_node if node else None
-        if parent_node:
+        self._queue(DELETED, self.debugger.active_widget)
+
+    def _queue(self, kind, widget):
+        # creation and deletion events arrive one widget at a time and are
+        # applied to the tree together
+        if not self._pending:
+            self.after(self.BATCH_INTERVAL, self._apply_pending)
+        self._pending.append((kind, widget))
+
+    def _apply_pending(self):
+        events, self._pending = self._pending, []
+        created, deleted = coalesce(events)
+        self._add_nodes(created)
+        self._remove_nodes(deleted)
+
+    def _add_nodes(self, widgets):
+        additions = []
+        for widget in widgets:
+            if widget.deleted:
+                continue
+            parent = self.debugger.known_parent(widget)
+            parent_node = getattr(parent, "_dbg_node", None)
+            if not parent_node:
+                continue
+            if not parent_node.loaded:
+                parent_node.update_preload_status(True)
+            elif widget._dbg_node is None or widget._dbg_node.parent_node is not parent_node:
+                additions.append((parent_node, widget))
+
+        # everything needed to display the new nodes is fetched at once
+        self.debugger.query([widget for _, widget in additions], NODE_FIELDS)
+        for parent_node, widget in additions:
+            if widget._dbg_ignore or not parent_node.loaded:
+                continue
+            parent_node.add_as_node(widget=widget).update_preload_status(False)
+
+    def _remove_nodes(self, widgets):
+        unloaded = []
+        had_selection = False
+        for widget in widgets:
+            node = widget._dbg_node
+            parent_node = node.parent_node if node else None
+            if not parent_node:
+                continue
             if parent_node.loaded:
-                node = widget._dbg_node
                 if node in self.selected:
+                    had_selection = True
                     self._tree.toggle_from_selection(node)
-                    if not self.selected:
-                        self._tree.see(self.debugger.root._dbg_node)
-                parent_node.remove(widget._dbg_node)
-            else:
-                parent_node.update_preload_status(False)
+                parent_node.remove(node)
+                # a widget created later with the same path gets a new node
+                widget._dbg_node = None
+            elif parent_node not in unloaded:
+                unloaded.append(parent_node)
+
+        if had_selection and not self.selected:
+            self._tree.see(self.debugger.root._dbg_node)
+
+        self.debugger.query([node.widget for node in unloaded], ("winfo_children", "has_items"))
+        for node in unloaded:
+            node.update_preload_status(False)
+            # queried widgets are watched by the hook
+            node.sync_watch()
 
     def on_menu_item_added(self, event):
         widget, root, index = event.user_data.split(" ")
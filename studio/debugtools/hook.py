@@ -17,10 +17,16 @@ import subprocess
 import atexit
 import queue
 import code
+import weakref
 
 from studio.ui.highlight import WidgetHighlighter
 from studio.ui import geometry
-from studio.debugtools.defs import Message, marshal, RemoteEvent, unmarshal
+from studio.debugtools.defs import Message, marshal, RemoteEvent
+from studio.debugtools.codec import Channel
+from studio.debugtools.batcher import EventBatcher
+from studio.debugtools.subscription import Subscription
+from studio.debugtools.profiler import CallbackProfiler
+from studio.debugtools import memory
 from studio.debugtools.common import extract_base_class, get_logging_level, run_on_main_thread
 from studio.debugtools.preferences import Preferences
 
@@ -56,6 +62,40 @@ class _BypassedLogger:
 logger = _BypassedLogger("[HOOK]", get_logging_level(), sys.stdout, sys.stderr)
 
 
+def _layout_info(widget):
+    info = {
+        "pack": widget.pack_info,
+        "grid": widget.grid_info,
+        "place": widget.place_info,
+    }.get(widget.winfo_manager())
+    return info() if info else None
+
+
+def _has_items(widget):
+    # whether a menu or canvas has items to list in the element tree
+    if isinstance(widget, tkinter.Menu):
+        end = widget.index("end")
+        # the tear-off entry is not listed
+        return end is not None and end + 1 > int(widget["tearoff"])
+    if isinstance(widget, tkinter.Canvas):
+        return bool(widget.find_all())
+    return False
+
+
+# fields that can be requested in batched queries
+QUERY_FIELDS = {
+    "configure": lambda widget: widget.configure(),
+    "winfo_children": lambda widget: widget.winfo_children(),
+    "winfo_ismapped": lambda widget: widget.winfo_ismapped(),
+    "winfo_manager": lambda widget: widget.winfo_manager(),
+    "layout_info": _layout_info,
+    "has_items": _has_items,
+    "_class": extract_base_class,
+    "_true_class_name": lambda widget: widget.__class__.__name__,
+    "_dbg_ignore": lambda widget: getattr(widget, "_dbg_ignore", None),
+}
+
+
 class RemotePipe:
 
     def __init__(self, hook, tag):
@@ -139,9 +179,8 @@ class DebuggerHook:
         self.active_widget = None
         self.enable_hooks = True
         self._ignore = set()
-        self.listener = Listener(
-            ('localhost', 6999), authkey=pref.get("IPC::authkey")
-        )
+        self._authkey = pref.get("IPC::authkey")
+        self.listener = None
         self._handle_map = {}
         self.styles = None
         self._allow_hover = False
@@ -159,6 +198,14 @@ class DebuggerHook:
         self.shell = code.InteractiveConsole({"debugger": self.debugger_api})
         self._stream_clients = []
         self._server_clients = []
+        self._send_lock = threading.Lock()
+        self.batcher = EventBatcher(self._send_events)
+        self.subscription = Subscription()
+        self.profiler = CallbackProfiler()
+        # (owner, name, original, replacement) of methods swapped in while a client is attached
+        self._patches = []
+        self._hooked = weakref.WeakSet()
+        self.hooks_installed = False
         self.selection = []
         atexit.register(self.terminate)
         # force close preferences
@@ -199,6 +246,7 @@ class DebuggerHook:
         return tkinter._default_root
 
     def acquire_debugger(self):
+        self.listener = Listener(('localhost', 6999), authkey=self._authkey)
         threading.Thread(target=self.server, daemon=True).start()
         subprocess.Popen(
             [sys.executable, "-m", "studio.debugtools"],
@@ -272,7 +320,7 @@ class DebuggerHook:
 
     def on_widget_map(self, event):
         widget = event.widget
-        if isinstance(widget, str):
+        if isinstance(widget, str) or not self.wants_event("<<WidgetMapped>>", widget):
             return
         if widget.winfo_id() in self._ignore or not self.enable_hooks:
             return
@@ -280,7 +328,7 @@ class DebuggerHook:
 
     def on_widget_unmap(self, event):
         widget = event.widget
-        if isinstance(widget, str):
+        if isinstance(widget, str) or not self.wants_event("<<WidgetUnmapped>>", widget):
             return
         if widget.winfo_id() in self._ignore or not self.enable_hooks:
             return
@@ -290,29 +338,47 @@ class DebuggerHook:
         root = self.roots[message.root]
         return root.nametowidget(message.id)
 
+    def wants_event(self, ev, widget=None):
+        return bool(self._stream_clients) and self.enable_hooks and self.subscription.wants(ev, widget)
+
     def push_event(self, ev, widget=None, event=None, data=None):
+        if not self._stream_clients or not self.subscription.wants(ev, widget):
+            return
         if data:
             data = str(data)
+        key = self.batcher.key(ev, widget, data)
+        if self.batcher.merge(key):
+            # an identical event is already waiting to be sent
+            return
         if event:
             event = RemoteEvent(event)
-        self.transmit(Message(
-            "EVENT",
-            payload=marshal({"event": ev, "widget": widget, "data": data, "event_obj": event}, self)
-        ))
+        self.batcher.push(
+            marshal({"event": ev, "widget": widget, "data": data, "event_obj": event}, self), key
+        )
+
+    def _send_events(self, events):
+        # the whole batch goes out in a single frame
+        self.transmit(*(Message("EVENT", payload=event) for event in events))
 
-    def transmit(self, msg):
+    def transmit(self, *messages):
         remove = []
-        for client in self._stream_clients:
-            try:
-                client.send(msg)
-            except ConnectionResetError:
-                remove.append(client)
+        with self._send_lock:
+            for client in self._stream_clients:
+                try:
+                    client.send(*messages)
+                except (OSError, EOFError):
+                    # covers reset and broken pipes as well as closed connections
+                    remove.append(client)
+
+            for client in remove:
+                self._stream_clients.remove(client)
 
-        for client in remove:
-            self._stream_clients.remove(client)
+            if remove and not self._stream_clients:
+                self.on_detach()
 
         if self._stream_clients:
-            logger.debug(f"[STRM]: {msg}")
+            for msg in messages:
+                logger.debug(f"[STRM]: {msg}")
 
     def sub_server(self, conn):
         logger.debug("[MISC]: Subserver started")
@@ -325,8 +391,6 @@ class DebuggerHook:
                 else:
                     self.exit()
                 break
-            if isinstance(msg, Message):
-                msg.payload = unmarshal(msg.payload, self)
             try:
                 self.handle_msg(msg, conn)
             except Exception as e:
@@ -337,20 +401,23 @@ class DebuggerHook:
             conn = self.listener.accept()
             msg = conn.recv()
             if msg == "STREAM":
-                self._stream_clients.append(conn)
+                if not self._stream_clients:
+                    run_on_main_thread(self.root, self.install_hooks)
+                self._stream_clients.append(Channel(conn))
+                self.batcher.start()
                 logger.debug("[MISC]: Stream client connected")
             elif msg == "SERVER":
-                self._server_clients.append(conn)
+                channel = Channel(conn, self.widget_from_message)
+                self._server_clients.append(channel)
                 logger.debug("[MISC]: Server client connected")
                 threading.Thread(
-                    target=self.sub_server, args=(conn,), daemon=True
+                    target=self.sub_server, args=(channel,), daemon=True
                 ).start()
             else:
                 conn.close()
 
     def access(self, obj, msg, conn):
         # method runners, property setters and getters
-        msg.payload = unmarshal(msg.payload, self)
         if "meth" in msg.payload:
             if isinstance(obj, tkinter.Menu) and "index" in msg.payload:
                 # tear-off compensation
@@ -388,6 +455,93 @@ class DebuggerHook:
         if msg.key == "HOOK":
             self.access(self, msg, conn)
 
+    def subscribe(self, events=None):
+        self.subscription.subscribe(events)
+
+    def _resolve(self, widgets):
+        resolved = []
+        for path, root in widgets:
+            try:
+                resolved.append(self.roots[root].nametowidget(path))
+            except (KeyError, IndexError):
+                # widget no longer exists
+                continue
+        return resolved
+
+    def watch(self, widgets):
+        self.subscription.watch(*self._resolve(widgets))
+
+    def unwatch(self, widgets):
+        self.subscription.unwatch(*self._resolve(widgets))
+
+    def query(self, widgets, fields):
+        """
+        Fetch several fields for several widgets in a single request. Queried
+        widgets are watched so the debugger is notified when the values change
+
+        :param widgets: list of (path, root index) pairs
+        :param fields: names of fields in :py:data:`QUERY_FIELDS`
+        :return: list of dicts mapping fields to values, ``None`` for widgets
+            that no longer exist
+        """
+        if len(self.roots) > 1:
+            return run_on_main_thread(self.root, self._query, widgets, fields)
+        return self._query(widgets, fields)
+
+    def _query(self, widgets, fields):
+        getters = [(field, QUERY_FIELDS[field]) for field in fields]
+        results = []
+        resolved = []
+        for path, root in widgets:
+            try:
+                widget = self.roots[root].nametowidget(path)
+                results.append({field: getter(widget) for field, getter in getters})
+            except (KeyError, IndexError, tkinter.TclError):
+                results.append(None)
+                continue
+            resolved.append(widget)
+        self.subscription.watch(*resolved)
+        return results
+
+    def profiler_start(self, interval=None):
+        if interval:
+            self.profiler.interval = interval
+        if len(self.roots) > 1:
+            run_on_main_thread(self.root, self.profiler.start, self.root)
+        else:
+            self.profiler.start(self.root)
+
+    def profiler_stop(self):
+        if len(self.roots) > 1:
+            run_on_main_thread(self.root, self.profiler.stop)
+        else:
+            self.profiler.stop()
+
+    def profiler_clear(self):
+        self.profiler.clear()
+
+    def profiler_report(self, top=20):
+        return self.profiler.report(top)
+
+    def _ignored(self, widget):
+        return getattr(widget, "_dbg_ignore", False)
+
+    def memory_counts(self):
+        """
+        Live widget counts per class, cheap enough to be polled
+        """
+        if len(self.roots) > 1:
+            return run_on_main_thread(self.root, memory.widget_counts, self.roots, self._ignored)
+        return memory.widget_counts(self.roots, self._ignored)
+
+    def memory_snapshot(self):
+        """
+        Full memory snapshot, see :py:func:`studio.debugtools.memory.snapshot`
+        """
+        if len(self.roots) > 1:
+            return run_on_main_thread(self.root, memory.snapshot, self.roots, self._ignored)
+        return memory.snapshot(self.roots, self._ignored)
+
     def console_compile(self, command):
         try:
             result = code.compile_command(command)
@@ -432,6 +586,7 @@ class DebuggerHook:
 
     def terminate(self):
         # Hook initiated termination
+        self.batcher.close()
         self.transmit("TERMINATE")
 
     def extract_base_class(self, widget):
@@ -440,7 +595,54 @@ class DebuggerHook:
     def extract_true_class_name(self, widget):
         return widget.__class__.__name__
 
+    def on_detach(self):
+        logger.debug("[MISC]: All stream clients detached")
+        self.subscription = Subscription()
+        if self.root is not None:
+            self.root.after(0, self.uninstall_hooks)
+
+    def install_hooks(self):
+        """
+        Swap in the hooked tkinter methods and hook all existing widgets.
+        Should be called on the main thread
+        """
+        if self.hooks_installed:
+            return
+        for owner, name, _, replacement in self._patches:
+            setattr(owner, name, replacement)
+        self.hooks_installed = True
+        for root in self.roots:
+            self._hook_tree(root)
+        logger.debug("[MISC]: Hooks installed")
+
+    def uninstall_hooks(self):
+        """
+        Restore the original tkinter methods and remove hooks from all widgets.
+        Should be called on the main thread
+        """
+        if not self.hooks_installed:
+            return
+        for owner, name, original, _ in self._patches:
+            setattr(owner, name, original)
+        self.hooks_installed = False
+        self.profiler.stop()
+        for widget in list(self._hooked):
+            self.unhook_widget(widget)
+        logger.debug("[MISC]: Hooks uninstalled")
+
+    def _patch(self, owner, name, replacement):
+        self._patches.append((owner, name, getattr(owner, name), replacement))
+
+    def _hook_tree(self, widget):
+        if getattr(widget, "_dbg_ignore", False):
+            return
+        self.hook_widget(widget)
+        for child in list(widget.children.values()):
+            self._hook_tree(child)
+
     def hook_widget(self, widget):
+        if getattr(widget, "_dbg_hooked", False):
+            return
         if widget.winfo_id() in self._ignore:
             return
         if not self.enable_hooks:
@@ -448,6 +650,12 @@ class DebuggerHook:
         self._hook_widget_conf(widget)
         self._hook_destroy(widget)
         setattr(widget, "_dbg_hooked", True)
+        self._hooked.add(widget)
+
+    def unhook_widget(self, widget):
+        for name in ("configure", "config", "destroy", "_dbg_hooked"):
+            widget.__dict__.pop(name, None)
+        self._hooked.discard(widget)
 
     def _hook_creation(self):
         _setup = tkinter.BaseWidget.__init__
@@ -457,19 +665,22 @@ class DebuggerHook:
             _setup(slf, master, *args, **kwargs)
             if slf.winfo_id() not in self._ignore and self.enable_hooks:
                 self.hook_widget(slf)
-                self.push_event("<<WidgetCreated>>", slf)
+                if self.wants_event("<<WidgetCreated>>", slf):
+                    self.push_event("<<WidgetCreated>>", slf)
 
         def _hook_root(slf, *args, **kwargs):
             _setup_root(slf, *args, **kwargs)
             self.roots.append(slf)
-            self.hook_widget(slf)
-            # initial protocol bind
-            slf.wm_protocol("WM_DELETE_WINDOW", slf.destroy)
+            if self.hooks_installed:
+                self.hook_widget(slf)
+            # initial protocol bind, resolve destroy late so it goes through the hook if any
+            slf.wm_protocol("WM_DELETE_WINDOW", lambda: slf.destroy())
             self._bind_root_events(slf)
             if slf.winfo_id() not in self._ignore and self.enable_hooks:
                 self.push_event("<<WidgetCreated>>", slf)
 
-        setattr(tkinter.BaseWidget, '__init__', _hook)
+        self._patch(tkinter.BaseWidget, '__init__', _hook)
+        # roots have to be tracked even when no client is attached
         setattr(tkinter.Tk, '__init__', _hook_root)
 
     def _hook_canvas(self):
@@ -479,11 +690,13 @@ class DebuggerHook:
 
         def _hook_create(slf, *args, **kwargs):
             item_id = _create(slf, *args, **kwargs)
-            if slf.winfo_id() not in self._ignore and self.enable_hooks:
+            if self.wants_event("<<CanvasItemCreated>>", slf) and slf.winfo_id() not in self._ignore:
                 self.push_event("<<CanvasItemCreated>>", slf, data=str(item_id))
             return item_id
 
         def _hook_delete(slf, *args):
+            if not self.wants_event("<<CanvasItemsDeleted>>", slf):
+                return _delete(slf, *args)
             ids = set()
             for item in args:
                 try:
@@ -496,6 +709,8 @@ class DebuggerHook:
                 self.push_event("<<CanvasItemsDeleted>>", slf, data=" ".join(ids))
 
         def _hook_config(slf, tagOrId, cnf=None, **kw):
+            if not (cnf or kw) or not self.wants_event("<<CanvasItemsModified>>", slf):
+                return _config(slf, tagOrId, cnf, **kw)
             ids = []
             try:
                 ids = [str(i) for i in slf.find_withtag(tagOrId)]
@@ -506,10 +721,10 @@ class DebuggerHook:
                 self.push_event("<<CanvasItemsModified>>", slf, data=" ".join(ids))
             return ret
 
-        setattr(tkinter.Canvas, '_create', _hook_create)
-        setattr(tkinter.Canvas, 'delete', _hook_delete)
-        setattr(tkinter.Canvas, 'itemconfigure', _hook_config)
-        setattr(tkinter.Canvas, 'itemconfig', _hook_config)
+        self._patch(tkinter.Canvas, '_create', _hook_create)
+        self._patch(tkinter.Canvas, 'delete', _hook_delete)
+        self._patch(tkinter.Canvas, 'itemconfigure', _hook_config)
+        self._patch(tkinter.Canvas, 'itemconfig', _hook_config)
 
     def _hook_menu(self):
         orig_add = tkinter.Menu.add
@@ -525,6 +740,8 @@ class DebuggerHook:
 
         def _hook_add(slf, itemType, cnf=None, **kw):
             ret = orig_add(slf, itemType, cnf or {}, **kw)
+            if not self.wants_event("<<MenuItemAdded>>", slf):
+                return ret
             index = int(slf.index("end")) - int(slf["tearoff"])
             if slf.winfo_id() not in self._ignore and self.enable_hooks:
                 self.push_event("<<MenuItemAdded>>", slf, data=index)
@@ -532,12 +749,16 @@ class DebuggerHook:
 
         def _hook_insert(slf, index, itemType, cnf=None, **kw):
             ret = orig_insert(slf, index, itemType, cnf or {}, **kw)
+            if not self.wants_event("<<MenuItemAdded>>", slf):
+                return ret
             index = _correct_index(slf, index)
             if slf.winfo_id() not in self._ignore and self.enable_hooks:
                 self.push_event("<<MenuItemAdded>>", slf, data=f"{index}")
             return ret
 
         def _hook_remove(slf, index1, index2=None):
+            if not self.wants_event("<<MenuItemRemoved>>", slf):
+                return orig_remove(slf, index1, index2)
             orig_index1, orig_index2 = index1, index2
             index2 = index1 if index2 is None else index2
             index1, index2 = slf.index(index1), slf.index(index2)
@@ -563,6 +784,8 @@ class DebuggerHook:
 
         def _hook_config(slf, index, cnf=None, **kw):
             ret = orig_config(slf, index, cnf, **kw)
+            if not (cnf or kw) or not self.wants_event("<<MenuItemModified>>", slf):
+                return ret
             if index == 0 and int(slf["tearoff"]):
                 # we don't track tear-off configurations
                 return ret
@@ -571,11 +794,11 @@ class DebuggerHook:
                 self.push_event("<<MenuItemModified>>", slf, data=f"{index}")
             return ret
 
-        setattr(tkinter.Menu, 'add', _hook_add)
-        setattr(tkinter.Menu, 'insert', _hook_insert)
-        setattr(tkinter.Menu, 'delete', _hook_remove)
-        setattr(tkinter.Menu, 'entryconfigure', _hook_config)
-        setattr(tkinter.Menu, 'entryconfig', _hook_config)
+        self._patch(tkinter.Menu, 'add', _hook_add)
+        self._patch(tkinter.Menu, 'insert', _hook_insert)
+        self._patch(tkinter.Menu, 'delete', _hook_remove)
+        self._patch(tkinter.Menu, 'entryconfigure', _hook_config)
+        self._patch(tkinter.Menu, 'entryconfig', _hook_config)
 
     def _hook_layout(self):
 
@@ -584,7 +807,9 @@ class DebuggerHook:
 
             def _hook(slf, *args, **kwargs):
                 ret = orig(slf, *args, **kwargs)
-                if slf.winfo_id() not in self._ignore and self.enable_hooks:
+                if not self.wants_event("<<WidgetLayoutChanged>>", slf):
+                    return ret
+                if slf.winfo_id() not in self._ignore:
                     self.push_event("<<WidgetLayoutChanged>>", slf)
                 return ret
 
@@ -594,14 +819,16 @@ class DebuggerHook:
                 ret = orig(slf, _id, opt, *args, **kwargs)
                 if not opt and not kwargs:
                     return ret
-                if slf.winfo_id() not in self._ignore and self.enable_hooks:
+                if not self.wants_event("<<WidgetLayoutChanged>>", _id):
+                    return ret
+                if slf.winfo_id() not in self._ignore:
                     self.push_event("<<WidgetLayoutChanged>>", _id)
                 return ret
 
             if alt:
-                setattr(obj, name, _hook_alt)
+                self._patch(obj, name, _hook_alt)
             else:
-                setattr(obj, name, _hook)
+                self._patch(obj, name, _hook)
 
         _hooks = {
             tkinter.Pack: [False, 'pack', 'config', 'configure', 'pack_configure'],
@@ -631,6 +858,7 @@ class DebuggerHook:
                             pass
             if self.enable_hooks:
                 self.push_event("<<WidgetDeleted>>", widget)
+            self.subscription.unwatch(widget)
             return destroy()
 
         setattr(widget, "destroy", _hook)
@@ -681,12 +909,18 @@ class DebuggerHook:
         tkinter.Misc.mainloop = _mainloop
         tkinter.mainloop = _mainloop_func
 
-    def start(self):
-        self.hook()
+    def setup_hooks(self):
+        # callbacks have to be wrapped as they are registered to be profiled later
+        self.profiler.install()
+        # hooks are only swapped in once a client attaches
         self._hook_creation()
         self._hook_menu()
         self._hook_canvas()
         self._hook_layout()
+
+    def start(self):
+        self.hook()
+        self.setup_hooks()
         with open(self.path) as file:
             code = compile(file.read(), self.path, 'exec')
 
@@ -0,0 +1,218 @@
+# ======================================================================= #
+# Copyright (C) 2024 Hoverset Group.                                      #
+# ======================================================================= #
+
+"""
+Memory inspection used by the debugger hook. Snapshots summarize what an
+application holds on to: live widgets per class, python widget objects that
+outlived their tk widget, images, tcl global variables and pending ``after``
+callbacks. Two snapshots can be compared with :py:func:`diff` to reveal
+growth between two points in time.
+"""
+
+import collections
+import gc
+import re
+import time
+import tkinter
+
+# tkinter registers callbacks as tcl commands named after the object id
+_COMMAND_ID = re.compile(r"^\d+")
+
+
+def _alive(root):
+    try:
+        return bool(root.winfo_exists())
+    except tkinter.TclError:
+        return False
+
+
+def widget_counts(roots, ignore=None):
+    """
+    Count live widgets per class
+
+    :param roots: tk roots to walk, destroyed roots are skipped
+    :param ignore: optional callable returning ``True`` for widgets to skip
+        along with their descendants
+    :return: dict mapping class names to counts
+    """
+    counts = collections.Counter()
+    stack = [root for root in roots if _alive(root)]
+    while stack:
+        widget = stack.pop()
+        if ignore and ignore(widget):
+            continue
+        counts[widget.__class__.__name__] += 1
+        stack.extend(widget.children.values())
+    return dict(counts)
+
+
+def is_orphan(widget):
+    """
+    Check whether a python widget object no longer represents a tk widget.
+    Destroyed widgets are removed from the children of their master so any
+    that are not are only kept alive by other references
+    """
+    if isinstance(widget, tkinter.Tk):
+        return False
+    master = getattr(widget, "master", None)
+    if master is None:
+        return False
+    return master.children.get(getattr(widget, "_name", None)) is not widget
+
+
+def orphans():
+    """
+    Find destroyed widgets still referenced from python
+
+    :return: list of ``(class name, path)`` tuples
+    """
+    # destroyed widgets waiting to be collected are not leaks
+    gc.collect()
+    found = []
+    for obj in gc.get_objects():
+        try:
+            if isinstance(obj, tkinter.Misc) and is_orphan(obj):
+                found.append((obj.__class__.__name__, obj._w))
+        except Exception:
+            # objects with unusual attribute access
+            continue
+    return found
+
+
+def images(tk):
+    """
+    List images in a tcl interpreter
+
+    :param tk: tkapp of a root
+    :return: list of ``(name, type, width, height)`` tuples
+    """
+    found = []
+    for name in tk.splitlist(tk.call("image", "names")):
+        try:
+            found.append((
+                str(name),
+                str(tk.call("image", "type", name)),
+                tk.getint(tk.call("image", "width", name)),
+                tk.getint(tk.call("image", "height", name)),
+            ))
+        except tkinter.TclError:
+            continue
+    return found
+
+
+def variables(tk):
+    """
+    List global tcl variables
+
+    :param tk: tkapp of a root
+    :return: list of ``(name, size)`` tuples, size being the length of the
+        value for scalars and the number of elements for arrays
+    """
+    found = []
+    for name in tk.splitlist(tk.call("info", "globals")):
+        try:
+            if tk.getboolean(tk.call("array", "exists", name)):
+                size = tk.getint(tk.call("array", "size", name))
+            else:
+                size = len(str(tk.globalgetvar(name)))
+        except tkinter.TclError:
+            continue
+        found.append((str(name), size))
+    return found
+
+
+def after_queue(tk):
+    """
+    List pending ``after`` callbacks
+
+    :param tk: tkapp of a root
+    :return: list of ``(script, type)`` tuples where type is ``timer`` or
+        ``idle``. Python callbacks are shown by function name
+    """
+    found = []
+    for event in tk.splitlist(tk.call("after", "info")):
+        try:
+            script, kind = tk.splitlist(tk.call("after", "info", event))
+        except (tkinter.TclError, ValueError):
+            continue
+        found.append((_COMMAND_ID.sub("", str(script)), str(kind)))
+    return found
+
+
+def snapshot(roots, ignore=None):
+    """
+    Take a snapshot of the memory held by an application
+
+    :param roots: tk roots of the application
+    :param ignore: optional callable returning ``True`` for widgets to skip
+        when counting, see :py:func:`widget_counts`
+    :return: dict with the keys ``time``, ``widgets`` (counts per class),
+        ``orphans``, ``images``, ``variables`` and ``after``. Entries of the
+        last three are prefixed with the index of the root they belong to
+    """
+    data = {
+        "time": time.time(),
+        "widgets": widget_counts(roots, ignore),
+        "orphans": orphans(),
+        "images": [],
+        "variables": [],
+        "after": [],
+    }
+    for index, root in enumerate(roots):
+        if not _alive(root):
+            continue
+        data["images"].extend((index, *image) for image in images(root.tk))
+        data["variables"].extend((index, *var) for var in variables(root.tk))
+        data["after"].extend((index, *event) for event in after_queue(root.tk))
+    return data
+
+
+def _count(entries, key):
+    return collections.Counter(key(entry) for entry in entries)
+
+
+def _delta(old, new):
+    return {
+        k: new.get(k, 0) - old.get(k, 0)
+        for k in set(old) | set(new)
+        if new.get(k, 0) != old.get(k, 0)
+    }
+
+
+def diff(old, new):
+    """
+    Compare two snapshots
+
+    :param old: earlier snapshot
+    :param new: later snapshot
+    :return: dict with the keys ``elapsed`` (seconds between the snapshots),
+        ``widgets`` and ``orphans`` mapping class names to changes in count,
+        ``after`` mapping scripts to changes in count, ``images`` and
+        ``variables`` each a dict with ``added`` and ``removed`` lists of
+        names and ``pixels`` the change in the total image area
+    """
+    def names(snap, section):
+        return {(entry[0], entry[1]) for entry in snap[section]}
+
+    def pixels(snap):
+        return sum(entry[3] * entry[4] for entry in snap["images"])
+
+    result = {
+        "elapsed": new["time"] - old["time"],
+        "widgets": _delta(old["widgets"], new["widgets"]),
+        "orphans": _delta(
+            _count(old["orphans"], lambda e: e[0]), _count(new["orphans"], lambda e: e[0])
+        ),
+        "after": _delta(
+            _count(old["after"], lambda e: e[1]), _count(new["after"], lambda e: e[1])
+        ),
+        "pixels": pixels(new) - pixels(old),
+    }
+    for section in ("images", "variables"):
+        before, after = names(old, section), names(new, section)
+        result[section] = {
+            "added": sorted(name for _, name in after - before),
+            "removed": sorted(name for _, name in before - after),
+        }
+    return result
@@ -0,0 +1,201 @@
+# ======================================================================= #
+# Copyright (C) 2024 Hoverset Group.                                      #
+# ======================================================================= #
+
+import collections
+import time
+
+from hoverset.ui.icons import get_icon_image
+from hoverset.ui.widgets import Button, ToggleButton, Label, Canvas, Text, AutoScroll
+from studio.debugtools import memory
+from studio.debugtools.defs import Message
+from studio.i18n import _
+from studio.ui.widgets import Pane
+
+
+class MemoryPane(Pane):
+    """
+    Tracks live widget counts over time and displays memory snapshots of the
+    application. Each snapshot is compared against the previous one
+    """
+    name = "Memory"
+    display_name = _("Memory")
+    # milliseconds between widget counts while tracking
+    REFRESH = 2000
+    # number of widget counts kept for the chart
+    HISTORY = 300
+    # classes drawn in the chart besides the total
+    TOP_CLASSES = 4
+    # entries listed per section in the report, counts are always complete
+    MAX_ENTRIES = 50
+    CHART_HEIGHT = 120
+
+    def __init__(self, master, debugger):
+        super().__init__(master)
+        self.debugger = debugger
+        self._poll_id = None
+        self.history = collections.deque(maxlen=self.HISTORY)
+        self.snapshots = collections.deque(maxlen=2)
+        Label(self._header, **self.style.text_accent, text=self.display_name).pack(side="left")
+
+        self._clear_btn = Button(
+            self._header, **self.style.button,
+            image=get_icon_image("remove", 15, 15), width=25, height=25,
+        )
+        self._clear_btn.pack(side="right", padx=2)
+        self._clear_btn.tooltip(_("Clear history and snapshots"))
+        self._clear_btn.on_click(self.clear)
+
+        self._snapshot_btn = Button(
+            self._header, **self.style.button,
+            image=get_icon_image("add", 15, 15), width=25, height=25,
+        )
+        self._snapshot_btn.pack(side="right", padx=2)
+        self._snapshot_btn.tooltip(_("Take snapshot"))
+        self._snapshot_btn.on_click(self.take_snapshot)
+
+        self._track_btn = ToggleButton(
+            self._header, **self.style.button,
+            image=get_icon_image("play", 15, 15), width=25, height=25,
+        )
+        self._track_btn.pack(side="right", padx=2)
+        self._track_btn.tooltip(_("Track widget counts"))
+        self._track_btn.on_change(self.set_tracking)
+
+        self._chart = Canvas(self, **self.style.canvas, height=self.CHART_HEIGHT)
+        self._chart.pack(side="top", fill="x", padx=4, pady=2)
+
+        self._report_frame = AutoScroll(self)
+        self._report_frame.pack(side="top", fill="both", expand=True, padx=4, pady=2)
+        self._report = Text(self._report_frame, wrap="none", font=("Consolas", 10))
+        self._report_frame.set_child(self._report)
+        self._report_frame.show_scroll(AutoScroll.Y)
+        self._write([_("Take a snapshot to inspect memory, take another to see what changed")])
+
+    def _call(self, meth):
+        return self.debugger.transmit(Message("HOOK", payload={"meth": meth}), response=True)
+
+    def set_tracking(self, value):
+        if value:
+            self.poll()
+        elif self._poll_id is not None:
+            self.after_cancel(self._poll_id)
+            self._poll_id = None
+
+    def poll(self):
+        counts = self._call("memory_counts")
+        if counts is not None:
+            self.history.append((time.time(), counts))
+            self._render_chart()
+        if self._track_btn.get():
+            self._poll_id = self.after(self.REFRESH, self.poll)
+
+    def clear(self, *_):
+        self.history.clear()
+        self.snapshots.clear()
+        self._chart.delete("all")
+        self._write([])
+
+    def take_snapshot(self, *_):
+        snapshot = self._call("memory_snapshot")
+        if snapshot is None:
+            return
+        self.snapshots.append(snapshot)
+        self.history.append((snapshot["time"], snapshot["widgets"]))
+        self._render_chart()
+        lines = self.describe(snapshot)
+        if len(self.snapshots) > 1:
+            lines = self.describe_diff(memory.diff(*self.snapshots)) + [""] + lines
+        self._write(lines)
+
+    def _write(self, lines):
+        self._report.configure(state="normal")
+        self._report.clear()
+        self._report.insert("end", "\n".join(lines))
+        self._report.configure(state="disabled")
+
+    def _limit(self, entries):
+        if len(entries) > self.MAX_ENTRIES:
+            return entries[:self.MAX_ENTRIES] + [_("  ... {} more").format(len(entries) - self.MAX_ENTRIES)]
+        return entries
+
+    def describe(self, snapshot):
+        widgets = sorted(snapshot["widgets"].items(), key=lambda c: c[1], reverse=True)
+        lines = [_("Widgets: {}").format(sum(snapshot["widgets"].values()))]
+        lines.extend(self._limit([f"  {count:>6}  {name}" for name, count in widgets]))
+
+        lines.append(_("Destroyed widgets still referenced: {}").format(len(snapshot["orphans"])))
+        lines.extend(self._limit([f"  {name}  {path}" for name, path in snapshot["orphans"]]))
+
+        images = sorted(snapshot["images"], key=lambda i: i[3] * i[4], reverse=True)
+        pixels = sum(i[3] * i[4] for i in images)
+        lines.append(_("Images: {} ({} pixels)").format(len(images), pixels))
+        lines.extend(self._limit([
+            f"  {width}x{height}  {kind}  {name}" for _, name, kind, width, height in images
+        ]))
+
+        variables = sorted(snapshot["variables"], key=lambda v: v[2], reverse=True)
+        lines.append(_("Tcl variables: {}").format(len(variables)))
+        lines.extend(self._limit([f"  {size:>6}  {name}" for _, name, size in variables]))
+
+        lines.append(_("Pending after callbacks: {}").format(len(snapshot["after"])))
+        pending = collections.Counter((script, kind) for _, script, kind in snapshot["after"])
+        lines.extend(self._limit([
+            f"  {count:>6}  {kind}  {script}" for (script, kind), count in pending.most_common()
+        ]))
+        return lines
+
+    def describe_diff(self, diff):
+        def changes(delta):
+            return self._limit([
+                f"  {count:>+6}  {name}"
+                for name, count in sorted(delta.items(), key=lambda c: c[1], reverse=True)
+            ])
+
+        lines = [_("Changes over the last {:.0f} s").format(diff["elapsed"])]
+        lines.append(_("Widgets: {:+}").format(sum(diff["widgets"].values())))
+        lines.extend(changes(diff["widgets"]))
+        lines.append(_("Destroyed widgets still referenced: {:+}").format(sum(diff["orphans"].values())))
+        lines.extend(changes(diff["orphans"]))
+        lines.append(_("Images: +{} -{} ({:+} pixels)").format(
+            len(diff["images"]["added"]), len(diff["images"]["removed"]), diff["pixels"]
+        ))
+        lines.extend(self._limit([f"  + {name}" for name in diff["images"]["added"]]))
+        lines.extend(self._limit([f"  - {name}" for name in diff["images"]["removed"]]))
+        lines.append(_("Tcl variables: +{} -{}").format(
+            len(diff["variables"]["added"]), len(diff["variables"]["removed"])
+        ))
+        lines.extend(self._limit([f"  + {name}" for name in diff["variables"]["added"]]))
+        lines.extend(self._limit([f"  - {name}" for name in diff["variables"]["removed"]]))
+        lines.append(_("Pending after callbacks: {:+}").format(sum(diff["after"].values())))
+        lines.extend(changes(diff["after"]))
+        return lines
+
+    def _render_chart(self):
+        canvas = self._chart
+        canvas.delete("all")
+        if len(self.history) < 2:
+            return
+        width = canvas.winfo_width()
+        height = self.CHART_HEIGHT
+        start, end = self.history[0][0], self.history[-1][0]
+        span = (end - start) or 1
+        latest = self.history[-1][1]
+        classes = sorted(latest, key=latest.get, reverse=True)[:self.TOP_CLASSES]
+        series = [(_("Total"), [sum(counts.values()) for _, counts in self.history])]
+        series.extend((name, [counts.get(name, 0) for _, counts in self.history]) for name in classes)
+        # all series share the scale of the total
+        peak = max(series[0][1]) or 1
+        colors = self.style.colors
+        palette = (colors["accent"], colors["secondary1"], colors["secondary2"], colors["primary"])
+
+        for index, (name, values) in enumerate(series):
+            color = palette[index % len(palette)]
+            coords = []
+            for (t, _counts), value in zip(self.history, values):
+                coords.extend(((t - start) / span * width, height - 2 - (height - 14) * value / peak))
+            canvas.create_line(*coords, fill=color)
+            canvas.create_text(
+                4 + index * 110, 2, anchor="nw", fill=color, font=("Consolas", 8),
+                text=f"{name} {values[-1]}"
+            )
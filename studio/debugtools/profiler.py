@@ -0,0 +1,229 @@
+# ======================================================================= #
+# Copyright (C) 2024 Hoverset Group.                                      #
+# ======================================================================= #
+
+"""
+Callback latency profiler used by the debugger hook. Every python callback
+tk invokes, be it an ``after``/``after_idle`` timer, an event binding or a
+widget command, is registered through :py:meth:`tkinter.Misc._register`.
+Once installed, the profiler wraps each callback as it is registered so it
+can be timed while recording and samples the lag of the event loop with a
+periodic timer. Wrapped callbacks only check a flag when not recording.
+"""
+
+import collections
+import time
+import tkinter
+
+# callbacks slower than this (seconds) are added to the timeline
+SLOW_CALLBACK = 0.005
+
+AFTER = "after"
+BIND = "bind"
+COMMAND = "command"
+
+
+def _after_target(func):
+    # after() and after_idle() wrap the callback in a local function named
+    # callit whose closure holds the actual callback. Newer versions of
+    # tkinter rename the wrapper after the callback so check the code instead
+    code = getattr(func, "__code__", None)
+    if code is None or code.co_name != "callit" or not func.__closure__:
+        return None
+    cells = dict(zip(code.co_freevars, func.__closure__))
+    if "func" in cells:
+        try:
+            return cells["func"].cell_contents
+        except ValueError:
+            return None
+    return None
+
+
+def describe(func):
+    """
+    Return a readable label for a callback
+
+    :param func: callable
+    :return: label in the form ``module.qualname``
+    """
+    target = getattr(func, "func", None)
+    if target is not None and not hasattr(func, "__qualname__"):
+        # functools.partial and alike
+        func = target
+    name = getattr(func, "__qualname__", None) or type(func).__qualname__
+    module = getattr(func, "__module__", None)
+    return f"{module}.{name}" if module else name
+
+
+class CallbackProfiler:
+    """
+    Records call counts and execution times of tk callbacks grouped by kind
+    (``after``, ``bind`` or ``command``) and label.
+    """
+
+    def __init__(self, interval=50, timeline_size=500, lag_size=500):
+        """
+        :param interval: event loop lag sampling interval in milliseconds
+        :param timeline_size: maximum number of slow callbacks kept
+        :param lag_size: maximum number of lag samples kept
+        """
+        self.interval = interval
+        self.recording = False
+        self._root = None
+        self._timer = None
+        self._expected = 0
+        self._original = None
+        self._stats = {}
+        self.timeline = collections.deque(maxlen=timeline_size)
+        self.lag = collections.deque(maxlen=lag_size)
+        self._started = time.perf_counter()
+
+    def clear(self):
+        self._stats = {}
+        self.timeline.clear()
+        self.lag.clear()
+        self._started = time.perf_counter()
+
+    def classify(self, func, subst=None):
+        """
+        Return the kind and the actual callback registered with
+        :py:meth:`tkinter.Misc._register`
+        """
+        if subst is not None:
+            return BIND, func
+        target = _after_target(func)
+        if target is not None:
+            return AFTER, target
+        return COMMAND, func
+
+    def record(self, kind, func, start, duration):
+        if not self.recording or func == self._sample:
+            # stopped or our own lag sampler
+            return
+        key = (kind, describe(func))
+        stat = self._stats.get(key)
+        if stat is None:
+            self._stats[key] = [1, duration, duration]
+        else:
+            stat[0] += 1
+            stat[1] += duration
+            if duration > stat[2]:
+                stat[2] = duration
+        if duration >= SLOW_CALLBACK:
+            self.timeline.append((start - self._started, duration, kind, key[1]))
+
+    def wrap(self, func, subst=None):
+        """
+        Wrap a callback so it is timed while recording
+
+        :param func: callback about to be registered
+        :param subst: event substitution function if any
+        :return: wrapped callback
+        """
+        profiler = self
+        kind, target = self.classify(func, subst)
+        perf_counter = time.perf_counter
+
+        def timed(*args):
+            if not profiler.recording:
+                return func(*args)
+            start = perf_counter()
+            try:
+                return func(*args)
+            finally:
+                profiler.record(kind, target, start, perf_counter() - start)
+
+        # tkinter derives the tcl command name from the callback name
+        name = getattr(getattr(func, "__func__", func), "__name__", None)
+        if name is not None:
+            timed.__name__ = name
+        return timed
+
+    def install(self):
+        """
+        Wrap every callback registered from now on. Callbacks registered
+        earlier cannot be profiled so this should be called before any
+        widget is created
+        """
+        if self._original is not None:
+            return
+        profiler = self
+        original = self._original = tkinter.Misc._register
+
+        def _register(self, func, subst=None, needcleanup=1):
+            return original(self, profiler.wrap(func, subst), subst, needcleanup)
+
+        # register is an alias that would otherwise still point to the original
+        tkinter.Misc._register = tkinter.Misc.register = _register
+
+    def uninstall(self):
+        """
+        Restore :py:meth:`tkinter.Misc._register`. Callbacks already
+        wrapped remain so but are no longer timed
+        """
+        self.stop()
+        if self._original is None:
+            return
+        tkinter.Misc._register = tkinter.Misc.register = self._original
+        self._original = None
+
+    def start(self, root):
+        """
+        Start recording. Should be called on the main thread
+
+        :param root: tk root used to schedule lag samples
+        """
+        if self.recording:
+            return
+        self._root = root
+        self.recording = True
+        self._schedule()
+
+    def stop(self):
+        """
+        Stop recording. Recorded data is kept
+        """
+        if not self.recording:
+            return
+        self.recording = False
+        if self._timer is not None:
+            try:
+                self._root.after_cancel(self._timer)
+            except tkinter.TclError:
+                pass
+        self._timer = self._root = None
+
+    def _schedule(self):
+        self._expected = time.perf_counter() + self.interval / 1000
+        self._timer = self._root.after(self.interval, self._sample)
+
+    def _sample(self):
+        now = time.perf_counter()
+        self.lag.append((now - self._started, max(0.0, now - self._expected)))
+        if self.recording:
+            self._schedule()
+
+    def report(self, top=20):
+        """
+        Summary of the recorded data
+
+        :param top: number of callbacks to include, sorted by total time
+        :return: dict with the keys ``elapsed`` (seconds since the data was
+            cleared), ``recording``, ``callbacks`` a list of
+            ``(kind, label, count, total, max)`` tuples, ``timeline`` a list
+            of ``(start, duration, kind, label)`` tuples for slow callbacks
+            and ``lag`` a list of ``(time, lag)`` samples. Times are in seconds
+        """
+        # copies are taken first since the main thread may still be recording
+        stats = dict(self._stats)
+        callbacks = sorted(
+            ((kind, label, *stat) for (kind, label), stat in stats.items()),
+            key=lambda s: s[3], reverse=True
+        )
+        return {
+            "elapsed": time.perf_counter() - self._started,
+            "recording": self.recording,
+            "callbacks": callbacks[:top],
+            "timeline": list(self.timeline),
+            "lag": list(self.lag),
+        }
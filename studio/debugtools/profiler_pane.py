@@ -0,0 +1,154 @@
+# ======================================================================= #
+# Copyright (C) 2024 Hoverset Group.                                      #
+# ======================================================================= #
+
+from hoverset.ui.icons import get_icon_image
+from hoverset.ui.widgets import Button, ToggleButton, Label, Frame, Canvas
+from studio.debugtools.defs import Message
+from studio.i18n import _
+from studio.ui.widgets import Pane
+
+
+class ProfilerPane(Pane):
+    """
+    Displays callback latencies recorded by the hook profiler, the callbacks
+    that took the most time and a timeline of slow callbacks and event loop lag
+    """
+    name = "Profiler"
+    display_name = _("Profiler")
+    # milliseconds between reports while recording
+    REFRESH = 1000
+    TOP = 20
+    # seconds of history shown in the timeline
+    WINDOW = 30
+    TIMELINE_HEIGHT = 100
+
+    def __init__(self, master, debugger):
+        super().__init__(master)
+        self.debugger = debugger
+        self._poll_id = None
+        Label(self._header, **self.style.text_accent, text=self.display_name).pack(side="left")
+
+        self._clear_btn = Button(
+            self._header, **self.style.button,
+            image=get_icon_image("remove", 15, 15), width=25, height=25,
+        )
+        self._clear_btn.pack(side="right", padx=2)
+        self._clear_btn.tooltip(_("Clear recorded data"))
+        self._clear_btn.on_click(self.clear)
+
+        self._record_btn = ToggleButton(
+            self._header, **self.style.button,
+            image=get_icon_image("play", 15, 15), width=25, height=25,
+        )
+        self._record_btn.pack(side="right", padx=2)
+        self._record_btn.tooltip(_("Record callbacks"))
+        self._record_btn.on_change(self.set_recording)
+
+        self._summary = Label(self, **self.style.text_passive, anchor="w")
+        self._summary.pack(side="top", fill="x", padx=4, pady=2)
+
+        self._timeline = Canvas(
+            self, **self.style.canvas, height=self.TIMELINE_HEIGHT
+        )
+        self._timeline.pack(side="top", fill="x", padx=4, pady=2)
+
+        self._table = Frame(self, **self.style.surface)
+        self._table.pack(side="top", fill="both", expand=True, padx=4, pady=2)
+        self._table.columnconfigure(1, weight=1)
+        headings = (_("Kind"), _("Callback"), _("Calls"), _("Total (ms)"), _("Max (ms)"))
+        for column, text in enumerate(headings):
+            Label(self._table, **self.style.text_accent, text=text, anchor="w").grid(
+                row=0, column=column, sticky="ew", padx=2
+            )
+        # rows are created once and reused on every refresh
+        self._rows = [
+            [Label(self._table, **self.style.text, anchor="w") for _ in headings]
+            for _ in range(self.TOP)
+        ]
+        for row, labels in enumerate(self._rows, 1):
+            for column, label in enumerate(labels):
+                label.grid(row=row, column=column, sticky="ew", padx=2)
+        self._summary.configure(text=_("Not recording"))
+
+    def _call(self, meth, *args, response=False):
+        return self.debugger.transmit(Message(
+            "HOOK", payload={"meth": meth, "args": args}
+        ), response=response)
+
+    def set_recording(self, value):
+        if value:
+            self._call("profiler_start", response=True)
+            self.refresh()
+        else:
+            self._call("profiler_stop", response=True)
+            if self._poll_id is not None:
+                self.after_cancel(self._poll_id)
+                self._poll_id = None
+            self.refresh(False)
+
+    def clear(self, *_):
+        self._call("profiler_clear", response=True)
+        self.refresh(False)
+
+    def refresh(self, schedule=True):
+        report = self._call("profiler_report", self.TOP, response=True)
+        if report:
+            self.render(report)
+        if schedule and self._record_btn.get():
+            self._poll_id = self.after(self.REFRESH, self.refresh)
+
+    def render(self, report):
+        lag = [value for _, value in report["lag"]]
+        if lag:
+            self._summary.configure(text=_(
+                "Event loop lag: {current:.1f} ms (max {max:.1f} ms) over {elapsed:.0f} s"
+            ).format(current=lag[-1] * 1000, max=max(lag) * 1000, elapsed=report["elapsed"]))
+        else:
+            self._summary.configure(
+                text=_("Recording") if report["recording"] else _("Not recording")
+            )
+
+        callbacks = report["callbacks"]
+        for index, labels in enumerate(self._rows):
+            if index < len(callbacks):
+                kind, label, count, total, longest = callbacks[index]
+                values = (kind, label, count, f"{total * 1000:.1f}", f"{longest * 1000:.1f}")
+            else:
+                values = ("",) * len(labels)
+            for widget, value in zip(labels, values):
+                widget.configure(text=value)
+
+        self._render_timeline(report)
+
+    def _render_timeline(self, report):
+        canvas = self._timeline
+        canvas.delete("all")
+        width = canvas.winfo_width()
+        height = self.TIMELINE_HEIGHT
+        end = report["elapsed"]
+        start = end - self.WINDOW
+        scale = width / self.WINDOW
+        colors = self.style.colors
+
+        def x_of(t):
+            return (t - start) * scale
+
+        # slow callbacks as bars, taller bars took longer
+        for t, duration, kind, label in report["timeline"]:
+            if t + duration < start:
+                continue
+            bar = min(height, 4 + duration * 1000)
+            canvas.create_rectangle(
+                x_of(t), height - bar, max(x_of(t + duration), x_of(t) + 2), height,
+                fill=colors["secondary2"], width=0
+            )
+
+        # event loop lag as a line, scaled against the worst lag shown
+        points = [(x_of(t), lag) for t, lag in report["lag"] if t >= start]
+        if len(points) > 1:
+            peak = max(lag for _, lag in points) or 1
+            coords = []
+            for x, lag in points:
+                coords.extend((x, height - 2 - (height - 4) * lag / peak))
+            canvas.create_line(*coords, fill=colors["accent"])
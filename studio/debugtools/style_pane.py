@@ -2,12 +2,17 @@ from hoverset.ui.widgets import Label
 from studio.debugtools.defs import RemoteWidget
 
 from studio.ui.widgets import Pane
-from studio.feature.stylepane import StylePaneFramework, StyleGroup
+from studio.feature.stylepane import StylePaneFramework, StyleGroup, VirtualStyleGroup
 from studio.debugtools.common import get_resolved_properties
 from studio.debugtools import layouts
 from studio.lib.properties import combine_properties
 from studio.i18n import _
 
+# fields needed to display the layout of a widget
+LAYOUT_FIELDS = ("_class", "winfo_ismapped", "winfo_manager", "layout_info")
+# fields needed to render all groups, fetched in bulk for the selection
+STYLE_FIELDS = ("configure",) + LAYOUT_FIELDS
+
 
 def get_combined_properties(widgets):
     """
@@ -22,7 +27,7 @@ def get_combined_properties(widgets):
     return combine_properties(properties)
 
 
-class AttributeGroup(StyleGroup):
+class AttributeGroup(VirtualStyleGroup):
 
     def __init__(self, master, pane, **cnf):
         super().__init__(master, pane, **cnf)
@@ -44,9 +49,6 @@ class AttributeGroup(StyleGroup):
     def _set_prop(self, prop, value, widget):
         widget.configure(**{prop: value})
 
-    def can_optimize(self):
-        return self.bases == list(set([widget.equiv_class for widget in self.widgets]))
-
     def on_widgets_change(self):
         super().on_widgets_change()
         self.bases = bases = list(set([widget.equiv_class for widget in self.widgets]))
@@ -131,6 +133,7 @@ class StylePane(StylePaneFramework, Pane):
 
     def _on_config_change(self, _):
         if self.debugger.active_widget in self.widgets:
+            self.debugger.query(self.widgets, STYLE_FIELDS)
             self.render_styles()
 
     def _on_menu_item_config(self, event):
@@ -153,9 +156,11 @@ class StylePane(StylePaneFramework, Pane):
 
     def _on_layout_change(self, _):
         if self.debugger.active_widget in self.widgets:
+            self.debugger.query(self.widgets, LAYOUT_FIELDS)
             self.render_layouts()
 
     def on_selection_changed(self, _):
+        self.debugger.query(self.debugger.selection, STYLE_FIELDS)
         if self.debugger.selection:
             self._select(None, self.debugger.selection)
         else:
@@ -0,0 +1,71 @@
+# ======================================================================= #
+# Copyright (C) 2024 Hoverset Group.                                      #
+# ======================================================================= #
+
+# events sent regardless of the subscription
+UNFILTERED_EVENTS = frozenset((
+    "<<SelectionChanged>>",
+))
+
+# events that are also of interest when the parent of the widget is watched
+STRUCTURAL_EVENTS = frozenset((
+    "<<WidgetCreated>>",
+    "<<WidgetDeleted>>",
+))
+
+
+class Subscription:
+    """
+    Describes the events a debugger is interested in so the hook can filter
+    them at the source. A subscription is made up of the event kinds to be
+    sent and the widgets being watched. Events for widgets that are not
+    watched are dropped except for creation and deletion of children of
+    watched widgets. Until the debugger watches its first widget, events
+    for all widgets are sent.
+    """
+
+    def __init__(self):
+        self.events = None
+        self.widgets = None
+
+    def subscribe(self, events=None):
+        """
+        Set the event kinds to be sent
+
+        :param events: iterable of event names, ``None`` to send all events
+        """
+        self.events = None if events is None else frozenset(events)
+
+    def watch(self, *widgets):
+        """
+        Start sending events for the widgets provided
+        """
+        if self.widgets is None:
+            self.widgets = set()
+        self.widgets.update(widgets)
+
+    def unwatch(self, *widgets):
+        """
+        Stop sending events for the widgets provided
+        """
+        if self.widgets is not None:
+            self.widgets.difference_update(widgets)
+
+    def wants(self, event, widget=None):
+        """
+        Check whether an event should be sent to the debugger. This is called
+        from hot paths and never queries the widget through Tcl
+
+        :param event: event name
+        :param widget: widget the event relates to, may be a widget path
+        :return: ``True`` if the event should be sent
+        """
+        if event in UNFILTERED_EVENTS:
+            return True
+        if self.events is not None and event not in self.events:
+            return False
+        if self.widgets is None or widget is None or isinstance(widget, str):
+            return True
+        if widget in self.widgets:
+            return True
+        return event in STRUCTURAL_EVENTS and getattr(widget, "master", None) in self.widgets
@@ -1,15 +1,19 @@
-from studio.feature.component_tree import ComponentTree
-from studio.feature.stylepane import StylePane
-from studio.feature.components import ComponentPane
-from studio.feature.variablepane import VariablePane
-from studio.feature.eventspane import EventPane
+import importlib
 
-FEATURES = (
-    ComponentPane,
-    ComponentTree,
-    StylePane,
-    EventPane,
-    VariablePane,
-)
+# feature modules are imported on first access so they can be imported and
+# profiled individually
+_FEATURES = {
+    "ComponentPane": "studio.feature.components",
+    "ComponentTree": "studio.feature.component_tree",
+    "StylePane": "studio.feature.stylepane",
+    "EventPane": "studio.feature.eventspane",
+    "VariablePane": "studio.feature.variablepane",
+}
 
 
+def __getattr__(name):
+    if name == "FEATURES":
+        return tuple(__getattr__(feature) for feature in _FEATURES)
+    if name in _FEATURES:
+        return getattr(importlib.import_module(_FEATURES[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
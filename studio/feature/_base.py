@@ -11,6 +11,34 @@ from studio.preferences import Preferences
 from studio.i18n import _
 
 
+class LazyFeature:
+    """
+    Stands in for a hidden feature that has not been created yet. It takes
+    the place of the feature in the side bar and feature menu and creates
+    the feature the first time it is shown.
+    """
+
+    def __init__(self, feature_class, studio):
+        self.feature_class = feature_class
+        self.studio = studio
+        self.display_name = feature_class.display_name
+        self.indicator = None
+        self.is_visible = BooleanVar(None, False)
+        feature_class.update_defaults("", copy.deepcopy(feature_class._defaults))
+
+    def get_pref(self, short_path):
+        return self.feature_class.get_pref(short_path)
+
+    def set_pref(self, short_path, value):
+        self.feature_class.set_pref(short_path, value)
+
+    def maximize(self):
+        self.studio.get_feature(self.feature_class).maximize()
+
+    def toggle(self):
+        self.maximize()
+
+
 class BaseFeature(Pane):
     _instance = None
     name = "Feature"
@@ -22,6 +50,9 @@ class BaseFeature(Pane):
     _transparency_flag = None
     _side = None
     rec = (20, 20, 300, 300)  # Default window mode position
+    # lazy features are only created when first shown or requested
+    lazy = False
+    _loader = None
     _defaults = {
         "mode": "docked",
         "inactive_transparency": False,
@@ -120,6 +151,9 @@ class BaseFeature(Pane):
 
     @classmethod
     def get_instance(cls):
+        if cls._instance is None and cls._loader is not None:
+            # feature has not been created yet
+            return cls._loader()
         return cls._instance
 
     def on_pane_drag(self, event):
@@ -199,6 +233,13 @@ class BaseFeature(Pane):
         """
         pass
 
+    def on_context_hibernate(self, context):
+        """
+        Override to perform operations when a tab context is hibernated and
+        its designer replaced. Defaults to :py:meth:`on_context_close`
+        """
+        self.on_context_close(context)
+
     def on_app_close(self) -> bool:
         """
         Override to perform operations before the studio app closes.
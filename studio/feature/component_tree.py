@@ -3,25 +3,27 @@ from hoverset.ui.widgets import Button, Label, Frame
 from hoverset.ui.menu import MenuUtils
 from studio.feature._base import BaseFeature
 from studio.lib.pseudo import PseudoWidget
-from studio.ui.tree import MalleableTreeView
+from studio.ui.tree import VirtualTreeView
 from studio.i18n import _
 
 
-class ComponentTreeView(MalleableTreeView):
+class ComponentTreeView(VirtualTreeView):
 
-    class Node(MalleableTreeView.Node):
+    class Node(VirtualTreeView.Node):
 
         def __init__(self, master=None, **config):
             super().__init__(master, **config)
             self.widget: PseudoWidget = config.get("widget")
             self.widget.node = self
-            self.name_pad.configure(text=self.widget.id)
-            self.icon_pad.configure(image=get_icon_image(self.widget.icon, 15, 15))
+            self._name = self.widget.id
+
+        def get_icon(self):
+            # only fetched when the node is rendered
+            return get_icon_image(self.widget.icon, 15, 15)
 
         def widget_modified(self, widget):
             self.widget = widget
-            self.name_pad.configure(text=self.widget.id)
-            self.icon_pad.configure(image=get_icon_image(self.widget.icon, 15, 15))
+            self.name = self.widget.id
 
     def initialize_tree(self):
         super(ComponentTreeView, self).initialize_tree()
@@ -43,6 +45,9 @@ class ComponentTreeView(MalleableTreeView):
         if len(self.nodes) == 0:
             self._show_empty(_("No items created yet"))
 
+    def _search_terms(self, node):
+        return node.name, node.widget.display_name
+
     def _show_empty(self, text):
         self._empty_text["text"] = text
         self._empty.place(x=0, y=0, relheight=1, relwidth=1)
@@ -52,7 +57,10 @@ class ComponentTreeView(MalleableTreeView):
 
     def search(self, query):
         if not super().search(query):
-            self._show_empty(_("No items match your search"))
+            if not self.nodes:
+                self._show_empty(_("No items created yet"))
+            else:
+                self._show_empty(_("No items match your search"))
         else:
             self._remove_empty()
 
@@ -114,6 +114,8 @@ class Designer(DesignPad, Container):
     RESIZE = 0x3
     WIDGET_INIT_PADDING = 20
     WIDGET_INIT_HEIGHT = 25
+    # approximate memory held by a deleted widget kept alive for undo/redo
+    WIDGET_FOOTPRINT = 4096
     name = "Designer"
     display_name = _("Designer")
     pane = None
@@ -196,7 +198,7 @@ class Designer(DesignPad, Container):
         self._skip_max = 4
         self._surge_delta = (0, 0)
         self._update_throttling()
-        self.studio.pref.add_listener(
+        self._throttling_listener = self.studio.pref.add_listener(
             "designer::frame_skip",
             self._update_throttling
         )
@@ -208,6 +210,10 @@ class Designer(DesignPad, Container):
         # do not touch
         self._xlink_map = {}
 
+    def destroy(self):
+        self.studio.pref.remove_listeners("designer::frame_skip", self._throttling_listener)
+        super().destroy()
+
     def clear_studio_bindings(self):
         for binding in self._studio_bindings:
             self.studio.unbind(binding)
@@ -221,17 +227,20 @@ class Designer(DesignPad, Container):
 
     def add_color_data(self, data):
         # Add all color properties to the color data for palette generation
-        for key, value in data.items():
-            if value["type"] == "color":
-                color = str(value["value"])
+        # Check the definitions first to avoid fetching values of non color properties
+        definitions = getattr(data, "definitions", data)
+        for key, definition in definitions.items():
+            if definition["type"] == "color":
+                color = str(data[key]["value"])
                 if color:
                     self.color_data[color] = self.color_data.get(color, 0) + 1
 
     def remove_color_data(self, data):
-        for key, value in data.items():
-            if value["type"] != "color":
+        definitions = getattr(data, "definitions", data)
+        for key, definition in definitions.items():
+            if definition["type"] != "color":
                 continue
-            color = str(value["value"])
+            color = str(data[key]["value"])
             if not color:
                 continue
             if color in self.color_data:
@@ -396,6 +405,19 @@ class Designer(DesignPad, Container):
                 progress.destroy()
             self._verify_version()
 
+    def load_tree(self, node, path=None):
+        """
+        Load a design from a node tree held in memory. Variables are
+        expected to already be available in the designer's context
+
+        :param node: root node of the design
+        :param path: file path the design is associated with if any
+        """
+        self.design_path = path
+        self.builder = DesignBuilder(self)
+        self.root_obj = self.builder.load_tree(node, self, variables=False)
+        self.context.on_load_complete()
+
     def reload(self, *__):
         if not self.design_path or self.studio.context != self.context:
             return
@@ -747,7 +769,8 @@ class Designer(DesignPad, Container):
                 self.studio.new_action(Action(
                     # Delete silently to prevent adding the event to the undo/redo stack
                     lambda _: self.delete([obj], True),
-                    lambda _: self.restore([obj], [restore_point], [obj.layout])
+                    lambda _: self.restore([obj], [restore_point], [obj.layout]),
+                    release_redo=lambda _: self._release_widgets([obj]),
                 ))
         elif obj.layout is None:
             # This only happens when adding the main layout. We dont need to add this action to the undo/redo stack
@@ -804,7 +827,8 @@ class Designer(DesignPad, Container):
             self.studio.new_action(Action(
                 # Delete silently to prevent adding the event to the undo/redo stack
                 lambda _: self.delete(objs, True),
-                lambda _: self.restore(objs, restore_points, [w.layout for w in objs])
+                lambda _: self.restore(objs, restore_points, [w.layout for w in objs]),
+                release_redo=lambda _: self._release_widgets(objs),
             ))
         return objs
 
@@ -838,7 +862,9 @@ class Designer(DesignPad, Container):
             layouts = [widget.layout for widget in widgets]
             action = Action(
                 lambda _: self.restore(widgets, restore_points, layouts),
-                lambda _: self.studio.delete(widgets, True)
+                lambda _: self.studio.delete(widgets, True),
+                release_undo=lambda _: self._release_widgets(widgets),
+                size=self._footprint(widgets),
             )
 
         for widget in widgets:
@@ -859,6 +885,28 @@ class Designer(DesignPad, Container):
         else:
             self.studio.delete(widgets, self)
 
+    def _footprint(self, widgets):
+        # approximate memory held by widgets and their descendants
+        count = 0
+        stack = list(widgets)
+        while stack:
+            widget = stack.pop()
+            count += 1
+            if isinstance(widget, Container):
+                stack.extend(widget.all_children)
+        return count * self.WIDGET_FOOTPRINT
+
+    def _release_widgets(self, widgets):
+        # Deleted widgets that can no longer be restored through undo/redo
+        # are destroyed to free the underlying tk resources
+        for widget in widgets:
+            if widget in self.objects:
+                continue
+            try:
+                widget.destroy()
+            except TclError:
+                pass
+
     def _uproot_widget(self, widget):
         # Recursively remove widgets and all its children
         self.remove_color_data(widget.properties)
@@ -1107,12 +1155,18 @@ class DesignContext(BaseContext):
 
     def __init__(self, master, studio, path=None):
         super(DesignContext, self).__init__(master, studio)
-        self.designer = Designer(self, studio)
-        self.designer.pack(fill="both", expand=True)
+        self.designer = None
+        self._create_designer()
         self.path = path
         self.icon = get_tk_image(self._formats.get(self.format_from_path(path), "file"), 15, 15)
         self.name = self.name_from_path(path) if path else self._create_name()
         self._loaded = False
+        # design tree and path of a hibernated design
+        self._snapshot = None
+
+    def _create_designer(self):
+        self.designer = Designer(self, self.studio)
+        self.designer.pack(fill="both", expand=True)
 
     def _create_name(self):
         DesignContext._untitled_count += 1
@@ -1147,7 +1201,12 @@ class DesignContext(BaseContext):
     def on_context_set(self):
         # lazy loading, only load when tab is brought into view for first time
         if not self._loaded:
-            if self.path:
+            if self._snapshot is not None:
+                # wake from hibernation
+                node, path = self._snapshot
+                self._snapshot = None
+                self.designer.load_tree(node, path)
+            elif self.path:
                 self.designer.open_file(self.path)
             else:
                 self.designer.open_new()
@@ -1160,6 +1219,28 @@ class DesignContext(BaseContext):
     def on_context_unset(self):
         self.designer.clear_studio_bindings()
 
+    def can_hibernate(self):
+        # Designs with unsaved changes are left alone
+        if not self._loaded or self.designer.root_obj is None or self.designer.has_changed():
+            return False
+        if self.has_undo() or self.has_redo():
+            # the history refers to the current widgets and cannot outlive them
+            return self.pref.get("studio::hibernate_with_history")
+        return True
+
+    def hibernate(self):
+        if self.studio.context == self or not self.can_hibernate():
+            return False
+        self._snapshot = self.designer.builder.root, self.designer.design_path
+        # cleared right away so the history does not keep the widgets alive
+        self._history.clear()
+        self.studio.on_context_hibernate(self)
+        # destroying the designer releases all the design widgets
+        self.designer.destroy()
+        self._create_designer()
+        self._loaded = False
+        return True
+
     def on_load_complete(self):
         # the design load thread is done
         self.update_save_status()
@@ -146,6 +146,7 @@ class EventPane(BaseFeature):
     name = "Event pane"
     display_name = _("Event pane")
     icon = "blank"
+    lazy = True
     _defaults = {
         **BaseFeature._defaults,
         "side": "right",
@@ -192,10 +193,11 @@ class EventPane(BaseFeature):
         self._search_btn.on_click(self.start_search)
 
         self._empty_frame = Label(self.bindings, **self.style.text_passive)
-        self._show_empty(self.NO_SELECTION_MSG)
+        self._suppress_change = False
+        # the pane may be created after widgets have been selected
+        self._on_select(None)
 
         self.studio.bind("<<SelectionChanged>>", self._on_select, "+")
-        self._suppress_change = False
 
     def _show_empty(self, message):
         self._empty_frame.place(x=0, y=0, relwidth=1, relheight=1)
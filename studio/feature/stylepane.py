@@ -5,17 +5,19 @@ Contains all the widget representations used in the designer and specifies all t
 # Copyright (C) 2019 Hoverset Group.                                      #
 # ======================================================================= #
 
+import bisect
 import logging
 from collections import defaultdict
 import tkinter as tk
 from tkinter import ttk
 
+from hoverset.data.search import SearchIndex
 from hoverset.ui.icons import get_icon_image
 from hoverset.ui.widgets import ScrolledFrame, Frame, Label, Button, TabView
 from hoverset.util.execution import Action
 from hoverset.platform import platform_is, LINUX
 from studio.feature._base import BaseFeature
-from studio.ui.editors import StyleItem, get_display_name, get_editor
+from studio.ui.editors import StyleItem, get_display_name, get_editor, get_editor_height
 from studio.ui.widgets import CollapseFrame
 from studio.lib.pseudo import Container, PseudoWidget
 from studio.lib.layouts import GridLayoutStrategy
@@ -119,6 +121,10 @@ class StyleGroup(CollapseFrame):
         self._prev_widget = None
         self._has_initialized = False  # Flag to mark whether Style Items have been created
         self.items = {}
+        # property names and display names indexed for search
+        self._search_index = SearchIndex()
+        # names of items hidden by the current search query
+        self._hidden = set()
         if self.get_pref("collapsed") and not self.self_positioned:
             self.collapse()
 
@@ -129,11 +135,17 @@ class StyleGroup(CollapseFrame):
     def can_optimize(self):
         return False
 
+    def _index_definition(self, name, definition):
+        self._search_index.add(name, definition["name"], definition["display_name"])
+
     def add(self, style_item):
         self.items[style_item.name] = style_item
+        self._index_definition(style_item.name, style_item.definition)
         if self.style_pane._search_query is not None:
             if self._match_query(style_item.definition, self.style_pane._search_query):
                 self._show(style_item)
+            else:
+                self._hidden.add(style_item.name)
             # make sure item is not available for reuse whether it
             # is displayed or not
             style_item._make_available(False)
@@ -143,6 +155,8 @@ class StyleGroup(CollapseFrame):
     def remove(self, style_item):
         if style_item.name in self.items:
             self.items.pop(style_item.name)
+            self._search_index.remove(style_item.name)
+            self._hidden.discard(style_item.name)
         self._hide(style_item)
 
     def _show(self, item):
@@ -164,7 +178,8 @@ class StyleGroup(CollapseFrame):
         pass
 
     def _match_query(self, definition, query):
-        return query in definition["name"] or query in definition["display_name"]
+        query = query.lower()
+        return query in definition["name"].lower() or query in definition["display_name"].lower()
 
     def _show_empty(self, text=None):
         self._empty.pack(fill="both", expand=True)
@@ -182,6 +197,7 @@ class StyleGroup(CollapseFrame):
         if self.can_optimize() and self.items:
             for prop in definitions:
                 self.items[prop]._re_purposed(definitions[prop])
+                self._index_definition(prop, definitions[prop])
         else:
             self.style_pane.show_loading()
             # this unmaps all style items returning them to the pool for reuse
@@ -189,6 +205,8 @@ class StyleGroup(CollapseFrame):
             # make all items held by group available for reuse
             ReusableStyleItem.free_all(self.items.values())
             self.items.clear()
+            self._search_index.clear()
+            self._hidden.clear()
             add = self.add
             list(map(lambda p: add(ReusableStyleItem.acquire(self, definitions[p], self.apply), ), sorted(definitions)))
             if not self.items:
@@ -206,6 +224,14 @@ class StyleGroup(CollapseFrame):
     def _get_action_data(self, widget, prop):
         return {}
 
+    def _compact_action_data(self, data, new_data):
+        # only keep entries that actually changed to keep undo history small
+        for old, new in zip(data, new_data):
+            if isinstance(old, dict) and isinstance(new, dict):
+                for key in [k for k in old if k in new and old[k] == new[k]]:
+                    old.pop(key)
+                    new.pop(key)
+
     def _get_key(self, widgets, prop):
         return f"{'.'.join([w.id for w in widgets])}:{self.__class__.__name__}:{prop}"
 
@@ -222,9 +248,10 @@ class StyleGroup(CollapseFrame):
             else:
                 [self._set_prop(prop, value, widget) for widget in widgets]
             new_data = [self._get_action_data(widget, prop) for widget in widgets]
+            self._compact_action_data(data, new_data)
             self.style_pane.widgets_modified(widgets)
             if is_external:
-                if widgets == self.widgets:
+                if widgets == self.widgets and prop in self.items:
                     self.items[prop].set_silently(value)
             if silent:
                 return
@@ -252,21 +279,30 @@ class StyleGroup(CollapseFrame):
         return True
 
     def on_search_query(self, query):
-        item_found = False
-        for item in self.items.values():
-            if self._match_query(item.definition, query):
-                self._show(item)
-                item_found = True
-            else:
-                self._hide(item)
-        if not item_found:
-            self._show_empty(_("No items match your search"))
-        else:
+        hidden = self.items.keys() - self._search_index.search(query)
+        for name in hidden - self._hidden:
+            self._hide(self.items[name])
+        revealed = self._hidden - hidden
+        if revealed:
+            # pack revealed items before their next visible sibling to maintain order
+            next_item = None
+            for name in reversed(list(self.items)):
+                if name in hidden:
+                    continue
+                item = self.items[name]
+                if name in revealed:
+                    self._show(item)
+                    if next_item is not None:
+                        item.pack_configure(before=next_item)
+                next_item = item
+        self._hidden = hidden
+        if len(hidden) < len(self.items):
             self._remove_empty()
+        elif self.items:
+            self._show_empty(_("No items match your search"))
 
     def on_search_clear(self):
         # Calling search query with empty query ensures all items are displayed
-        self.clear_children()
         self.on_search_query("")
 
     def set_pref(self, short_path, value):
@@ -286,6 +322,165 @@ class StyleGroup(CollapseFrame):
             self.set_pref("collapsed", False)
 
 
+class VirtualStyleGroup(StyleGroup):
+    """
+    Style group that only renders the style items visible in the style
+    pane viewport. Rows have fixed heights determined by their editors
+    so items can be recycled as the pane is scrolled without measuring
+    """
+    # rows rendered beyond the edges of the viewport to reduce flicker
+    overscan = 2
+    # vertical padding around each row
+    row_padding = 1
+
+    def __init__(self, master, pane, **cnf):
+        super().__init__(master, pane, **cnf)
+        self._definitions = {}
+        # sorted names of all definitions
+        self._names = []
+        # names of displayed rows in order
+        self._rows = []
+        # y offset of each row with the total height as the last entry
+        self._offsets = [0]
+        # rendered items no longer in view and available for reuse
+        self._free = []
+        self._query = None
+        self._render_pending = False
+        self._rows_frame = Frame(self.body, **self.style.surface, height=0)
+        self._rows_frame.pack(side="top", fill="x")
+        self.style_pane.body.on_scroll(self._schedule_render)
+        self.bind("<Configure>", self._schedule_render, add="+")
+
+    def _row_height(self, definition):
+        return get_editor_height(definition) + self.row_padding * 2
+
+    def _layout_rows(self, refresh=True):
+        definitions = self._definitions
+        if self._query is None:
+            rows = self._names
+        else:
+            matches = self._search_index.search(self._query)
+            rows = [name for name in self._names if name in matches]
+        if not refresh and rows == self._rows:
+            return
+        self._rows = rows
+        offsets = [0]
+        for name in self._rows:
+            offsets.append(offsets[-1] + self._row_height(definitions[name]))
+        self._offsets = offsets
+        self._rows_frame.configure(height=max(offsets[-1], 1))
+        if refresh:
+            # everything rendered has to be repurposed for the new rows
+            self._free.extend(self.items.values())
+            self.items.clear()
+        else:
+            # rows still displayed keep their items and are only moved
+            displayed = set(rows)
+            for name in [name for name in self.items if name not in displayed]:
+                self._free.append(self.items.pop(name))
+        if self._rows:
+            self._remove_empty()
+        elif self._query is not None:
+            self._show_empty(_("No items match your search"))
+        else:
+            self._show_empty()
+        self._render()
+
+    def _schedule_render(self, *_):
+        if self._render_pending:
+            return
+        self._render_pending = True
+        self.after_idle(self._render)
+
+    def _visible_range(self):
+        scrolled = self.style_pane.body
+        try:
+            top, bottom = scrolled.viewport()
+            y = self._rows_frame.winfo_rooty() - scrolled.body.winfo_rooty()
+        except tk.TclError:
+            return 0, 0
+        first = bisect.bisect_right(self._offsets, top - y) - 1
+        last = bisect.bisect_left(self._offsets, bottom - y)
+        return max(first - self.overscan, 0), min(last + self.overscan, len(self._rows))
+
+    def _acquire(self, definition):
+        editor_type = definition["type"]
+        for index, item in enumerate(self._free):
+            if item._editor.style_def["type"] == editor_type:
+                return self._free.pop(index)._re_purposed(definition, self.apply)
+        if self._free:
+            return self._free.pop()._re_purposed(definition, self.apply)
+        return ReusableStyleItem(self, definition, self.apply)
+
+    def _render(self):
+        self._render_pending = False
+        if not self._rows or self._collapsed:
+            first, last = 0, 0
+        else:
+            first, last = self._visible_range()
+        visible = self._rows[first:last]
+        for name in list(self.items):
+            if name not in visible:
+                self._free.append(self.items.pop(name))
+
+        for index, name in enumerate(visible, start=first):
+            item = self.items.get(name)
+            if item is None:
+                item = self.items[name] = self._acquire(self._definitions[name])
+            item.place(
+                in_=self._rows_frame, x=0, y=self._offsets[index] + self.row_padding,
+                relwidth=1, height=self._offsets[index + 1] - self._offsets[index] - self.row_padding * 2
+            )
+
+        for item in self._free:
+            item.place_forget()
+
+    def on_widgets_change(self):
+        if not self.widgets:
+            self.collapse()
+            return
+        definitions = self.get_definition() or {}
+        for name in self._definitions.keys() - definitions.keys():
+            self._search_index.remove(name)
+        for name, definition in definitions.items():
+            # no-op for definitions already indexed under the same names
+            self._index_definition(name, definition)
+        self._definitions = definitions
+        self._names = sorted(definitions)
+        self._query = self.style_pane._search_query
+        self._layout_rows()
+        self._has_initialized = True
+        self._prev_widgets = self.widgets
+
+    def apply(self, prop, value, widgets=None, silent=False):
+        super().apply(prop, value, widgets, silent)
+        if prop not in self._definitions or not self.widgets:
+            return
+        # keep cached definition in sync for rows rendered later
+        values = [self._get_prop(prop, widget) for widget in self.widgets]
+        value = values[0] if all(v == values[0] for v in values) else ''
+        self._definitions[prop] = dict(self._definitions[prop], value=value)
+
+    def clear_children(self):
+        self._free.extend(self.items.values())
+        self.items.clear()
+        for item in self._free:
+            item.place_forget()
+        self._remove_empty()
+
+    def on_search_query(self, query):
+        self._query = query
+        self._layout_rows(refresh=False)
+
+    def on_search_clear(self):
+        self._query = None
+        self._layout_rows(refresh=False)
+
+    def expand(self, *_):
+        super().expand()
+        self._schedule_render()
+
+
 class IdentityGroup(StyleGroup):
 
     def __init__(self, master, pane, **cnf):
@@ -306,12 +501,11 @@ class IdentityGroup(StyleGroup):
         return len(self.widgets) == 1
 
 
-class AttributeGroup(StyleGroup):
+class AttributeGroup(VirtualStyleGroup):
 
     def __init__(self, master, pane, **cnf):
         super().__init__(master, pane, **cnf)
         self.label = _("Attributes")
-        self._prev_classes = set()
 
     def get_definition(self):
         if self.widgets and all(isinstance(widget, PseudoWidget) for widget in self.widgets):
@@ -335,13 +529,6 @@ class AttributeGroup(StyleGroup):
             if has_change:
                 self.style_pane._layout_group.on_widgets_change()
 
-    def can_optimize(self):
-        classes = set(w.__class__ for w in self.widgets)
-        if classes != self._prev_classes:
-            self._prev_classes = classes
-            return False
-        return True
-
 
 class ColumnConfig(StyleGroup):
 
@@ -21,6 +21,7 @@ class VariablePane(BaseFeature):
     name = "Variablepane"
     display_name = _("Variables")
     icon = "text"
+    lazy = True
 
     _defaults = {
         **BaseFeature._defaults,
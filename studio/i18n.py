@@ -3,7 +3,7 @@ import logging
 
 from hoverset.data.i18n import register_translator, _translator, set_locale
 from hoverset.data.utils import get_resource_path
-from hoverset.data.preferences import open_raw_shelve
+from hoverset.data.preferences import read_raw
 import studio
 
 app_name = "studio"
@@ -12,9 +12,7 @@ register_translator(app_name, locale_dir)
 
 # set locale hack
 try:
-    with open_raw_shelve("formation", "hoverset", "config") as pref:
-        locale = pref["locale"]["language"]
-        set_locale(locale)
+    set_locale(read_raw("formation", "hoverset", "config", "locale::language"))
 except Exception as e:
     logging.error(e)
 
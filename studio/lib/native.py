@@ -214,7 +214,7 @@ class VerticalPanedWindow(PanedContainer, ttk.PanedWindow):
 
     @property
     def properties(self):
-        properties = dict(**super().properties)
+        properties = super().properties
         properties.pop("orient")
         return properties
 
@@ -240,7 +240,7 @@ class HorizontalPanedWindow(PanedContainer, ttk.PanedWindow):
 
     @property
     def properties(self):
-        properties = dict(**super().properties)
+        properties = super().properties
         properties.pop("orient")
         return properties
 
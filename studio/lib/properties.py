@@ -2,6 +2,7 @@
 Contains all the widget properties used in the designer and specifies all the styles that can be applied to a widget
 """
 import tkinter
+from collections.abc import MutableMapping
 
 # ======================================================================= #
 # Copyright (C) 2019 Hoverset Group.                                      #
@@ -720,21 +721,106 @@ def get_resolved(prop, overrides, *property_tables):
     return {}
 
 
-def get_properties(widget, extern_overrides=None):
-    properties = widget.config()
-    resolved_properties = {}
+# Resolved property definitions shared by all instances of a widget class
+_class_properties = {}
+
+
+def get_class_properties(widget, extern_overrides=None):
+    """
+    Return resolved property definitions (without values) for the class of
+    ``widget``. The definitions are computed once per class and overrides and
+    are shared between all instances so they should never be modified in place.
+    """
     # use extern overrides if DEF_OVERRIDES are not found
     overrides = getattr(widget, "DEF_OVERRIDES", extern_overrides or {})
-    for prop in properties:
+    # proxies for widgets of several classes provide the class the properties depend on
+    key = getattr(widget, "property_class", None) or widget.__class__
+    cached = _class_properties.get(key)
+    if cached is not None and (cached[0] is overrides or cached[0] == overrides):
+        return cached[1]
+
+    resolved_properties = {}
+    for prop in widget.config():
         definition = get_resolved(prop, overrides, PROPERTY_TABLE)
         if definition:
-            # TODO Remove this fix when no longer needed
-            definition.update(value=widget.get_prop(prop) if hasattr(widget, "get_prop") else widget[prop])
             resolved_properties[prop] = definition
-
+    _class_properties[key] = (overrides, resolved_properties)
     return resolved_properties
 
 
+class PropertyMap(MutableMapping):
+    """
+    Mapping of property definitions for a single widget. Definitions are
+    shared at the class level and values are only fetched from the widget
+    when a property is accessed.
+    """
+    __slots__ = ("_widget", "_definitions", "_resolved", "_owned")
+
+    def __init__(self, widget, definitions):
+        self._widget = widget
+        self._definitions = definitions
+        self._resolved = {}
+        self._owned = False
+
+    @property
+    def definitions(self):
+        return self._definitions
+
+    def _own_definitions(self):
+        # copy on write to avoid altering the shared class definitions
+        if not self._owned:
+            self._definitions = dict(self._definitions)
+            self._owned = True
+        return self._definitions
+
+    def _get_value(self, prop):
+        if hasattr(self._widget, "get_prop"):
+            return self._widget.get_prop(prop)
+        return self._widget[prop]
+
+    def prefetch(self, props):
+        """
+        Resolve the values of ``props`` in bulk if the widget supports
+        fetching multiple values at once
+        """
+        get_props = getattr(self._widget, "get_props", None)
+        pending = [prop for prop in props if prop not in self._resolved]
+        if get_props is None or not pending:
+            return
+        values = get_props(pending)
+        for prop in pending:
+            self._resolved[prop] = dict(self._definitions[prop], value=values[prop])
+
+    def __getitem__(self, prop):
+        if prop not in self._resolved:
+            definition = self._definitions[prop]
+            self._resolved[prop] = dict(definition, value=self._get_value(prop))
+        return self._resolved[prop]
+
+    def __setitem__(self, prop, definition):
+        self._own_definitions()[prop] = definition
+        self._resolved[prop] = definition
+
+    def __delitem__(self, prop):
+        del self._own_definitions()[prop]
+        self._resolved.pop(prop, None)
+
+    def __iter__(self):
+        return iter(self._definitions)
+
+    def __len__(self):
+        return len(self._definitions)
+
+    def __contains__(self, prop):
+        return prop in self._definitions
+
+
+def get_properties(widget, extern_overrides=None):
+    definitions = get_class_properties(widget, extern_overrides)
+    properties = PropertyMap(widget, definitions)
+    return {prop: properties[prop] for prop in properties}
+
+
 def combine_properties(properties):
     """
     Return a dict of properties that are common to all widgets in the list.
@@ -758,6 +844,26 @@ def combine_properties(properties):
     return common_properties
 
 
+# Property names common to a set of widget classes
+_common_properties = {}
+
+
+def _get_common_properties(widgets, properties):
+    # intersect the property tables of the distinct classes only
+    classes = {}
+    for widget, props in zip(widgets, properties):
+        classes.setdefault(widget.__class__, props)
+    key = frozenset(classes)
+    if key not in _common_properties:
+        tables = iter(classes.values())
+        common = set(next(tables))
+        for table in tables:
+            common.intersection_update(table)
+        # preserve the ordering of the first widget's table
+        _common_properties[key] = tuple(prop for prop in properties[0] if prop in common)
+    return _common_properties[key]
+
+
 def get_combined_properties(widgets):
     """
     Return a dict of properties that are common to all widgets in the list.
@@ -767,5 +873,23 @@ def get_combined_properties(widgets):
 
     # get all the properties for each widget
     properties = [widget.properties for widget in widgets]
+    if not all(isinstance(p, PropertyMap) for p in properties):
+        return combine_properties(properties)
+
+    common = _get_common_properties(widgets, properties)
+    # only fetch values for the common properties
+    for props in properties:
+        props.prefetch(common)
+
+    first, others = properties[0], properties[1:]
+    combined = {}
+    for prop in common:
+        definition = first[prop]
+        value = definition['value']
+        for props in others:
+            if props[prop]['value'] != value:
+                definition = dict(definition, value='')
+                break
+        combined[prop] = definition
 
-    return combine_properties(properties)
+    return combined
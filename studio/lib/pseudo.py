@@ -12,7 +12,7 @@ from hoverset.ui.widgets import EventMask
 from hoverset.util.execution import import_path
 from studio.lib import layouts
 from studio.lib.variables import VariableManager
-from studio.lib.properties import get_properties
+from studio.lib.properties import get_class_properties, PropertyMap
 from studio.lib.handles import BoxHandle
 from studio.ui.tree import MalleableTree
 from studio.i18n import _
@@ -158,7 +158,7 @@ class PseudoWidget:
         self.layout = None
         self.recent_layout_info = None
         self.last_stable_bounds = None
-        self._properties = get_properties(self)
+        self._properties = get_class_properties(self)
         self.set_name(self.id)
         self.node = None
         self.__on_context = None
@@ -391,6 +391,33 @@ class PseudoWidget:
             val = self.clean_value(val)
         return val
 
+    def get_props(self, props):
+        """
+        Fetch the values of multiple properties. Where possible, values are
+        read from a single configure query rather than one query per property
+        :param props: names of the properties to fetch
+        :return: dict mapping property names to their values
+        """
+        config = {}
+        # only batch for widgets that do not customize property lookup
+        if type(self).cget is tkinter.Misc.cget and type(self).get_prop in _batch_safe_getters:
+            try:
+                config = tkinter.Misc.configure(self)
+            except (tkinter.TclError, TypeError):
+                config = {}
+        values = {}
+        for prop in props:
+            entry = config.get(prop)
+            # aliases such as 'bd' only have two fields and are fetched normally
+            if prop in self._intercepts or entry is None or len(entry) != 5:
+                values[prop] = self.get_prop(prop)
+                continue
+            value = entry[-1]
+            if prop in self.clean_fields:
+                value = self.clean_value(value)
+            values[prop] = value
+        return values
+
     def has_init(self):
         return getattr(self, "_has_init", False)
 
@@ -422,13 +449,12 @@ class PseudoWidget:
 
     @property
     def properties(self):
-        for key in self._properties:
-            self._properties[key]["value"] = self.get_prop(key)
-        return self._properties
+        # values are only fetched for the properties actually accessed
+        return PropertyMap(self, self._properties)
 
     def property_def(self, prop):
         if not hasattr(self, "_properties"):
-            self._properties = get_properties(self)
+            self._properties = get_class_properties(self)
         return self._properties.get(prop)
 
     def create_menu(self):
@@ -800,6 +826,10 @@ class PanedContainer(TabContainer):
         self.add_new(legacy.Frame, 0, 0)
 
 
+# get_prop implementations that agree with a batched configure query
+_batch_safe_getters = (PseudoWidget.get_prop, Container.get_prop)
+
+
 class WidgetMeta(type):
 
     def __new__(mcs, name, bases, dct):
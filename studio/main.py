@@ -4,8 +4,8 @@
 
 import functools
 import os
-import subprocess
 import sys
+import threading
 import time
 import tkinter
 import webbrowser
@@ -35,9 +35,11 @@ from hoverset.util.execution import Action
 from hoverset.data.i18n import set_locale
 from studio.context import BaseContext
 from studio.feature import FEATURES, StylePane, ComponentPane
-from studio.feature._base import BaseFeature, FeaturePane
+from studio.feature._base import BaseFeature, FeaturePane, LazyFeature
 from studio.feature.design import DesignContext, MultiSaveDialog
 from studio.preferences import Preferences, open_preferences
+from studio.preview import PreviewServer
+from studio.profiling import startup_profiler
 from studio.resource_loader import ResourceLoader
 from studio.selection import Selection
 from studio.tools import ToolManager
@@ -57,6 +59,8 @@ class StudioApplication(Application):
         ICON_PATH = get_resource_path(studio, "resources/images/formation_icon.png")
     THEME_PATH = pref.get("resource::theme")
     dirs = platformdirs.AppDirs(appname="formation", appauthor="hoverset")
+    # interval in milliseconds between checks for contexts to hibernate
+    HIBERNATION_INTERVAL = 60000
 
     def __init__(self, master=None, **cnf):
         super().__init__(master, **cnf)
@@ -91,7 +95,7 @@ class StudioApplication(Application):
 
         self._bin = []
         self._clipboard = None
-        self.current_preview = None
+        self.preview_server = PreviewServer()
 
         self._pane.add(self._left, minsize=360, width=320, sticky='nswe', stretch='never')
         self._pane.add(self._center, stretch="always", sticky='nswe')
@@ -256,6 +260,8 @@ class StudioApplication(Application):
             self.createcommand("tk::mac::Quit", lambda: actions.get('STUDIO_EXIT').invoke())
 
         self.features = []
+        # hidden features not created yet
+        self._lazy_features = {}
         self.context = None
         self.contexts = []
         self.tab_view = TabView(self._center)
@@ -283,12 +289,15 @@ class StudioApplication(Application):
         # initialize tools with everything ready
         self.tool_manager.initialize()
 
-        if pref.get("studio::allow_thirdparty"):
-            # initialize externals
-            init_externals(self)
+        # third party integrations are initialized once the studio is idle
+        # or earlier if a design requires them
+        self._externals_ready = threading.Event()
+        self.after_idle(self.load_externals)
 
         self._ignore_tab_status = False
-        self._startup()
+        with startup_profiler.measure("startup"):
+            self._startup()
+        self.after(self.HIBERNATION_INTERVAL, self._hibernate_contexts)
         self._exit_failures = 0
         self._is_shutting_down = False
 
@@ -312,9 +321,11 @@ class StudioApplication(Application):
         selected = self.tab_view.selected
         if isinstance(self.context, BaseContext):
             self.context.on_context_unset()
+            self.context.last_active = time.time()
 
         if isinstance(selected, BaseContext):
             self.context = selected
+            self.context.last_active = time.time()
         else:
             self.context = None
 
@@ -343,6 +354,30 @@ class StudioApplication(Application):
         self.tool_manager.on_context_close(context)
         self.save_tab_status()
 
+    def on_context_hibernate(self, context):
+        for feature in self.features:
+            feature.on_context_hibernate(context)
+        self.tool_manager.on_context_close(context)
+
+    def _hibernate_contexts(self):
+        # Hibernate contexts idle for too long and the least recently used
+        # contexts when there are more awake contexts than allowed
+        idle_time = pref.get("studio::hibernate_after") * 60
+        max_awake = pref.get("studio::max_awake_tabs")
+        now = time.time()
+        candidates = sorted(
+            (c for c in self.contexts if c != self.context and c.can_hibernate()),
+            key=lambda c: c.last_active
+        )
+        # the current context is always awake
+        awake = len(candidates) + 1
+        for context in candidates:
+            excess = max_awake and awake > max_awake
+            if excess or (idle_time and now - context.last_active > idle_time):
+                if context.hibernate():
+                    awake -= 1
+        self.after(self.HIBERNATION_INTERVAL, self._hibernate_contexts)
+
     def on_context_add(self, _):
         self._show_empty(None)
 
@@ -658,8 +693,43 @@ class StudioApplication(Application):
             feature.set_pref("side", side)
             bar.add_feature(feature)
 
+    def load_externals(self):
+        """
+        Initialize third party integrations if they have not been initialized yet.
+        Integrations create widgets so they are always initialized on the main
+        thread, calls from other threads wait for the initialization to complete
+
+        :return: ``True`` if integrations were initialized during this call
+        """
+        if self._externals_ready.is_set():
+            return False
+        if threading.current_thread() is not threading.main_thread():
+            self.after(0, self.load_externals)
+            self._externals_ready.wait()
+            return True
+        try:
+            if pref.get("studio::allow_thirdparty"):
+                with startup_profiler.measure("init externals"):
+                    init_externals(self)
+        finally:
+            # only mark as ready once done so other threads never see partial registrations
+            self._externals_ready.set()
+        return True
+
     def install(self, feature) -> BaseFeature:
-        obj = feature(self, self)
+        if feature.lazy:
+            stub = LazyFeature(feature, self)
+            if not stub.get_pref('visible'):
+                # defer creation until the feature is shown
+                self._lazy_features[feature] = stub
+                feature._loader = functools.partial(self.get_feature, feature)
+                _, bar = self._panes.get(stub.get_pref('side'), (self._left, self._left_bar))
+                if bar is not None:
+                    bar.add_feature(stub)
+                    bar.deselect(stub)
+                return stub
+        with startup_profiler.measure(f"init {feature.name}"):
+            obj = feature(self, self)
         pane, bar = self._panes.get(obj.get_pref('side'), (self._left, self._left_bar))
         obj.pane = pane
         obj.bar = bar
@@ -781,15 +851,33 @@ class StudioApplication(Application):
         for feature in self.features:
             if feature.__class__ == feature_class:
                 return feature
+        if feature_class in self._lazy_features:
+            return self._load_feature(feature_class)
         # returns None by if feature is not found
 
+    def _load_feature(self, feature_class):
+        # create a lazy feature in place of its stub
+        stub = self._lazy_features.pop(feature_class)
+        feature_class._loader = None
+        obj = feature_class(self, self)
+        pane, bar = self._panes.get(obj.get_pref('side'), (self._left, self._left_bar))
+        obj.pane = pane
+        obj.bar = bar
+        self.features.append(obj)
+        if bar is not None:
+            bar.change_feature(obj, stub)
+            bar.deselect(obj)
+        # catch up with the current state of the studio
+        obj.on_context_switch()
+        return obj
+
     def get_features_as_menu(self):
         # For each feature we create a menu template
         # The command value is the self.maximize method which will reopen the feature
         return [("checkbutton",  # Type
                  f.display_name, None,  # Label, image
                  functools.partial(f.toggle),  # Command built from feature
-                 {"variable": f.is_visible}) for f in self.features]
+                 {"variable": f.is_visible}) for f in (*self.features, *self._lazy_features.values())]
 
     def save_window_positions(self):
         for feature in self.features:
@@ -992,27 +1080,16 @@ class StudioApplication(Application):
                 title=_('Empty design'),
                 message=_('There is nothing to preview. Please add a root widget'))
             return
-        # close previous preview if any
-        self.close_preview()
-        # extract extension from path
-        path = self.designer.design_path or ''
-        ext = os.path.splitext(path)[-1]
-        ext = ext or '.json'
-        path = os.path.join(self.dirs.user_cache_dir, f"temp_design{ext}")
-        self.designer.to_tree().write(path)
-        self.current_preview = subprocess.Popen([
-            sys.executable, "-m", "formation",
-            path, os.path.dirname(self.designer.design_path or ''),
-            *pref.get(ComponentPane._custom_pref_path)
-        ])
+        builder = self.designer.to_tree()
+        builder.generate()
+        # the preview server replaces any previous preview
+        self.preview_server.show(
+            builder.root, os.path.dirname(self.designer.design_path or ''),
+            pref.get(ComponentPane._custom_pref_path)
+        )
 
     def close_preview(self):
-        if self.current_preview:
-            try:
-                self.current_preview.terminate()
-            except tkinter.TclError:
-                pass
-            self.current_preview = None
+        self.preview_server.close()
 
     def reload(self):
         if self.designer:
@@ -1047,6 +1124,7 @@ class StudioApplication(Application):
             if not self.tool_manager.on_app_close() or not self.check_unsaved_changes():
                 self._is_shutting_down = False
                 return False
+            self.preview_server.stop()
             self.quit()
             return True
         except Exception:
@@ -1168,8 +1246,12 @@ def restart():
 def main():
     # load resources first
     set_locale(pref.get("locale::language"))
-    ResourceLoader.load(pref)
-    StudioApplication(className='Formation Studio').mainloop()
+    with startup_profiler.measure("load resources"):
+        ResourceLoader.load(pref)
+    studio = StudioApplication(className='Formation Studio')
+    if startup_profiler.enabled:
+        studio.after_idle(startup_profiler.report)
+    studio.mainloop()
 
 
 if __name__ == "__main__":
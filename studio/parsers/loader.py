@@ -42,6 +42,13 @@ class BaseStudioAdapter(BaseAdapter):
         "menu",
     )
 
+    @staticmethod
+    def _find_registered(components, module, impl):
+        return list(filter(
+            lambda comp: comp.impl.__module__ == module and comp.impl.__name__ == impl,
+            components.registered_widgets,
+        ))
+
     @classmethod
     def _get_class(cls, node):
         module, impl = node.get_mod_impl()
@@ -50,10 +57,10 @@ class BaseStudioAdapter(BaseAdapter):
         else:
             # search custom widgets
             components: ComponentPane = ComponentPane.get_instance()
-            component = list(filter(
-                lambda comp: comp.impl.__module__ == module and comp.impl.__name__ == impl,
-                components.registered_widgets,
-            ))
+            component = cls._find_registered(components, module, impl)
+            if not component and components.studio.load_externals():
+                # widget may be provided by a third party integration not yet initialized
+                component = cls._find_registered(components, module, impl)
             if component:
                 return component[0]
             else:
@@ -330,10 +337,23 @@ class DesignBuilder:
         return self._adapter_map.get(widget_class, BaseStudioAdapter)
 
     def load(self, path, designer):
+        return self.load_tree(infer_format(path)(path=path).load(), designer)
+
+    def load_tree(self, node, designer, variables=True):
+        """
+        Load a design from a node tree already in memory
+
+        :param node: root node of the design
+        :param designer: designer to load the design into
+        :param variables: set to False to skip loading variables for instance
+          if they are already available in the designer's context
+        :return: the root widget
+        """
         designer._deferred_props = []
-        self.root = infer_format(path)(path=path).load()
+        self.root = node
         self._load_meta(self.root, designer)
-        self._load_variables(self.root)
+        if variables:
+            self._load_variables(self.root)
         self._loaded_objs.clear()
         root = self._load_widgets(self.root, designer, designer)
         self._post_process(designer)
@@ -32,6 +32,10 @@ defaults = {
         "smoothness": 3,
         "use_undo_depth": True,
         "undo_depth": 30,
+        "undo_memory": 64,
+        "hibernate_after": 30,
+        "max_awake_tabs": 8,
+        "hibernate_with_history": False,
         "custom_widget_paths": [],
         "allow_thirdparty": True,
         "check_updates": True,
@@ -155,6 +159,37 @@ def _templates():
                         },
                     )
                 }),
+                {
+                    "desc": _("Undo memory limit (MB)"),
+                    "path": "studio::undo_memory",
+                    "element": Number,
+                    "extra": {
+                        "width": 4,
+                    }
+                },
+            ),
+            _("Inactive tabs"): (
+                {
+                    "desc": _("Hibernate tabs inactive for (minutes)"),
+                    "path": "studio::hibernate_after",
+                    "element": Number,
+                    "extra": {
+                        "width": 4,
+                    }
+                },
+                {
+                    "desc": _("Maximum tabs kept awake"),
+                    "path": "studio::max_awake_tabs",
+                    "element": Number,
+                    "extra": {
+                        "width": 4,
+                    }
+                },
+                {
+                    "desc": _("Hibernate saved tabs with undo history (clears the history)"),
+                    "path": "studio::hibernate_with_history",
+                    "element": Check,
+                },
             ),
             _("Start up"): (
                 {
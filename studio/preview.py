@@ -0,0 +1,93 @@
+"""
+Client for the long running preview server in :py:mod:`formation.preview`
+"""
+# ======================================================================= #
+# Copyright (C) 2024 Hoverset Group.                                      #
+# ======================================================================= #
+import json
+import logging
+import subprocess
+import sys
+
+from formation.formats import JSONFormat
+
+
+class PreviewServer:
+    """
+    Manages a preview server process. The process is started on the first
+    preview and reused for subsequent previews. It is restarted if it has
+    exited, for instance if user code in a custom widget crashed it, or if
+    the custom widget paths change since modules already imported by the
+    server would otherwise be stale
+    """
+
+    def __init__(self):
+        self._process = None
+        self._paths = None
+
+    @property
+    def is_alive(self):
+        return self._process is not None and self._process.poll() is None
+
+    def _start(self, paths):
+        self.stop()
+        self._process = subprocess.Popen(
+            [sys.executable, "-m", "formation.preview"],
+            stdin=subprocess.PIPE, text=True
+        )
+        self._paths = paths
+
+    def _send(self, message):
+        self._process.stdin.write(json.dumps(message) + "\n")
+        self._process.stdin.flush()
+
+    def show(self, node, working_dir='', paths=()):
+        """
+        Display a design in the preview server replacing any current preview
+
+        :param node: root :py:class:`~formation.formats.Node` of the design
+        :param working_dir: directory relative paths in the design are resolved from
+        :param paths: custom widget paths
+        """
+        paths = list(paths)
+        message = {
+            "cmd": "load",
+            "design": JSONFormat(node=node).generate(compact=True),
+            "dir": working_dir,
+            "paths": paths,
+        }
+        if not self.is_alive or paths != self._paths:
+            self._start(paths)
+        try:
+            self._send(message)
+        except OSError:
+            # server died after the check, start a new one and retry once
+            self._start(paths)
+            self._send(message)
+
+    def close(self):
+        """
+        Close the current preview if any leaving the server running
+        """
+        if not self.is_alive:
+            return
+        try:
+            self._send({"cmd": "close"})
+        except OSError:
+            pass
+
+    def stop(self):
+        """
+        Stop the server process
+        """
+        if self._process is None:
+            return
+        if self._process.poll() is None:
+            try:
+                self._send({"cmd": "exit"})
+                self._process.stdin.close()
+                self._process.wait(1)
+            except (OSError, subprocess.TimeoutExpired):
+                logging.debug("Preview server did not exit, terminating")
+                self._process.terminate()
+        self._process = None
@@ -0,0 +1,78 @@
+"""
+Startup profiling for the studio. Enabled with the ``--profile-startup``
+command line option, in which case the time taken to import and initialise
+each feature is reported once the studio is ready.
+"""
+# ======================================================================= #
+# Copyright (C) 2024 Hoverset Group.                                      #
+# ======================================================================= #
+import contextlib
+import importlib
+import importlib.util
+import pkgutil
+import sys
+import time
+
+
+class StartupProfiler:
+
+    def __init__(self):
+        self.enabled = False
+        self.records = []
+        self._start = time.perf_counter()
+
+    def enable(self):
+        self.enabled = True
+        self.records.clear()
+        self._start = time.perf_counter()
+
+    @contextlib.contextmanager
+    def measure(self, label):
+        """
+        Record the time taken to execute the enclosed block if profiling is enabled
+
+        :param label: description of the block
+        """
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.records.append((label, time.perf_counter() - start))
+
+    def import_package(self, package):
+        """
+        Import all modules in a package one at a time recording the time taken
+        by each. Modules imported first are also charged for any dependencies
+        they share with modules imported later.
+
+        :param package: dotted name of the package
+        """
+        spec = importlib.util.find_spec(package)
+        for module in pkgutil.iter_modules(spec.submodule_search_locations):
+            name = f"{package}.{module.name}"
+            if name in sys.modules:
+                continue
+            with self.measure(f"import {name}"):
+                importlib.import_module(name)
+
+    def report(self, stream=None):
+        """
+        Write the recorded timings in milliseconds
+
+        :param stream: output stream defaults to stderr
+        """
+        stream = stream or sys.stderr
+        width = max((len(label) for label, _ in self.records), default=0)
+        stream.write("Startup profile (ms)\n")
+        for label, duration in self.records:
+            stream.write(f"  {label:<{width}}  {duration * 1000:>9.1f}\n")
+        total = time.perf_counter() - self._start
+        stream.write(f"  {'total':<{width}}  {total * 1000:>9.1f}\n")
+        stream.flush()
+
+
+# shared profiler for the running studio
+startup_profiler = StartupProfiler()
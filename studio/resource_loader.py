@@ -1,6 +1,7 @@
 import os
 import io
 import shelve
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import sys
 import time
 import traceback
@@ -8,6 +9,7 @@ from hashlib import md5
 import shutil
 from PIL import Image
 
+from hoverset.data.atlas import build_atlas
 from hoverset.data.images import (
     set_image_resource_path,
     get_resource_path,
@@ -24,6 +26,13 @@ from hoverset.platform import windowing_is, X11
 from studio.i18n import _
 
 
+def _recolor_png(data, color):
+    recolored = _recolor(Image.open(io.BytesIO(data)), color)
+    recolored_bytes = io.BytesIO()
+    recolored.save(recolored_bytes, format="PNG")
+    return recolored_bytes.getvalue()
+
+
 class ResourceLoader(Application):
     _default_icon_path = _primary_location
     _cache_icon_path = _primary_location
@@ -121,7 +130,7 @@ class ResourceLoader(Application):
         cache_color = pref.get("resource::icon_cache_color")
         style = StyleDelegator(get_theme_path(pref.get("resource::theme")))
         cache_path = pref.get_cache_dir()
-        cls._cache_icon_path = os.path.join(cache_path, "image")
+        cls._cache_icon_path = os.path.join(cache_path, "image.atlas")
         if style.colors["accent"] != cache_color \
                 or not cls._actual_cache_icon_path(cls._cache_icon_path)\
                 or cls._cache_is_stale(cache_path):
@@ -155,20 +164,29 @@ class ResourceLoader(Application):
 
     @classmethod
     def check_resources(cls, pref, color, update_func=None):
-        with shelve.open(cls._cache_icon_path) as cache:
-            with shelve.open(cls._default_icon_path) as defaults:
-                step = 1 / len(defaults) * 1
-                for image in defaults:
-                    if not image.startswith("_"):
-                        image_dat = Image.open(io.BytesIO(defaults[image]))
-                        recolored = _recolor(image_dat, color)
-                        recolored_bytes = io.BytesIO()
-                        recolored.save(recolored_bytes, format="PNG")
-                        cache[image] = recolored_bytes.getvalue()
-                    else:
-                        cache[image] = defaults[image]
+        with shelve.open(cls._default_icon_path) as defaults:
+            images = {image: defaults[image] for image in defaults}
+
+        step = 1 / len(images)
+        cache = {}
+        # decoding and recoloring is spread across a pool of workers
+        with ThreadPoolExecutor() as pool:
+            futures = {}
+            for image, data in images.items():
+                if image.startswith("_"):
+                    # transformation free images
+                    cache[image] = data
                     if update_func:
                         update_func(step)
+                else:
+                    futures[pool.submit(_recolor_png, data, color)] = image
+            for future in as_completed(futures):
+                cache[futures[future]] = future.result()
+                if update_func:
+                    update_func(step)
+
+        # pack everything into a single memory mappable file
+        build_atlas(cls._cache_icon_path, cache)
 
         # save default icon checksum
         with open(cls._default_icon_path + ".dat", "rb") as cache:
@@ -0,0 +1,135 @@
+import time
+import tkinter
+import unittest
+
+from studio.debugtools.profiler import CallbackProfiler, AFTER, BIND, COMMAND, describe
+
+
+class _Root:
+    # schedules lag samples without a tk interpreter
+
+    def __init__(self):
+        self.scheduled = []
+
+    def after(self, ms, func):
+        self.scheduled.append(func)
+        return str(len(self.scheduled))
+
+    def after_cancel(self, _id):
+        self.scheduled.clear()
+
+
+def _after_wrapper(func):
+    # mirrors the callback wrapper created by tkinter.Misc.after
+    def callit():
+        func()
+
+    callit.__name__ = func.__name__
+    return callit
+
+
+def handler():
+    pass
+
+
+def slow():
+    time.sleep(0.006)
+
+
+class CallbackProfilerTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.original = tkinter.Misc._register
+        self.root = _Root()
+        self.profiler = CallbackProfiler()
+        self.profiler.install()
+        self.tcl = tkinter.Tcl()
+
+    def tearDown(self):
+        self.profiler.uninstall()
+        tkinter.Misc._register = tkinter.Misc.register = self.original
+
+    def _call(self, name, *args):
+        self.tcl.tk.call(name, *args)
+
+    def test_classify(self):
+        self.assertEqual(self.profiler.classify(handler, lambda *a: a), (BIND, handler))
+        self.assertEqual(self.profiler.classify(handler), (COMMAND, handler))
+        self.assertEqual(self.profiler.classify(_after_wrapper(handler)), (AFTER, handler))
+
+    def test_describe(self):
+        self.assertEqual(describe(handler), f"{__name__}.handler")
+        self.assertEqual(describe(self.setUp), f"{__name__}.CallbackProfilerTestCase.setUp")
+
+    def test_install(self):
+        self.assertIsNot(tkinter.Misc._register, self.original)
+        self.assertIs(tkinter.Misc.register, tkinter.Misc._register)
+        # command names are still derived from the callback
+        self.assertTrue(self.tcl.register(handler).endswith("handler"))
+        self.profiler.uninstall()
+        self.assertIs(tkinter.Misc._register, self.original)
+
+    def test_start_stop(self):
+        self.profiler.start(self.root)
+        self.assertTrue(self.profiler.recording)
+        self.assertEqual(len(self.root.scheduled), 1)
+        self.profiler.stop()
+        self.assertFalse(self.profiler.recording)
+        self.assertFalse(self.root.scheduled)
+
+    def test_record(self):
+        # registered before recording starts
+        command = self.tcl.register(slow)
+        for _ in range(3):
+            self.tcl.after_idle(handler)
+        self.profiler.start(self.root)
+        self.tcl.update()
+        self._call(command)
+        self.profiler.stop()
+        # not recorded once stopped
+        self.tcl.after_idle(handler)
+        self.tcl.update()
+        self._call(command)
+
+        report = self.profiler.report()
+        callbacks = {(kind, label): (count, total, longest) for kind, label, count, total, longest in report["callbacks"]}
+        self.assertEqual(callbacks[(AFTER, describe(handler))][0], 3)
+        count, total, longest = callbacks[(COMMAND, describe(slow))]
+        self.assertEqual(count, 1)
+        self.assertGreaterEqual(longest, 0.006)
+        # ordered by total time
+        self.assertEqual(report["callbacks"][0][:2], (COMMAND, describe(slow)))
+        self.assertEqual([entry[3] for entry in report["timeline"]], [describe(slow)])
+
+    def test_record_not_recording(self):
+        self.profiler.record(COMMAND, handler, time.perf_counter(), 1)
+        self.assertEqual(self.profiler.report()["callbacks"], [])
+
+    def test_bind(self):
+        command = self.tcl.register(handler, lambda *args: ())
+        self.profiler.start(self.root)
+        self._call(command, "1")
+        self.assertEqual(self.profiler.report()["callbacks"][0][:3], (BIND, describe(handler), 1))
+
+    def test_lag_samples_not_recorded(self):
+        self.profiler.interval = 1
+        self.profiler.start(self.tcl)
+        time.sleep(0.005)
+        self.tcl.update()
+        self.assertEqual(len(self.profiler.lag), 1)
+        # sampling reschedules itself
+        self.assertIsNotNone(self.profiler._timer)
+        self.assertEqual(self.profiler.report()["callbacks"], [])
+
+    def test_clear(self):
+        self.profiler.start(self.root)
+        self._call(self.tcl.register(slow))
+        self.profiler.clear()
+        report = self.profiler.report()
+        self.assertEqual(report["callbacks"], [])
+        self.assertEqual(report["timeline"], [])
+        self.assertTrue(report["recording"])
+
+
+if __name__ == '__main__':
+    unittest.main()
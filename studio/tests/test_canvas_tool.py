@@ -0,0 +1,35 @@
+import unittest
+
+from studio.tools.canvas import vertex_subset
+
+
+class VertexSubsetTestCase(unittest.TestCase):
+
+    def test_few_vertices(self):
+        self.assertEqual(vertex_subset([], 8, 10), [])
+        self.assertEqual(vertex_subset([(0, 0), (1, 1)], 8, 10), [0, 1])
+        self.assertEqual(vertex_subset([(0, 0), (20, 0), (40, 0)], 8, 10), [0, 1, 2])
+
+    def test_spacing(self):
+        points = [(0, 0), (2, 2), (4, 4), (10, 0), (12, 0), (12, 12)]
+        self.assertEqual(vertex_subset(points, 8, 10), [0, 3, 5])
+
+    def test_end_points_kept(self):
+        # everything is crowded, only the ends remain
+        points = [(i, i) for i in range(5)]
+        self.assertEqual(vertex_subset(points, 8, 10), [0, 4])
+
+    def test_limit(self):
+        points = [(i * 10, 0) for i in range(2000)]
+        subset = vertex_subset(points, 8, 200)
+        self.assertLessEqual(len(subset), 200)
+        self.assertEqual(subset[0], 0)
+        self.assertEqual(subset[-1], 1999)
+        self.assertEqual(subset, sorted(set(subset)))
+        # thinned out evenly
+        gaps = {b - a for a, b in zip(subset[:-2], subset[1:-1])}
+        self.assertEqual(len(gaps), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
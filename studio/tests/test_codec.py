@@ -0,0 +1,65 @@
+import unittest
+from multiprocessing import Pipe
+
+from studio.debugtools.codec import Encoder, Decoder, Channel
+from studio.debugtools.defs import Message, WidgetMessage
+
+
+class CodecTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.encoder = Encoder()
+        self.decoder = Decoder()
+
+    def round_trip(self, *messages):
+        return self.decoder.decode(self.encoder.encode(messages))
+
+    def test_round_trip(self):
+        payload = {
+            "str": "text", "int": 1, "float": 1.5, "bool": True, "none": None, "bytes": b"\x00",
+            "list": [1, [2, "3"]], "tuple": (1, ("a", None), [2]), "set": {1, 2},
+            "int_keys": {1: "one", (1, 2): "pair"},
+            "widget": WidgetMessage(".!frame", 1),
+        }
+        message = Message("WIDGET", payload=payload)
+        self.assertEqual(self.round_trip(message), [message])
+
+    def test_fallback(self):
+        error, = self.round_trip(KeyError("missing"))
+        self.assertIsInstance(error, KeyError)
+        self.assertEqual(error.args, ("missing",))
+        self.assertEqual(self.round_trip(int, "TERMINATE"), [int, "TERMINATE"])
+
+    def test_definitions_sent_once(self):
+        message = Message("EVENT", payload={"event": "<<WidgetModified>>", "widget": WidgetMessage(".a")})
+        first = self.encoder.encode([message])
+        second = self.encoder.encode([message])
+        self.assertLess(len(second), len(first))
+        self.assertEqual(self.decoder.decode(first), [message])
+        self.assertEqual(self.decoder.decode(second), [message])
+
+    def test_failed_encode(self):
+        with self.assertRaises(Exception):
+            self.encoder.encode([{"key": lambda: None}])
+        # definitions made for a frame that was never sent are not assumed known
+        self.assertEqual(self.round_trip({"key": 1}), [{"key": 1}])
+
+    def test_resolve(self):
+        decoder = Decoder(lambda message: (message.id, message.root))
+        frame = self.encoder.encode([[WidgetMessage(".a", 2), WidgetMessage(".a", 2)]])
+        self.assertEqual(decoder.decode(frame), [[(".a", 2), (".a", 2)]])
+
+    def test_channel(self):
+        left, right = Pipe()
+        sender, receiver = Channel(left), Channel(right)
+        sender.send(Message("EVENT", payload={"n": 1}), Message("EVENT", payload={"n": 2}))
+        sender.send("TERMINATE")
+        self.assertEqual(receiver.recv().payload, {"n": 1})
+        self.assertEqual(receiver.recv().payload, {"n": 2})
+        self.assertEqual(receiver.recv(), "TERMINATE")
+        sender.close()
+        receiver.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
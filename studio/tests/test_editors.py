@@ -0,0 +1,17 @@
+import unittest
+
+from studio.ui.editors import get_editor_height
+
+
+class EditorHeightTestCase(unittest.TestCase):
+    # virtualized attribute groups lay out rows using these heights
+
+    def test_fixed_heights(self):
+        self.assertEqual(get_editor_height({"type": "text"}), 25)
+        self.assertEqual(get_editor_height({"type": "font"}), 50)
+        self.assertEqual(get_editor_height({"type": "textarea"}), 60)
+        self.assertEqual(get_editor_height({"type": "anchor"}), 110)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,28 @@
+import unittest
+
+from studio.debugtools.element_pane import coalesce, CREATED, DELETED
+
+
+class CoalesceTestCase(unittest.TestCase):
+
+    def test_net_change(self):
+        created, deleted = coalesce([
+            (CREATED, ".a"), (CREATED, ".a.b"), (DELETED, ".c"),
+            (CREATED, ".d"), (DELETED, ".d"), (DELETED, ".e"), (CREATED, ".e"),
+        ])
+        self.assertEqual(created, [".a", ".a.b", ".e"])
+        self.assertEqual(deleted, [".c", ".d"])
+
+    def test_parents_first(self):
+        # a parent recreated after its child keeps its earlier position
+        created, _ = coalesce([
+            (CREATED, ".a"), (DELETED, ".a"), (CREATED, ".a.b"), (CREATED, ".a"),
+        ])
+        self.assertEqual(created, [".a", ".a.b"])
+
+    def test_empty(self):
+        self.assertEqual(coalesce([]), ([], []))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,113 @@
+import threading
+import unittest
+
+from studio.debugtools.batcher import EventBatcher
+
+
+class EventBatcherTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.batches = []
+        self.batcher = EventBatcher(self.batches.append, window=0.01)
+
+    def tearDown(self):
+        self.batcher.close()
+
+    def push(self, event, widget, data=None):
+        key = self.batcher.key(event, widget, data)
+        if self.batcher.merge(key):
+            return False
+        return self.batcher.push((event, widget, data), key)
+
+    def test_coalesce(self):
+        for _ in range(100):
+            self.push("<<WidgetModified>>", ".a")
+            self.push("<<WidgetModified>>", ".b")
+        self.push("<<CanvasItemsModified>>", ".c", "1")
+        self.push("<<CanvasItemsModified>>", ".c", "2")
+        self.batcher.flush()
+        self.assertEqual(self.batches, [[
+            ("<<WidgetModified>>", ".a", None),
+            ("<<WidgetModified>>", ".b", None),
+            ("<<CanvasItemsModified>>", ".c", "1"),
+            ("<<CanvasItemsModified>>", ".c", "2"),
+        ]])
+        self.assertEqual(self.batcher.coalesced, 198)
+
+    def test_barrier(self):
+        self.push("<<WidgetModified>>", ".a")
+        self.push("<<WidgetDeleted>>", ".a")
+        self.push("<<WidgetCreated>>", ".a")
+        self.push("<<WidgetModified>>", ".a")
+        self.push("<<WidgetDeleted>>", ".a")
+        self.batcher.flush()
+        self.assertEqual([event for event, *_ in self.batches[0]], [
+            "<<WidgetModified>>", "<<WidgetDeleted>>", "<<WidgetCreated>>",
+            "<<WidgetModified>>", "<<WidgetDeleted>>",
+        ])
+
+    def test_max_batch(self):
+        self.batcher.max_batch = 10
+        for i in range(25):
+            self.push("<<WidgetCreated>>", f".w{i}")
+        self.batcher.flush()
+        self.assertEqual([len(batch) for batch in self.batches], [10, 10, 5])
+
+    def test_background_send(self):
+        sent = threading.Event()
+        batcher = EventBatcher(lambda batch: sent.set(), window=0.01)
+        batcher.start()
+        batcher.push("<<WidgetCreated>>")
+        self.assertTrue(sent.wait(5))
+        batcher.close()
+
+    def test_push_does_not_block(self):
+        release = threading.Event()
+        started = threading.Event()
+
+        def slow_send(batch):
+            started.set()
+            release.wait(5)
+            self.batches.append(batch)
+
+        batcher = EventBatcher(slow_send, window=0.01)
+        batcher.start()
+        batcher.push("first")
+        self.assertTrue(started.wait(5))
+        # the sender is stuck, events keep accumulating without blocking
+        for _ in range(1000):
+            key = batcher.key("<<WidgetModified>>", ".a")
+            if not batcher.merge(key):
+                batcher.push("modified", key)
+        self.assertEqual(len(batcher), 1)
+        release.set()
+        batcher.close()
+        self.assertEqual(self.batches, [["first"], ["modified"]])
+
+    def test_send_error(self):
+        failed, sent = threading.Event(), threading.Event()
+        calls = []
+
+        def send(batch):
+            calls.append(batch)
+            if len(calls) == 1:
+                failed.set()
+                raise ValueError("cannot encode")
+            sent.set()
+
+        batcher = EventBatcher(send, window=0.01)
+        batcher.start()
+        with self.assertLogs("studio.debugtools.batcher", "ERROR"):
+            batcher.push("bad")
+            self.assertTrue(failed.wait(5))
+            # the sender thread survives and keeps sending
+            batcher.push("good")
+            self.assertTrue(sent.wait(5))
+        batcher.close()
+        self.assertEqual(calls, [["bad"], ["good"]])
+        self.assertEqual(batcher.batches, 1)
+        self.assertEqual(len(batcher), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
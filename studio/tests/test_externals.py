@@ -0,0 +1,66 @@
+import queue
+import threading
+import unittest
+from unittest import mock
+
+from studio import main
+from studio.main import StudioApplication
+
+
+class _Studio:
+    # queues calls scheduled with after so the test can act as the event loop
+
+    def __init__(self):
+        self._externals_ready = threading.Event()
+        self.scheduled = queue.Queue()
+        self.init_thread = None
+
+    def after(self, _ms, func):
+        self.scheduled.put(func)
+
+    def load_externals(self):
+        return StudioApplication.load_externals(self)
+
+
+class ExternalsTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.studio = _Studio()
+        self.ready = []
+        patcher = mock.patch.object(main, "init_externals", self._init)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _init(self, studio):
+        studio.init_thread = threading.current_thread()
+        # not visible to other threads until initialization completes
+        self.ready.append(studio._externals_ready.is_set())
+
+    def test_main_thread(self):
+        with mock.patch.object(main.pref, "get", return_value=True):
+            self.assertTrue(self.studio.load_externals())
+            self.assertFalse(self.studio.load_externals())
+        self.assertIs(self.studio.init_thread, threading.main_thread())
+        self.assertEqual(self.ready, [False])
+
+    def test_other_thread(self):
+        result = []
+        worker = threading.Thread(target=lambda: result.append(self.studio.load_externals()))
+        with mock.patch.object(main.pref, "get", return_value=True):
+            worker.start()
+            # run the initialization scheduled by the worker
+            self.studio.scheduled.get(timeout=5)()
+            worker.join(5)
+        self.assertEqual(result, [True])
+        self.assertIs(self.studio.init_thread, threading.main_thread())
+        self.assertEqual(self.ready, [False])
+
+    def test_thirdparty_disabled(self):
+        with mock.patch.object(main.pref, "get", return_value=False):
+            self.assertTrue(self.studio.load_externals())
+        self.assertIsNone(self.studio.init_thread)
+        self.assertTrue(self.studio._externals_ready.is_set())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,134 @@
+import unittest
+
+from hoverset.util.execution import Action
+from hoverset.util.history import History
+
+from studio.feature.design import DesignContext
+from studio.preferences import defaults
+
+
+class _Designer:
+
+    def __init__(self, changed=False):
+        self.root_obj = object()
+        self.builder = type("Builder", (), {"root": "tree"})()
+        self.design_path = "design.xml"
+        self.changed = changed
+        self.destroyed = False
+        self.loaded = None
+        self.theme = ()
+
+    def has_changed(self):
+        return self.changed
+
+    def destroy(self):
+        self.destroyed = True
+
+    def load_tree(self, node, path=None):
+        self.loaded = node, path
+
+    def set_theme(self, *_):
+        pass
+
+    def add_studio_binding(self, *_):
+        pass
+
+    def _select(self, *_):
+        pass
+
+    def _on_theme_changed(self, *_):
+        pass
+
+
+class _Studio:
+
+    def __init__(self):
+        self.context = None
+        self.hibernated = []
+        self.path = None
+
+    def on_context_hibernate(self, context):
+        self.hibernated.append(context)
+
+    def set_path(self, path):
+        self.path = path
+
+
+class _Context(DesignContext):
+    # skips widget creation so the hibernation rules can be checked without a display
+
+    def __init__(self, changed=False, with_history=None):
+        if with_history is None:
+            with_history = defaults["studio"]["hibernate_with_history"]
+        self.pref = {"studio::hibernate_with_history": with_history}
+        self.path = "design.xml"
+        self.studio = _Studio()
+        self.designer = _Designer(changed)
+        self._history = History()
+        self._loaded = True
+        self._snapshot = None
+
+    def _create_designer(self):
+        self.designer = _Designer()
+
+
+class HibernationTestCase(unittest.TestCase):
+
+    def _edit(self, context):
+        context._history.push(Action(lambda _: None, lambda _: None))
+
+    def test_without_history(self):
+        context = _Context()
+        self.assertTrue(context.can_hibernate())
+
+    def test_history_kept_by_default(self):
+        context = _Context()
+        self._edit(context)
+        self.assertFalse(context.can_hibernate())
+        self.assertFalse(context.hibernate())
+        self.assertTrue(context.has_undo())
+        self.assertFalse(context.designer.destroyed)
+
+    def test_unsaved_changes(self):
+        context = _Context(changed=True)
+        self.assertFalse(context.can_hibernate())
+
+    def test_saved_with_history(self):
+        context = _Context(with_history=True)
+        self._edit(context)
+        self.assertTrue(context.can_hibernate())
+        context._history.undo()
+        # redo history counts as well
+        self.assertTrue(context.can_hibernate())
+
+    def test_history_preference(self):
+        context = _Context(with_history=False)
+        self._edit(context)
+        self.assertFalse(context.can_hibernate())
+        self.assertFalse(context.hibernate())
+
+    def test_hibernate_clears_history(self):
+        context = _Context(with_history=True)
+        self._edit(context)
+        designer = context.designer
+        self.assertTrue(context.hibernate())
+        self.assertTrue(designer.destroyed)
+        self.assertEqual(context._snapshot, ("tree", "design.xml"))
+        self.assertFalse(context.has_undo())
+        self.assertFalse(context._loaded)
+        self.assertEqual(context.studio.hibernated, [context])
+
+    def test_wake(self):
+        context = _Context()
+        self.assertTrue(context.hibernate())
+        context.on_context_set()
+        # the design is rebuilt from the tree kept while hibernating
+        self.assertEqual(context.designer.loaded, ("tree", "design.xml"))
+        self.assertIsNone(context._snapshot)
+        self.assertTrue(context._loaded)
+        self.assertEqual(context.studio.path, "design.xml")
+        self.assertTrue(context.can_hibernate())
+
+
+if __name__ == '__main__':
+    unittest.main()
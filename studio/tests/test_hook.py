@@ -0,0 +1,97 @@
+import atexit
+import tkinter
+import unittest
+from tkinter import ttk
+
+from studio.debugtools.hook import DebuggerHook
+
+
+class HookInstallTestCase(unittest.TestCase):
+
+    METHODS = (
+        (tkinter.Canvas, "_create"), (tkinter.Canvas, "itemconfigure"), (tkinter.Canvas, "delete"),
+        (tkinter.Menu, "add"), (tkinter.Menu, "entryconfigure"), (tkinter.Menu, "delete"),
+        (tkinter.Pack, "pack_configure"), (tkinter.Grid, "grid_configure"), (ttk.Notebook, "tab"),
+    )
+
+    def setUp(self):
+        self.originals = {(owner, name): owner.__dict__[name] for owner, name in self.METHODS}
+        self.hook = DebuggerHook()
+        atexit.unregister(self.hook.terminate)
+        self.hook._hook_menu()
+        self.hook._hook_canvas()
+        self.hook._hook_layout()
+
+    def tearDown(self):
+        self.hook.uninstall_hooks()
+
+    def assertOriginal(self):
+        for (owner, name), original in self.originals.items():
+            self.assertIs(owner.__dict__[name], original, f"{owner.__name__}.{name}")
+
+    def test_not_installed(self):
+        self.assertFalse(self.hook.hooks_installed)
+        self.assertOriginal()
+
+    def test_install(self):
+        self.hook.install_hooks()
+        self.assertTrue(self.hook.hooks_installed)
+        for (owner, name), original in self.originals.items():
+            self.assertIsNot(owner.__dict__[name], original, f"{owner.__name__}.{name}")
+        # installing twice should not wrap the hooks again
+        installed = {key: key[0].__dict__[key[1]] for key in self.originals}
+        self.hook.install_hooks()
+        for (owner, name), replacement in installed.items():
+            self.assertIs(owner.__dict__[name], replacement)
+
+    def test_uninstall(self):
+        self.hook.install_hooks()
+        self.hook.uninstall_hooks()
+        self.assertFalse(self.hook.hooks_installed)
+        self.assertOriginal()
+
+    def test_detached_events(self):
+        # no events are built while no client is attached
+        self.hook.push_event("<<WidgetModified>>", ".frame")
+        self.assertEqual(len(self.hook.batcher), 0)
+        self.assertFalse(self.hook.wants_event("<<WidgetModified>>", ".frame"))
+
+
+class _Client:
+
+    def __init__(self, error=None):
+        self.error = error
+        self.sent = []
+
+    def send(self, *messages):
+        if self.error:
+            raise self.error
+        self.sent.append(messages)
+
+
+class HookTransmitTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.hook = DebuggerHook()
+        atexit.unregister(self.hook.terminate)
+
+    def test_dropped_clients(self):
+        client = _Client()
+        self.hook._stream_clients.extend([
+            _Client(EOFError()), _Client(OSError("handle is closed")), client, _Client(BrokenPipeError())
+        ])
+        self.hook.transmit("a", "b")
+        self.assertEqual(self.hook._stream_clients, [client])
+        self.assertEqual(client.sent, [("a", "b")])
+
+    def test_detach(self):
+        subscription = self.hook.subscription
+        self.hook._stream_clients.append(_Client(ConnectionResetError()))
+        self.hook.transmit("a")
+        self.assertEqual(self.hook._stream_clients, [])
+        # the last client leaving resets the subscription
+        self.assertIsNot(self.hook.subscription, subscription)
+
+
+if __name__ == '__main__':
+    unittest.main()
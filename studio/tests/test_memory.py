@@ -0,0 +1,81 @@
+import tkinter
+import unittest
+
+from studio.debugtools import memory
+
+
+def callback():
+    pass
+
+
+def _snapshot(time=0, widgets=None, orphans=(), images=(), variables=(), after=()):
+    return {
+        "time": time,
+        "widgets": widgets or {},
+        "orphans": list(orphans),
+        "images": list(images),
+        "variables": list(variables),
+        "after": list(after),
+    }
+
+
+class TclInspectionTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.tcl = tkinter.Tcl()
+
+    def tearDown(self):
+        for event in self.tcl.tk.splitlist(self.tcl.tk.call("after", "info")):
+            self.tcl.after_cancel(event)
+
+    def test_variables(self):
+        self.tcl.tk.call("set", "scalar", "hello")
+        self.tcl.tk.call("array", "set", "array", ("x", 1, "y", 2, "z", 3))
+        variables = dict(memory.variables(self.tcl.tk))
+        self.assertEqual(variables["scalar"], 5)
+        self.assertEqual(variables["array"], 3)
+
+    def test_after_queue(self):
+        self.tcl.after(10000, callback)
+        self.tcl.after_idle(callback)
+        self.assertCountEqual(memory.after_queue(self.tcl.tk), [("callback", "timer"), ("callback", "idle")])
+
+
+class DiffTestCase(unittest.TestCase):
+
+    def test_diff(self):
+        old = _snapshot(
+            time=10,
+            widgets={"Frame": 2, "Button": 4},
+            orphans=[("Toplevel", ".!toplevel")],
+            images=[(0, "pyimage1", "photo", 10, 10), (0, "pyimage2", "photo", 20, 20)],
+            variables=[(0, "PY_VAR0", 1)],
+            after=[(0, "poll", "timer")],
+        )
+        new = _snapshot(
+            time=25,
+            widgets={"Frame": 2, "Button": 7, "Label": 1},
+            orphans=[("Toplevel", ".!toplevel"), ("Toplevel", ".!toplevel2")],
+            images=[(0, "pyimage2", "photo", 20, 20), (0, "pyimage3", "photo", 30, 30)],
+            variables=[(0, "PY_VAR0", 1), (0, "PY_VAR1", 1)],
+            after=[(0, "poll", "timer"), (0, "poll", "timer"), (0, "poll", "timer")],
+        )
+        diff = memory.diff(old, new)
+        self.assertEqual(diff["elapsed"], 15)
+        self.assertEqual(diff["widgets"], {"Button": 3, "Label": 1})
+        self.assertEqual(diff["orphans"], {"Toplevel": 1})
+        self.assertEqual(diff["after"], {"poll": 2})
+        self.assertEqual(diff["images"], {"added": ["pyimage3"], "removed": ["pyimage1"]})
+        self.assertEqual(diff["pixels"], 900 - 100)
+        self.assertEqual(diff["variables"], {"added": ["PY_VAR1"], "removed": []})
+
+    def test_diff_unchanged(self):
+        snap = _snapshot(widgets={"Frame": 1}, images=[(0, "pyimage1", "photo", 1, 1)])
+        diff = memory.diff(snap, snap)
+        self.assertEqual(diff["widgets"], {})
+        self.assertEqual(diff["images"], {"added": [], "removed": []})
+        self.assertEqual(diff["pixels"], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,37 @@
+import io
+import unittest
+
+from studio.profiling import StartupProfiler
+
+
+class StartupProfilerTestCase(unittest.TestCase):
+
+    def test_disabled(self):
+        profiler = StartupProfiler()
+        with profiler.measure("init"):
+            pass
+        self.assertEqual(profiler.records, [])
+
+    def test_report(self):
+        profiler = StartupProfiler()
+        profiler.enable()
+        with profiler.measure("init Feature"):
+            pass
+        self.assertEqual([label for label, _ in profiler.records], ["init Feature"])
+        stream = io.StringIO()
+        profiler.report(stream)
+        lines = stream.getvalue().splitlines()
+        self.assertTrue(lines[1].strip().startswith("init Feature"))
+        self.assertTrue(lines[-1].strip().startswith("total"))
+
+    def test_failure_recorded(self):
+        profiler = StartupProfiler()
+        profiler.enable()
+        with self.assertRaises(ValueError):
+            with profiler.measure("init"):
+                raise ValueError
+        self.assertEqual(len(profiler.records), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
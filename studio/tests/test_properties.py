@@ -0,0 +1,102 @@
+import unittest
+
+from studio.lib import properties as properties_lib
+from studio.lib.properties import (
+    get_class_properties, get_properties, get_combined_properties, PropertyMap
+)
+
+
+class FakeWidget:
+    config_calls = 0
+
+    def __init__(self, **values):
+        self.values = {"text": "", "background": "white", "unknown": 1, **values}
+        self.prop_calls = []
+        self.batch_calls = 0
+
+    def config(self):
+        FakeWidget.config_calls += 1
+        return dict(self.values)
+
+    def get_prop(self, prop):
+        self.prop_calls.append(prop)
+        return self.values[prop]
+
+    def get_props(self, props):
+        self.batch_calls += 1
+        return {prop: self.values[prop] for prop in props}
+
+    @property
+    def properties(self):
+        return PropertyMap(self, get_class_properties(self))
+
+
+class OtherFakeWidget(FakeWidget):
+
+    def __init__(self, **values):
+        super().__init__(**values)
+        self.values.pop("text")
+
+
+class PropertiesTestCase(unittest.TestCase):
+
+    def setUp(self) -> None:
+        properties_lib._class_properties.clear()
+        properties_lib._common_properties.clear()
+
+    def test_class_properties_shared(self):
+        FakeWidget.config_calls = 0
+        first = get_class_properties(FakeWidget())
+        second = get_class_properties(FakeWidget(text="hello"))
+        self.assertIs(first, second)
+        self.assertEqual(FakeWidget.config_calls, 1)
+        self.assertEqual(set(first), {"text", "background"})
+        self.assertNotIn("value", first["text"])
+
+    def test_class_properties_proxy(self):
+        # proxies of different remote classes do not share definitions
+        label = FakeWidget()
+        label.property_class = "Label"
+        entry = FakeWidget(show="*")
+        entry.property_class = "Entry"
+        self.assertNotIn("show", get_class_properties(label))
+        self.assertIn("show", get_class_properties(entry))
+
+    def test_property_map_lazy(self):
+        widget = FakeWidget(text="hello")
+        properties = PropertyMap(widget, get_class_properties(widget))
+        self.assertEqual(widget.prop_calls, [])
+        self.assertEqual(properties["text"]["value"], "hello")
+        self.assertEqual(widget.prop_calls, ["text"])
+        properties["text"]
+        self.assertEqual(widget.prop_calls, ["text"])
+
+    def test_property_map_copy_on_write(self):
+        widget = FakeWidget()
+        definitions = get_class_properties(widget)
+        properties = PropertyMap(widget, definitions)
+        properties["layout"] = {"name": "layout", "type": "layout", "value": None}
+        properties.pop("background")
+        self.assertIn("background", definitions)
+        self.assertNotIn("layout", definitions)
+        self.assertEqual(set(properties), {"text", "layout"})
+
+    def test_get_properties(self):
+        properties = get_properties(FakeWidget(background="red"))
+        self.assertEqual(properties["background"]["value"], "red")
+        self.assertEqual(properties["background"]["name"], "background")
+
+    def test_combined_properties(self):
+        widgets = [FakeWidget(text="a"), FakeWidget(text="b"), OtherFakeWidget()]
+        combined = get_combined_properties(widgets)
+        self.assertEqual(set(combined), {"background"})
+        self.assertEqual(combined["background"]["value"], "white")
+        self.assertTrue(all(w.batch_calls == 1 and not w.prop_calls for w in widgets))
+
+        combined = get_combined_properties(widgets[:2])
+        self.assertEqual(combined["text"]["value"], "")
+        self.assertEqual(combined["background"]["value"], "white")
+
+
+if __name__ == '__main__':
+    unittest.main()
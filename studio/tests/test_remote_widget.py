@@ -0,0 +1,107 @@
+import tkinter
+import unittest
+
+from studio.debugtools.debugger import Debugger
+from studio.debugtools.defs import RemoteWidget
+
+
+class _Debugger:
+    # the query and cache logic of the debugger without the user interface
+    query = Debugger.query
+    _invalidate_cache = Debugger._invalidate_cache
+    known_parent = Debugger.known_parent
+
+    def __init__(self, remote):
+        self.remote = remote
+        self._widget_map = {}
+        self.requests = []
+
+    def widget(self, path):
+        widget = self._widget_map[(path, 0)] = RemoteWidget(path, self)
+        return widget
+
+    def transmit(self, msg, response=False):
+        widgets, fields = msg.payload["args"]
+        self.requests.append((msg.payload["meth"], [path for path, _ in widgets], fields))
+        return [
+            {field: self.remote[path][field] for field in fields} if path in self.remote else None
+            for path, _ in widgets
+        ]
+
+
+class RemoteWidgetCacheTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.remote = {
+            ".frame": {
+                "_class": tkinter.Frame, "winfo_children": [], "winfo_ismapped": 1,
+                "winfo_manager": "pack", "layout_info": {"side": "top"}, "configure": {"bg": ("bg", "", "", "", "red")},
+                "has_items": False,
+            },
+            ".frame.button": {
+                "_class": tkinter.Button, "winfo_children": [], "winfo_ismapped": 0,
+                "winfo_manager": "", "layout_info": None, "configure": {},
+            },
+        }
+        self.debugger = _Debugger(self.remote)
+        self.frame = self.debugger.widget(".frame")
+        self.button = self.debugger.widget(".frame.button")
+        self.remote[".frame"]["winfo_children"] = [self.button]
+
+    def test_batched_query(self):
+        self.debugger.query([self.frame, self.button], ("_class", "winfo_children", "winfo_ismapped"))
+        self.assertEqual(len(self.debugger.requests), 1)
+        self.assertEqual(self.debugger.requests[0][1], [".frame", ".frame.button"])
+        self.assertIs(self.frame._class, tkinter.Frame)
+        self.assertEqual(self.frame.winfo_children(), [self.button])
+        self.assertFalse(self.button.winfo_ismapped())
+        # cached values are used and already cached widgets are not queried again
+        self.debugger.query([self.frame, self.button], ("_class",))
+        self.assertEqual(len(self.debugger.requests), 1)
+
+    def test_single_fields(self):
+        self.assertEqual(self.frame.winfo_manager(), "pack")
+        self.assertEqual(self.frame.pack_info(), {"side": "top"})
+        self.frame.configure()
+        self.assertEqual(self.frame["bg"], "red")
+        self.assertEqual([fields for *_, fields in self.debugger.requests], [
+            ("winfo_manager",), ("layout_info",), ("configure",)
+        ])
+
+    def test_invalidation(self):
+        self.debugger.query([self.frame], ("winfo_children", "winfo_ismapped", "winfo_manager", "configure"))
+        self.remote[".frame"]["winfo_children"] = []
+        self.remote[".frame"]["winfo_ismapped"] = 0
+        self.remote[".frame"]["configure"] = {"bg": ("bg", "", "", "", "blue")}
+        self.button.deleted = True
+        self.debugger._invalidate_cache("<<WidgetDeleted>>", self.button)
+        self.assertEqual(self.frame.winfo_children(), [])
+        self.assertEqual(self.frame.winfo_ismapped(), 1)
+        self.debugger._invalidate_cache("<<WidgetUnmapped>>", self.frame)
+        self.assertEqual(self.frame.winfo_ismapped(), 0)
+        self.assertEqual(self.frame["bg"], "red")
+        self.frame.invalidate_conf()
+        self.debugger.query([self.frame], ("configure",))
+        self.assertEqual(self.frame["bg"], "blue")
+
+    def test_extra_items(self):
+        self.remote[".canvas"] = {"_class": tkinter.Canvas, "has_items": True}
+        canvas = self.debugger.widget(".canvas")
+        self.assertTrue(canvas.has_extra_items())
+        self.assertFalse(self.frame.has_extra_items())
+        self.remote[".canvas"]["has_items"] = False
+        self.assertTrue(canvas.has_extra_items())
+        self.debugger._invalidate_cache("<<CanvasItemsDeleted>>", canvas)
+        self.assertFalse(canvas.has_extra_items())
+
+    def test_deleted(self):
+        del self.remote[".frame.button"]
+        self.assertEqual(self.button.winfo_children(), [])
+        self.button.deleted = True
+        requests = len(self.debugger.requests)
+        self.assertIsNone(self.button.winfo_manager())
+        self.assertEqual(len(self.debugger.requests), requests)
+
+
+if __name__ == '__main__':
+    unittest.main()
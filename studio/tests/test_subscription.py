@@ -0,0 +1,114 @@
+import unittest
+
+from studio.debugtools.debugger import Debugger
+from studio.debugtools.subscription import Subscription
+
+
+class _Widget:
+
+    def __init__(self, master=None):
+        self.master = master
+
+
+class SubscriptionTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.subscription = Subscription()
+        self.root = _Widget()
+        self.frame = _Widget(self.root)
+        self.button = _Widget(self.frame)
+
+    def test_default(self):
+        self.assertTrue(self.subscription.wants("<<WidgetModified>>", self.button))
+        self.assertTrue(self.subscription.wants("<<CustomEvent>>"))
+
+    def test_events(self):
+        self.subscription.subscribe(["<<WidgetModified>>"])
+        self.assertTrue(self.subscription.wants("<<WidgetModified>>", self.button))
+        self.assertFalse(self.subscription.wants("<<WidgetLayoutChanged>>", self.button))
+        self.assertTrue(self.subscription.wants("<<SelectionChanged>>", self.button))
+        self.subscription.subscribe(None)
+        self.assertTrue(self.subscription.wants("<<WidgetLayoutChanged>>", self.button))
+
+    def test_watch(self):
+        self.subscription.watch(self.root)
+        self.assertTrue(self.subscription.wants("<<WidgetModified>>", self.root))
+        self.assertFalse(self.subscription.wants("<<WidgetModified>>", self.frame))
+        # creation and deletion of children of watched widgets are still sent
+        self.assertTrue(self.subscription.wants("<<WidgetCreated>>", self.frame))
+        self.assertTrue(self.subscription.wants("<<WidgetDeleted>>", self.frame))
+        self.assertFalse(self.subscription.wants("<<WidgetCreated>>", self.button))
+        # widget paths cannot be resolved cheaply and are always sent
+        self.assertTrue(self.subscription.wants("<<WidgetLayoutChanged>>", ".frame.button"))
+
+    def test_unwatch(self):
+        self.subscription.watch(self.root, self.frame)
+        self.assertTrue(self.subscription.wants("<<WidgetModified>>", self.frame))
+        self.subscription.unwatch(self.frame)
+        self.assertFalse(self.subscription.wants("<<WidgetModified>>", self.frame))
+        self.assertFalse(self.subscription.wants("<<WidgetCreated>>", self.button))
+
+
+class _RemoteWidget:
+
+    def __init__(self, id_, root=0):
+        self.id = id_
+        self.root = root
+
+
+class _Debugger:
+    # runs the watch queue of the debugger without a tk interpreter
+
+    def __init__(self):
+        self._watch_queue = {}
+        self.idle = []
+        self.sent = []
+
+    def after_idle(self, func):
+        self.idle.append(func)
+
+    def transmit(self, msg, response=False):
+        self.sent.append((msg.payload["meth"], msg.payload["args"][0]))
+
+    watch = Debugger.watch
+    unwatch = Debugger.unwatch
+    _queue_watch = Debugger._queue_watch
+    _send_watch_queue = Debugger._send_watch_queue
+
+
+class WatchQueueTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.debugger = _Debugger()
+        self.a, self.b, self.c = _RemoteWidget(".a"), _RemoteWidget(".b"), _RemoteWidget(".c", 1)
+
+    def flush(self):
+        self.assertEqual(len(self.debugger.idle), 1)
+        self.debugger.idle.pop()()
+
+    def test_batched(self):
+        self.debugger.watch(self.a)
+        self.debugger.watch(self.b)
+        self.debugger.unwatch(self.c)
+        self.flush()
+        self.assertEqual(self.debugger.sent, [
+            ("watch", [(".a", 0), (".b", 0)]),
+            ("unwatch", [(".c", 1)]),
+        ])
+
+    def test_last_request_counts(self):
+        # a node hidden and shown again within the same idle period
+        self.debugger.unwatch(self.a)
+        self.debugger.watch(self.a)
+        self.debugger.watch(self.b)
+        self.debugger.unwatch(self.b)
+        self.flush()
+        self.assertEqual(self.debugger.sent, [("watch", [(".a", 0)]), ("unwatch", [(".b", 0)])])
+        # nothing left to send
+        self.debugger.watch(self.c)
+        self.flush()
+        self.assertEqual(self.debugger.sent[-1], ("watch", [(".c", 1)]))
+
+
+if __name__ == '__main__':
+    unittest.main()
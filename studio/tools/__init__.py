@@ -6,6 +6,7 @@ from studio.tools.menu import MenuToolX
 from studio.tools.menus import MenuTool
 from studio.tools.canvas import CanvasTool
 from studio.tools._base import BaseTool
+from studio.profiling import startup_profiler
 
 
 TOOLS = (
@@ -28,7 +29,10 @@ class ToolManager:
         ToolManager._instance = self
 
     def initialize(self):
-        self._tools = [tool(self.studio, self) for tool in TOOLS]
+        self._tools = []
+        for tool in TOOLS:
+            with startup_profiler.measure(f"init {tool.__name__}"):
+                self._tools.append(tool(self.studio, self))
 
     def get_tool_menu(self, hide_unsupported=True):
         """
@@ -2,10 +2,12 @@
 # Copyright (C) 2021 Hoverset Group.                                      #
 # ======================================================================= #
 import abc
+import math
 from collections import defaultdict
 
 from formation.formats import Node
 from hoverset.data import actions
+from hoverset.data.spatial import SpatialIndex
 
 from hoverset.ui.icons import get_icon_image as icon
 from hoverset.ui.widgets import EventMask
@@ -22,36 +24,127 @@ from studio.lib.legacy import Canvas
 from studio.parsers.loader import BaseStudioAdapter, DesignBuilder
 from studio.i18n import _
 
+# selected items beyond this number are not given their own controller,
+# they are outlined as a group and moved along with the rest
+MAX_CONTROLLERS = 10
+# tag shared by selected items so they can be moved with a single call
+SELECTION_TAG = "cv_selected"
+# milliseconds between consecutive moves of the selection while dragging
+MOVE_INTERVAL = 16
+# tolerance in pixels when looking up items at a position
+HIT_HALO = 2
+
+
+class Handle(abc.ABC):
+    """
+    Base for controller elements drawn as items on the canvas being edited.
+    Retired handles are hidden and kept in a bounded pool per canvas for
+    reuse. Events are bound once per canvas on the class tag and dispatched
+    to the handle under the pointer so handles carry no bindings of their own
+    """
+    tag = None
+    # retired handles kept per canvas, any beyond are deleted
+    POOL_SIZE = 256
+    # (sequence, method name) pairs dispatched to handles
+    events = ()
+    # subclasses provide their own containers
+    pool = None
+    handles = None
+    bound = None
+
+    def __init__(self, canvas, controller):
+        self.canvas = canvas
+        self.controller = controller
+        self._id = self._create()
+        self.handles[canvas][self._id] = self
+        self._bind_canvas(canvas)
+
+    @abc.abstractmethod
+    def _create(self):
+        pass
+
+    @classmethod
+    def _bind_canvas(cls, canvas):
+        if canvas in cls.bound:
+            return
+        cls.bound.add(canvas)
+        for sequence, method in cls.events:
+            canvas.tag_bind(cls.tag, sequence, cls._dispatch(canvas, method))
+        MenuUtils.bind_canvas_context(canvas, cls.tag, cls._dispatch(canvas, "_context_menu"))
+
+    @classmethod
+    def _dispatch(cls, canvas, method):
+
+        def handler(event):
+            current = canvas.find_withtag("current")
+            handle = cls.handles[canvas].get(current[0]) if current else None
+            if handle is not None:
+                getattr(handle, method)(event)
 
-class Coordinate:
+        return handler
+
+    def _context_menu(self, event):
+        pass
+
+    def retire(self):
+        # remove from view without deleting if the pool has room
+        pool = self.pool[self.canvas]
+        if len(pool) < self.POOL_SIZE:
+            self.canvas.itemconfigure(self._id, state='hidden')
+            pool.append(self)
+        else:
+            self.canvas.delete(self._id)
+            self.handles[self.canvas].pop(self._id, None)
+
+    @classmethod
+    def clear(cls, canvas):
+        # forget handles of a canvas that is no longer in use
+        cls.pool.pop(canvas, None)
+        cls.handles.pop(canvas, None)
+        cls.bound.discard(canvas)
+
+
+class Coordinate(Handle):
+    tag = "coordinate"
     pool = defaultdict(list)
-    active = set()
+    handles = defaultdict(dict)
+    bound = set()
+    events = (
+        ("<ButtonRelease-1>", "_end_drag"),
+        ("<Motion>", "_drag"),
+        ("<Enter>", "_enter"),
+        ("<Leave>", "_leave"),
+    )
     min_radius = 3
     max_radius = 5
 
     def __init__(self, canvas, controller, x, y):
         self.radius = self.min_radius
-        self.canvas = canvas
-        self.controller = controller
         self.x = x
         self.y = y
-        self._id = canvas.create_oval(
-            x - self.radius, y - self.radius, x + self.radius, y + self.radius,
+        # index of the item vertex represented if any
+        self.index = None
+        self._listeners = []
+        super(Coordinate, self).__init__(canvas, controller)
+
+    def _create(self):
+        x, y, radius = self.x, self.y, self.radius
+        return self.canvas.create_oval(
+            x - radius, y - radius, x + radius, y + radius,
             fill=self.controller.tool.studio.style.colors["accent"],
-            tags=("coordinate", "controller")
+            tags=(self.tag, "controller")
         )
-        canvas.tag_bind(self._id, "<ButtonRelease-1>", self._end_drag)
-        canvas.tag_bind(self._id, "<Motion>", self._drag)
-        canvas.tag_bind(self._id, "<Enter>", lambda _: self.grow_effect())
-        canvas.tag_bind(self._id, "<Leave>", lambda _: self.grow_effect(True))
-        MenuUtils.bind_canvas_context(self.canvas, self._id, self._context_menu)
-        self.active.add(self)
-        self._listeners = []
 
     def grow_effect(self, shrink=False):
         self.radius = self.min_radius if shrink else self.max_radius
         self.place()
 
+    def _enter(self, _):
+        self.grow_effect()
+
+    def _leave(self, _):
+        self.grow_effect(True)
+
     def add_listener(self, func, *args, **kwargs):
         def callback():
             func(*args, **kwargs)
@@ -63,10 +156,9 @@ class Coordinate:
             self._listeners.remove(callback)
 
     def retire(self):
-        # remove from view without deleting
-        self.canvas.itemconfigure(self._id, state='hidden')
-        self.pool["canvas"].append(self)
         self._listeners = []
+        self.index = None
+        super(Coordinate, self).retire()
 
     def place(self, x=None, y=None):
         x = self.x if x is None else x
@@ -85,9 +177,9 @@ class Coordinate:
 
     def revive(self, controller, x, y):
         self.controller = controller
+        self.radius = self.min_radius
         self.canvas.itemconfigure(self._id, state='normal')
         self.place(x, y)
-        self.active.add(self)
 
     def _context_menu(self, event):
         self.controller.on_coord_context(self, event)
@@ -106,31 +198,36 @@ class Coordinate:
     @classmethod
     def acquire(cls, canvas, controller, x, y):
         if cls.pool[canvas]:
-            coord = cls.pool[canvas][0]
-            cls.pool[canvas].remove(coord)
+            coord = cls.pool[canvas].pop()
             coord.revive(controller, x, y)
             return coord
         return cls(canvas, controller, x, y)
 
 
-class Link:
+class Link(Handle):
+    tag = "link"
     pool = defaultdict(list)
-    active = set()
+    handles = defaultdict(dict)
+    bound = set()
+    events = (
+        ("<ButtonRelease-1>", "_end_drag"),
+        ("<Motion>", "_drag"),
+    )
 
     def __init__(self, canvas, controller, coord1, coord2):
-        self.canvas = canvas
-        self.controller = controller
-        self._id = canvas.create_line(
-            coord1.x, coord1.y, coord2.x, coord2.y,
+        self.coord1 = coord1
+        self.coord2 = coord2
+        self._callbacks = ()
+        self._coord_latch = None
+        super(Link, self).__init__(canvas, controller)
+        self.link_coord(coord1, coord2)
+
+    def _create(self):
+        return self.canvas.create_line(
+            self.coord1.x, self.coord1.y, self.coord2.x, self.coord2.y,
             fill=self.controller.tool.studio.style.colors["accent"],
-            tag=("link", "controller"), dash=(5, 4), width=2
+            tag=(self.tag, "controller"), dash=(5, 4), width=2
         )
-        self.link_coord(coord1, coord2)
-        canvas.tag_bind(self._id, "<ButtonRelease-1>", self._end_drag)
-        MenuUtils.bind_canvas_context(self.canvas, self._id, self._context_menu)
-        canvas.tag_bind(self._id, "<Motion>", self._drag)
-        self.active.add(self)
-        self._coord_latch = None
 
     def _to_canvas_coord(self, x, y):
         return self.canvas.canvasx(x), self.canvas.canvasy(y)
@@ -158,27 +255,29 @@ class Link:
         self.canvas.tag_lower(self._id, "coordinate")
 
     def link_coord(self, coord1, coord2):
-        coord1.add_listener(self.coord_changed)
-        coord2.add_listener(self.coord_changed)
+        self._callbacks = (
+            (coord1, coord1.add_listener(self.coord_changed)),
+            (coord2, coord2.add_listener(self.coord_changed)),
+        )
         self.coord1 = coord1
         self.coord2 = coord2
         self.place(coord1, coord2)
 
     def unlink_coord(self):
+        for coord, callback in self._callbacks:
+            coord.remove_listener(callback)
+        self._callbacks = ()
         self.coord1 = self.coord2 = None
-        self._listeners = []
 
     def revive(self, controller, coord1, coord2):
         self.controller = controller
         self.canvas.itemconfigure(self._id, state='normal')
         self.link_coord(coord1, coord2)
-        self.active.add(self)
 
     def retire(self):
-        # remove from view without deleting
-        self.canvas.itemconfigure(self._id, state='hidden')
-        self.pool["canvas"].append(self)
         self.unlink_coord()
+        self._coord_latch = None
+        super(Link, self).retire()
 
     def coord_changed(self):
         self.place(self.coord1, self.coord2)
@@ -186,10 +285,9 @@ class Link:
     @classmethod
     def acquire(cls, canvas, controller, coord1, coord2):
         if cls.pool[canvas]:
-            coord = cls.pool[canvas][0]
-            cls.pool[canvas].remove(coord)
-            coord.revive(controller, coord1, coord2)
-            return coord
+            link = cls.pool[canvas].pop()
+            link.revive(controller, coord1, coord2)
+            return link
         return cls(canvas, controller, coord1, coord2)
 
 
@@ -231,12 +329,14 @@ class Controller(abc.ABC):
     def on_link_context(self, link, event):
         pass
 
-    def on_move(self, delta_x, delta_y, propagated=False):
+    def on_move(self, delta_x, delta_y):
+        # the item moves along with the rest of the selection
+        self.tool.queue_move(delta_x, delta_y)
+
+    def shift(self, delta_x, delta_y):
+        # follow the item after it has been moved
         for coord in self.coords:
             coord.shift(delta_x, delta_y)
-        self.item.move(delta_x, delta_y)
-        if not propagated:
-            self.tool.propagate_move(delta_x, delta_y, self.item)
 
     def on_release(self):
         self.tool.on_layout_change()
@@ -304,11 +404,45 @@ class SquareController(Controller):
         )
 
 
+def vertex_subset(points, spacing, limit):
+    """
+    Pick the vertices of a shape worth showing a handle for. Vertices closer
+    than ``spacing`` to the last picked vertex on both axes are skipped and
+    the rest are thinned out evenly to at most ``limit``. The first and last
+    vertices are always picked
+
+    :param points: list of ``(x, y)`` vertices
+    :param spacing: minimum distance between picked vertices
+    :param limit: maximum number of vertices picked, at least 2
+    :return: sorted list of indices of picked vertices
+    """
+    if len(points) <= 2:
+        return list(range(len(points)))
+    picked = [0]
+    last_x, last_y = points[0]
+    for index in range(1, len(points) - 1):
+        x, y = points[index]
+        if abs(x - last_x) >= spacing or abs(y - last_y) >= spacing:
+            picked.append(index)
+            last_x, last_y = x, y
+    picked.append(len(points) - 1)
+    if len(picked) > limit:
+        step = math.ceil((len(picked) - 1) / (limit - 1))
+        picked = picked[:-1:step] + picked[-1:]
+    return picked
+
+
 class LinearController(Controller):
     _closed = False
+    # maximum number of vertex handles shown at once
+    MAX_HANDLES = 200
+    # minimum distance in pixels between vertex handles
+    HANDLE_SPACING = 8
 
     def __init__(self, canvas, tool, item=None, **kw):
         super(LinearController, self).__init__(canvas, tool, item, **kw)
+        # vertices of the item, only a subset may have handles
+        self.points = []
         if item:
             self.highlight(item)
         self._link_context = MenuUtils.make_dynamic((
@@ -334,50 +468,50 @@ class LinearController(Controller):
     def _add_point(self):
         if not self._active_link:
             return
-        index = self.coords.index(self._active_link.coord1) + 1
-        new_coord = Coordinate.acquire(self.canvas, self, *self._active_point)
-        self.coords.insert(index, new_coord)
+        self.points.insert(self._active_link.coord1.index + 1, self._active_point)
         self.item.coords(self.get_coords())
         self.update()
         self.tool.on_layout_change()
 
     def _remove_point(self):
-        if not self._active_coord:
+        if not self._active_coord or len(self.points) <= 2:
             return
-        self.coords.remove(self._active_coord)
-        self._active_coord.retire()
+        self.points.pop(self._active_coord.index)
         self.item.coords(self.get_coords())
         self.update()
         self.tool.on_layout_change()
 
     def on_coord_change(self, coord):
+        self.points[coord.index] = coord.x, coord.y
         self.item.coords(self.get_coords())
         self._change()
 
     def get_coords(self):
-        return [coord for c in self.coords for coord in (c.x, c.y)]
+        return [coord for point in self.points for coord in point]
+
+    def shift(self, delta_x, delta_y):
+        self.points = [(x + delta_x, y + delta_y) for x, y in self.points]
+        super(LinearController, self).shift(delta_x, delta_y)
 
     def update(self):
-        # there is no smarter way to adjust links and coordinates
-        # clear them and reapply
-        self.release()
+        # handles are returned to the pool and acquired again
         self.highlight(self.item)
 
     def highlight(self, item):
         coords = item.coords()
+        # zip drops the last coordinate in case the length is odd
+        self.points = list(zip(coords[::2], coords[1::2]))
         self.release()
-        prev = Coordinate.acquire(self.canvas, self, *coords[:2])
-        self.coords.append(prev)
-        for i in range(2, len(coords), 2):
-            # just in case the length of coordinates is odd
-            if i + 1 >= len(coords):
-                break
-            cd = Coordinate.acquire(self.canvas, self, coords[i], coords[i + 1])
+        prev = None
+        for index in vertex_subset(self.points, self.HANDLE_SPACING, self.MAX_HANDLES):
+            cd = Coordinate.acquire(self.canvas, self, *self.points[index])
+            cd.index = index
             self.coords.append(cd)
-            self.links.append(Link.acquire(self.canvas, self, prev, cd))
+            if prev is not None:
+                self.links.append(Link.acquire(self.canvas, self, prev, cd))
             prev = cd
 
-        if self._closed:
+        if self._closed and len(self.coords) > 1:
             self.links.append(Link.acquire(self.canvas, self, prev, self.coords[0]))
 
         # ensure you have at least one item with "controller" tag before calling super
@@ -403,9 +537,10 @@ class PointController(Controller):
         self.item.coords(self.get_coords())
         self._change()
 
-    def on_move(self, delta_x, delta_y, propagated=False):
-        super(PointController, self).on_move(delta_x, delta_y, propagated)
-        self.highlight(self.item)
+    def shift(self, delta_x, delta_y):
+        super(PointController, self).shift(delta_x, delta_y)
+        if self._border:
+            self.canvas.move(self._border, delta_x, delta_y)
 
     def _get_border_coords(self, item):
         bbox = item.bbox() or (*item.coords(), *item.coords())
@@ -625,7 +760,7 @@ class CanvasStyleGroup(StyleGroup):
         data = data[0]
         for item in data:
             item.configure(data[item])
-            if item._controller:
+            if getattr(item, "_controller", None):
                 item._controller.update()
         if self.tool.canvas == widgets[0]:
             self.on_widgets_change()
@@ -634,7 +769,7 @@ class CanvasStyleGroup(StyleGroup):
     def _set_prop(self, prop, value, widget):
         for item in self.cv_items:
             item.configure({prop: value})
-            if item._controller:
+            if getattr(item, "_controller", None):
                 item._controller.update()
         self.tool.on_items_modified(self.cv_items)
 
@@ -799,6 +934,16 @@ class CanvasTool(BaseTool):
         self.current_draw = None
         self.selected_items = []
         self._latch_pos = 0, 0
+        # items currently carrying the selection tag
+        self._tagged = set()
+        self._outline = None
+        self._pending_move = 0, 0
+        self._move_job = None
+        # state of the pointer gesture started on the canvas
+        self._press_item = None
+        self._drag_latch = None
+        self._band_origin = None
+        self._band = None
 
         self._image_placeholder = icon("image", 60, 60)
 
@@ -889,12 +1034,16 @@ class CanvasTool(BaseTool):
                 "<Motion>", self._draw_dispatch("on_motion"), True)
             canvas.bind("<Shift-Button-1>", self._enter_pointer_mode, True)
             canvas.bind("<Button-1>", self._latch_and_focus(canvas), True)
+            canvas.bind("<Button-1>", lambda e: self._on_press(canvas, e), True)
+            canvas.bind("<Motion>", lambda e: self._on_drag(canvas, e), True)
+            canvas.bind("<ButtonRelease>", lambda e: self._on_release(canvas, e), True)
             canvas.intercept_select = lambda event: self.intercept_select(canvas, event)
             canvas.on_context_menu(self._show_canvas_menu(canvas))
             canvas._cv_tree = CanvasTreeView(canvas)
             canvas._cv_tree.on_structure_change(self._update_stacking, canvas)
             canvas._cv_tree.on_select(self._update_selection, canvas)
             canvas._cv_items = []
+            canvas._cv_index = SpatialIndex()
             canvas._cv_initialized = True
             canvas._cv_tool = self
 
@@ -902,9 +1051,25 @@ class CanvasTool(BaseTool):
         if canvas != self.canvas:
             return False
         x, y = canvas.canvasx(event.x), canvas.canvasy(event.y)
-        if canvas.find_overlapping(x, y, x, y):
-            return True
-        return False
+        return self._on_handle(canvas) or self.item_at(canvas, x, y) is not None
+
+    def item_at(self, canvas, x, y):
+        # the spatial index narrows down the items around the position and
+        # the item tk picked as current decides which one is actually hit
+        candidates = canvas._cv_index.at(x, y, HIT_HALO)
+        if not candidates:
+            return None
+        current = canvas.find_withtag("current")
+        if not current:
+            return None
+        for item in candidates:
+            if item._id == current[0]:
+                return item
+        return None
+
+    def _on_handle(self, canvas):
+        # check whether the pointer is over a controller element
+        return "controller" in canvas.gettags("current")
 
     @property
     def sorted_selected_items(self):
@@ -934,8 +1099,14 @@ class CanvasTool(BaseTool):
         def show(event):
             x, y = canvas.canvasx(event.x), canvas.canvasy(event.y)
             self._latch_pos = x, y
-            if not canvas.find_overlapping(x, y, x, y):
+            if self._on_handle(canvas):
+                # controller elements have their own menus
+                return 'break'
+            item = self.item_at(canvas, x, y)
+            if item is None:
                 self.studio.designer.show_menu(event, self.canvas)
+            elif item in self.selected_items:
+                MenuUtils.popup(event, self._item_context_menu)
             return 'break'
         return show
 
@@ -1011,10 +1182,7 @@ class CanvasTool(BaseTool):
         canvas._cv_items.append(item)
         item._prev_index = canvas._cv_items.index(item)
         node = canvas._cv_tree.add_as_node(item=item)
-        item.bind("<ButtonRelease-1>", lambda e: self._handle_select(item, e), True)
-        item.bind("<ButtonRelease-1>", lambda e: self._handle_end(item, e), True)
-        item.bind("<Motion>", lambda e: self._handle_move(item, e), True)
-        MenuUtils.bind_context(item, self._show_item_menu(item))
+        canvas._cv_index.add(item, item.bbox())
         MenuUtils.bind_all_context(node, self._show_item_menu(item))
         if not silently:
             self.studio.new_action(Action(
@@ -1033,6 +1201,7 @@ class CanvasTool(BaseTool):
         for item in items:
             item.hide()
             canvas._cv_items.remove(item)
+            canvas._cv_index.remove(item)
             item.node.remove()
             self.studio.designer.remove_color_data(item.properties)
         if not silently:
@@ -1048,6 +1217,7 @@ class CanvasTool(BaseTool):
             if item._prev_index is not None:
                 canvas._cv_items.insert(item._prev_index, item)
             canvas._cv_tree.insert(item._prev_index, item.node)
+            canvas._cv_index.add(item, item.bbox())
             self.studio.designer.add_color_data(item.properties)
 
     def _get_copy_data(self):
@@ -1098,35 +1268,63 @@ class CanvasTool(BaseTool):
         if has_selected:
             return True
 
-    def _handle_move(self, item, event):
+    def _on_press(self, canvas, event):
+        self._press_item = self._band_origin = self._drag_latch = None
+        if canvas != self.canvas or self.current_draw is not None:
+            return
+        if self._on_handle(canvas):
+            # controller elements handle their own drags
+            return
+        x, y = canvas.canvasx(event.x), canvas.canvasy(event.y)
+        self._press_item = self.item_at(canvas, x, y)
+        if self._press_item is None:
+            self._band_origin = x, y
+
+    def _on_drag(self, canvas, event):
         if not event.state & EventMask.MOUSE_BUTTON_1:
             # we need mouse button 1 to be down to qualify as a drag
             return
-        if getattr(item, '_controller', None) and self.current_draw is None:
-            if getattr(item, '_coord_latch', None):
-                x0, y0 = item._coord_latch
-                x, y = item.canvas.canvasx(event.x), item.canvas.canvasx(event.y)
-                item._controller.on_move(x - x0, y - y0)
-                item._coord_latch = x, y
-            else:
-                item._coord_latch = item.canvas.canvasx(event.x), item.canvas.canvasx(event.y)
-
-    def _handle_end(self, item, _):
-        if getattr(item, '_coord_latch', None) and self.current_draw is None:
-            self.on_layout_change()
-        item._coord_latch = None
-
-    def _handle_select(self, item, event):
-        if self.canvas is None:
+        if canvas != self.canvas or self.current_draw is not None:
+            return
+        x, y = canvas.canvasx(event.x), canvas.canvasy(event.y)
+        if self._band_origin is not None:
+            self._show_band(canvas, x, y)
+        elif self._press_item in self._tagged:
+            if self._drag_latch:
+                x0, y0 = self._drag_latch
+                self.queue_move(x - x0, y - y0)
+            self._drag_latch = x, y
+
+    def _on_release(self, canvas, event):
+        if event.num != 1:
             return
-        if self.current_draw is not None or getattr(item, '_coord_latch', None):
-            # if coord_latch has a value then it means we have been dragging
-            # an item and the button release means end of drag and not selection
+        item, self._press_item = self._press_item, None
+        latch, self._drag_latch = self._drag_latch, None
+        self._band_origin = None
+        if canvas != self.canvas or self.current_draw is not None:
             return
-        if event.state & EventMask.CONTROL:
-            self.select_item(item, True)
+        multi = bool(event.state & EventMask.CONTROL)
+        if self._band is not None:
+            bounds = canvas.coords(self._band)
+            canvas.delete(self._band)
+            self._band = None
+            self.select_region(bounds, multi)
+        elif item is not None:
+            if latch:
+                # button release means end of drag and not selection
+                self.on_layout_change()
+            else:
+                self.select_item(item, multi)
+
+    def _show_band(self, canvas, x, y):
+        x0, y0 = self._band_origin
+        if self._band is None:
+            self._band = canvas.create_rectangle(
+                x0, y0, x, y, outline=self.studio.style.colors["accent"],
+                dash=(5, 4), state="disabled"
+            )
         else:
-            self.select_item(item)
+            canvas.coords(self._band, x0, y0, x, y)
 
     def _draw_dispatch(self, event_type):
 
@@ -1153,6 +1351,9 @@ class CanvasTool(BaseTool):
     def _evaluator(self, widget):
         return isinstance(widget, Canvas)
 
+    def selectable(self, item):
+        return item.__class__ in self.controller_map
+
     def set_controller(self, item):
         controller_class = self.controller_map.get(item.__class__)
         if controller_class:
@@ -1167,8 +1368,46 @@ class CanvasTool(BaseTool):
 
     def selection_changed(self):
         # called when canvas item selection changes
+        self._sync_selection()
         self.style_group.on_widgets_change()
 
+    def _sync_selection(self):
+        selected = set(self.selected_items)
+        for item in self._tagged - selected:
+            item.dtag(SELECTION_TAG)
+            self.remove_controller(item)
+        for item in selected - self._tagged:
+            item.addtag(SELECTION_TAG)
+        self._tagged = selected
+        # only the first few items get a controller
+        for index, item in enumerate(self.selected_items):
+            has_controller = getattr(item, "_controller", None) is not None
+            if index < MAX_CONTROLLERS and not has_controller:
+                self.set_controller(item)
+            elif index >= MAX_CONTROLLERS and has_controller:
+                self.remove_controller(item)
+        self._update_outline()
+
+    def _update_outline(self):
+        if self._outline is not None:
+            canvas, outline = self._outline
+            if canvas != self.canvas or len(self.selected_items) <= MAX_CONTROLLERS:
+                canvas.delete(outline)
+                self._outline = None
+        if self.canvas is None or len(self.selected_items) <= MAX_CONTROLLERS:
+            return
+        bounds = self.canvas._cv_index.bounds(self.selected_items)
+        if bounds is None:
+            return
+        x1, y1, x2, y2 = bounds[0] - 2, bounds[1] - 2, bounds[2] + 2, bounds[3] + 2
+        if self._outline is None:
+            self._outline = self.canvas, self.canvas.create_rectangle(
+                x1, y1, x2, y2, outline=self.studio.style.colors["accent"],
+                dash=(5, 4), width=2, state="disabled", tags=(SELECTION_TAG,)
+            )
+        else:
+            self.canvas.coords(self._outline[1], x1, y1, x2, y2)
+
     def _update_selection(self, canvas):
         # update selections from the canvas tree
         if canvas != self.canvas:
@@ -1180,29 +1419,24 @@ class CanvasTool(BaseTool):
 
         # deselect items currently selected that shouldn't be
         for item in selected - to_select:
-            self.remove_controller(item)
             self.selected_items.remove(item)
 
         # select items to be selected that are not yet selected
         for item in to_select - selected:
-            controller = self.set_controller(item)
-            if not controller:
-                return
-            self.selected_items.append(item)
+            if self.selectable(item):
+                self.selected_items.append(item)
 
         self.selection_changed()
 
     def _clear_selection(self):
         if self.selected_items:
             for item in self.selected_items:
-                self.remove_controller(item)
                 item.canvas._cv_tree.deselect(item.node)
 
             self.selected_items.clear()
             self.selection_changed()
 
     def _deselect(self, item):
-        self.remove_controller(item)
         self.selected_items.remove(item)
         item.canvas._cv_tree.deselect(item.node)
 
@@ -1220,8 +1454,7 @@ class CanvasTool(BaseTool):
             if item in self.selected_items:
                 self._deselect(item)
             else:
-                controller = self.set_controller(item)
-                if not controller:
+                if not self.selectable(item):
                     return
                 self.selected_items.append(item)
                 item.node.select(silently=True)
@@ -1229,17 +1462,32 @@ class CanvasTool(BaseTool):
             for i in self.selected_items:
                 if i == item:
                     continue
-                self.remove_controller(i)
                 i.canvas._cv_tree.deselect(i.node)
             if item in self.selected_items:
                 self.selected_items = [item]
-            elif self.set_controller(item):
+            elif self.selectable(item):
                 self.selected_items = [item]
                 item.node.select(silently=True)
             item.node.tree.see(item.node)
 
         self.selection_changed()
 
+    def select_region(self, bounds, multi=False):
+        # select all items overlapping bounds in stacking order
+        hits = set(filter(self.selectable, self.canvas._cv_index.overlapping(*bounds)))
+        items = sorted(hits, key=lambda i: i._prev_index)
+        if not multi:
+            for item in self.selected_items:
+                if item not in hits:
+                    item.canvas._cv_tree.deselect(item.node)
+            self.selected_items = [i for i in self.selected_items if i in hits]
+        selected = set(self.selected_items)
+        for item in items:
+            if item not in selected:
+                self.selected_items.append(item)
+                item.node.select(silently=True)
+        self.selection_changed()
+
     def on_select(self, _):
         if len(self.studio.selection) == 1:
             widget = self.studio.selection[0]
@@ -1265,13 +1513,18 @@ class CanvasTool(BaseTool):
     def release(self, canvas):
         if canvas is None or not getattr(canvas, "_cv_initialized", False):
             return
+        self._flush_move()
         self._clear_selection()
 
     def on_layout_change(self):
+        self._flush_move()
         prev_data = {item: item._coord_restore for item in self.selected_items}
         data = {item: item.coords() for item in self.selected_items}
         for item in self.selected_items:
             item._coord_restore = item.coords()
+        # moves are tracked by the index but controllers may reshape items
+        self._reindex(self.selected_items[:MAX_CONTROLLERS])
+        self._update_outline()
         self.studio.new_action(Action(
             lambda _: self.restore_layouts(prev_data),
             lambda _: self.restore_layouts(data)
@@ -1280,23 +1533,51 @@ class CanvasTool(BaseTool):
     def restore_layouts(self, data):
         for item in data:
             item.coords(*data[item])
-            if item._controller:
+            if getattr(item, "_controller", None):
                 item._controller.update()
+        self._reindex(data)
+        self._update_outline()
+
+    def _reindex(self, items):
+        for item in items:
+            if item in item.canvas._cv_index:
+                item.canvas._cv_index.update(item, item.bbox())
 
     def on_item_added(self, item):
         item._coord_restore = item.coords()
+        self._reindex([item])
 
     def on_items_modified(self, items):
         for item in items:
             item.node.widget_modified(item)
+        self._reindex(items)
+        self._update_outline()
 
     def on_widgets_delete(self, widgets):
         for widget in widgets:
             if isinstance(widget, Canvas):
                 if widget in self.items:
                     self.items.remove(widget)
-
-    def propagate_move(self, delta_x, delta_y, source=None):
-        for item in self.selected_items:
-            if item != source:
-                item._controller.on_move(delta_x, delta_y, True)
+                Coordinate.clear(widget)
+                Link.clear(widget)
+
+    def queue_move(self, delta_x, delta_y):
+        # moves are accumulated and applied at most once every MOVE_INTERVAL
+        dx, dy = self._pending_move
+        self._pending_move = dx + delta_x, dy + delta_y
+        if self._move_job is None and self.canvas is not None:
+            self._move_job = self.canvas.after(MOVE_INTERVAL, self._flush_move)
+
+    def _flush_move(self):
+        if self._move_job is not None:
+            self.canvas.after_cancel(self._move_job)
+            self._move_job = None
+        (dx, dy), self._pending_move = self._pending_move, (0, 0)
+        if not (dx or dy) or self.canvas is None:
+            return
+        # all selected items and the group outline share the selection tag
+        self.canvas.move(SELECTION_TAG, dx, dy)
+        self.canvas._cv_index.move(self.selected_items, dx, dy)
+        for item in self.selected_items[:MAX_CONTROLLERS]:
+            if getattr(item, "_controller", None):
+                item._controller.shift(dx, dy)
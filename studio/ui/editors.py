@@ -34,11 +34,12 @@ def get_display_name(style_def, pref):
 
 
 class Editor(Frame):
+    height = 25
 
     def __init__(self, master, style_def=None):
         super().__init__(master)
         self.style_def = style_def
-        self.config(**self.style.surface, width=150, height=25)
+        self.config(**self.style.surface, width=150, height=self.height)
         self.pack_propagate(False)
         self.grid_propagate(0)
         self._on_change = None
@@ -55,6 +56,11 @@ class Editor(Frame):
     def set_def(self, definition):
         self.style_def = definition
 
+    @classmethod
+    def get_height(cls, style_def):
+        # height the editor will occupy given the definition
+        return cls.height
+
 
 class Choice(Editor):
     # Some subclasses may not need to repopulate when definition changes
@@ -329,10 +335,11 @@ class Text(TextMixin, Editor):
 
 
 class Textarea(TextMixin, Editor):
+    height = 60
 
     def __init__(self, master, style_def=None):
         super().__init__(master, style_def)
-        self.config(**self.style.highlight_active, height=60)
+        self.config(**self.style.highlight_active)
         self._entry = widgets.Text(self, **self.style.textarea)
         self._entry.configure(**self.style.no_highlight)
         self._entry.pack(fill="x")
@@ -417,10 +424,11 @@ class Duration(TextMixin, Editor):
 
 
 class Font(Editor):
+    height = 50
 
     def __init__(self, master, style_def=None):
         super().__init__(master, style_def)
-        self.config(height=50, **self.style.highlight_active)
+        self.config(**self.style.highlight_active)
         self._input = FontInput(self)
         self._input.pack(fill='both', expand=True)
         self.set_def(style_def)
@@ -519,11 +527,11 @@ class Dimension(TextMixin, Editor):
 
 
 class Anchor(Editor):
+    height = 110
 
     def __init__(self, master, style_def):
         super().__init__(master, style_def)
         self.set_def(style_def)
-        self.config(width=150, height=110)
         self.n = ToggleButton(self, text="N", width=20, height=20)
         self.n.grid(row=0, column=0, columnspan=3, sticky='ns')
         self.w = ToggleButton(self, text='W', width=20, height=20)
@@ -753,14 +761,21 @@ class Widget(Choice):
         self._spinner.set(value)
 
 
-def get_editor(parent, definition):
+def get_editor_class(definition):
     if "compose" in definition:
         type_ = "Compose"
     else:
         type_ = definition.get("type").capitalize()
 
-    editor = getattr(sys.modules[__name__], type_, Text)
-    return editor(parent, definition)
+    return getattr(sys.modules[__name__], type_, Text)
+
+
+def get_editor(parent, definition):
+    return get_editor_class(definition)(parent, definition)
+
+
+def get_editor_height(definition):
+    return get_editor_class(definition).get_height(definition)
 
 
 class Compose(Editor):
@@ -794,6 +809,11 @@ class Compose(Editor):
 
         self.config(height=height)
 
+    @classmethod
+    def get_height(cls, style_def):
+        # each item takes up a label row and an editor row
+        return 50 * len(style_def.get("compose", []))
+
     def _create_editor(self, definition, row, column, columnspan):
         Label(
             self,
@@ -847,6 +867,10 @@ class Padding(Compose):
         ]
         super().__init__(master, style_def)
 
+    @classmethod
+    def get_height(cls, style_def):
+        return 50 * len(style_def.get("sides", []))
+
     def set(self, value):
         self.val = value
         value = str(value).split() if not isinstance(value, (tuple, list, set)) else list(value)
@@ -6,8 +6,11 @@ Widget tree for the studio
 # Copyright (C) 2019 Hoverset Group.                                      #
 # ======================================================================= #
 from abc import ABC
+import bisect
 import enum
+import tkinter as tk
 
+from hoverset.data.search import SearchIndex
 from hoverset.ui.icons import get_icon_image
 from hoverset.ui.widgets import EventMask, ScrolledFrame, Label, Tree, Frame
 from hoverset.ui.windows import DragWindow
@@ -384,7 +387,8 @@ class NestedTreeView(MalleableTree, Frame):
             cls.__icons_loaded = True
 
     def __init__(self, node, **kw):
-        super(NestedTreeView, self).__init__(node, **kw)
+        # use the node's body as master to support nodes that are not widgets
+        super(NestedTreeView, self).__init__(node.body, **kw)
         self.initialize_tree()
 
     def get_body(self):
@@ -409,3 +413,628 @@ class NestedTreeView(MalleableTree, Frame):
         # Update depth even for child nodes
         for node in self.nodes:
             node.depth = self._depth + 1
+
+
+class VirtualTreeView(Tree, ScrolledFrame):
+    """
+    Tree view that keeps a lightweight model of its nodes and only renders
+    the rows visible in the viewport. Row widgets are recycled as the view
+    is scrolled, expanded or collapsed so the number of tk widgets stays
+    proportional to the visible area rather than the size of the tree.
+
+    Tk widgets such as :py:class:`NestedTreeView` can still be added as
+    children of a node. They are placed in the body with their requested
+    height when visible.
+    """
+    ROW_HEIGHT = 24
+    # rows rendered beyond the edges of the viewport to reduce flicker
+    OVERSCAN = 5
+
+    class Row(Frame):
+        """
+        Recyclable widget used to display a node
+        """
+        EXPANDED_ICON = None
+        COLLAPSED_ICON = None
+        BLANK = None
+        __icons_loaded = False
+
+        def __init__(self, tree):
+            super().__init__(tree.get_body(), **tree.style.surface, takefocus=True)
+            self._load_images()
+            self.tree = tree
+            self.node = None
+            self._sequences = set()
+            self.expander = Label(self, **self.style.text, image=self.BLANK)
+            self.expander.pack(side="left")
+            self.icon_pad = Label(self, **self.style.text)
+            self.icon_pad.pack(side="left")
+            self.name_pad = Label(self, **self.style.text)
+            self.name_pad.pack(side="left")
+            self.expander.bind("<Button-1>", self._toggle)
+            for widget in self.parts():
+                widget.bind("<ButtonRelease-1>", self._release)
+                widget.bind("<Return>", self._select)
+                widget.bind("<B1-Motion>", self._drag)
+
+        def _load_images(self):
+            if self.__icons_loaded:
+                return
+            cls = self.__class__
+            cls.EXPANDED_ICON = get_icon_image("chevron_down", 14, 14)
+            cls.COLLAPSED_ICON = get_icon_image("chevron_right", 14, 14)
+            cls.BLANK = get_icon_image("blank", 14, 14)
+            cls.__icons_loaded = True
+
+        def parts(self):
+            return self, self.expander, self.icon_pad, self.name_pad
+
+        def _toggle(self, *_):
+            if self.node:
+                self.node.toggle()
+
+        def _select(self, event):
+            if self.node:
+                self.node.select(event)
+
+        def _release(self, event):
+            if self.tree.end_drag(event):
+                return
+            if event.widget != self.expander:
+                self._select(event)
+
+        def _drag(self, event):
+            if self.node:
+                self.tree.drag(self.node, event)
+
+        def _dispatch(self, sequence, event):
+            if not self.node:
+                return
+            for func in self.node._bindings.get(sequence, ()):
+                func(event)
+
+        def _bind_sequence(self, sequence):
+            if sequence in self._sequences:
+                return
+            self._sequences.add(sequence)
+            for widget in self.parts():
+                widget.bind(sequence, lambda e, seq=sequence: self._dispatch(seq, e), add='+')
+
+        def bind_node(self, node):
+            self.node = node
+            for sequence in node._bindings:
+                self._bind_sequence(sequence)
+            self.refresh()
+
+        def refresh(self):
+            node = self.node
+            if node.nodes:
+                self.expander.configure(image=self.EXPANDED_ICON if node._expanded else self.COLLAPSED_ICON)
+            else:
+                self.expander.configure(image=self.BLANK)
+            self.expander.pack_configure(padx=(30 * (node.depth - 1), 0))
+            self.icon_pad.configure(image=node.get_icon() or self.BLANK)
+            self.name_pad.configure(text=node.name)
+            self.config_all(**(self.style.hover if node.selected else self.style.surface))
+
+    class Node:
+        """
+        Lightweight node model. It exposes the same interface as
+        :py:class:`hoverset.ui.widgets.Tree.Node` but owns no tk widgets
+        """
+
+        def __init__(self, tree, **config):
+            self.tree = tree
+            self._icon = config.get("icon")
+            self._name = config.get("name", "unknown")
+            self._is_terminal = config.get("terminal", True)
+            self._bindings = {}
+            self._visible = True
+            self._expanded = False
+            self._selected = False
+            self._depth = 0
+            self.parent_node = None
+            self.nodes = []
+            # if true allows node to be dragged and repositioned
+            self.editable = False
+            self.configuration = config
+
+        @property
+        def tk(self):
+            return self.tree.tk
+
+        @property
+        def body(self):
+            # tk widgets added as children are placed in the tree body
+            return self.tree.get_body()
+
+        @property
+        def selected(self):
+            return self._selected
+
+        @property
+        def depth(self):
+            return self._depth
+
+        @depth.setter
+        def depth(self, value):
+            self._depth = value
+            for node in self.nodes:
+                node.depth = self._depth + 1
+
+        @property
+        def name(self):
+            return self._name
+
+        @name.setter
+        def name(self, value):
+            self._name = value
+            self.tree._reindex(self)
+            self._refresh()
+
+        @property
+        def is_terminal(self):
+            return self._is_terminal
+
+        @is_terminal.setter
+        def is_terminal(self, value):
+            self._is_terminal = value
+
+        def get_icon(self):
+            return self._icon
+
+        def _refresh(self):
+            row = self.tree._rendered.get(self)
+            if row is not None:
+                row.refresh()
+
+        def _changed(self):
+            self.tree.invalidate()
+
+        def bind_all(self, sequence=None, func=None, add=None):
+            if add:
+                self._bindings.setdefault(sequence, []).append(func)
+            else:
+                self._bindings[sequence] = [func]
+            row = self.tree._rendered.get(self)
+            if row is not None:
+                row.bind_node(self)
+
+        def is_descendant(self, node):
+            parent = self.parent_node
+            while parent is not None:
+                if parent == node:
+                    return True
+                parent = parent.parent_node
+            return False
+
+        def select(self, event=None, silently=False):
+            if event and event.state & EventMask.CONTROL:
+                self.tree.toggle_from_selection(self)
+                return
+            if event:
+                self.tree.select(self)
+            else:
+                self.tree.add_to_selection(self, silently)
+            self._selected = True
+            self._refresh()
+
+        def deselect(self, *_):
+            self._selected = False
+            self._refresh()
+
+        def index(self):
+            return self.parent_node.nodes.index(self)
+
+        def toggle_select(self, event):
+            if self._selected:
+                self.deselect(event)
+            else:
+                self.select(event)
+
+        def _adopt(self, node):
+            node.parent_node = self
+            node.depth = self.depth + 1
+            self.tree._adopt(node)
+
+        def add(self, node):
+            if self.is_descendant(node) or node == self:
+                # You cannot add a node to its descendant/ child or itself
+                return self
+            self.nodes.append(node)
+            self._adopt(node)
+            self._changed()
+            return self
+
+        def insert_after(self, *nodes):
+            self.parent_node.insert(self.parent_node.nodes.index(self) + 1, *nodes)
+
+        def insert_before(self, *nodes):
+            self.parent_node.insert(self.index(), *nodes)
+
+        def insert(self, index=None, *nodes):
+            index = len(self.nodes) if index is None else index
+            for node in nodes:
+                if self.is_descendant(node) or node == self:
+                    continue
+                if node in self.nodes:
+                    old_index = self.nodes.index(node)
+                    index = index if old_index >= index else index - 1
+                if node.parent_node is not None:
+                    node.remove()
+                self.nodes.insert(index, node)
+                self._adopt(node)
+                index += 1
+            self._changed()
+            return nodes
+
+        def add_as_node(self, **options):
+            node = self.__class__(self.tree, **options)
+            self.add(node)
+            return node
+
+        def remove(self, node=None):
+            if node is None:
+                if self.parent_node is not None:
+                    self.parent_node.remove(self)
+            elif node in self.nodes:
+                self.nodes.remove(node)
+                self.tree._orphan(node)
+                if not self.nodes:
+                    self._expanded = False
+                self._changed()
+
+        def expand(self):
+            if self._expanded or not self.nodes:
+                return
+            self._expanded = True
+            self._changed()
+
+        def collapse(self):
+            if not self._expanded:
+                return
+            self._expanded = False
+            self._changed()
+
+        def expand_all(self):
+            self.expand()
+            for node in self.nodes:
+                node.expand_all()
+
+        def collapse_all(self):
+            self.collapse()
+            for node in self.nodes:
+                node.collapse_all()
+
+        def toggle(self, *_):
+            if self._expanded:
+                self.collapse()
+            else:
+                self.expand()
+
+        def clear(self):
+            for node in list(self.nodes):
+                self.remove(node)
+
+    def __init__(self, master=None, **config):
+        super().__init__(master, **config)
+        self.config(**self.style.surface)
+        self.initialize_tree()
+
+    def initialize_tree(self):
+        super().initialize_tree()
+        self._on_structure_change = None
+        self.is_terminal = False
+        # flattened list of displayed nodes and the y offset of each
+        # with the total height as the last offset
+        self._items = []
+        self._offsets = [0]
+        self._rendered = {}
+        self._free_rows = []
+        self._layout_pending = False
+        self._render_pending = False
+        self._drag_target = None
+        self._drag_active = False
+        self._drop_indicator = Frame(self.get_body(), **self.style.bright, height=2)
+        # nodes are indexed as they are added to the tree so searching
+        # does not require walking the whole tree
+        self._index = SearchIndex()
+        self._hidden = set()
+        self._embedded = set()
+        self.on_scroll(self._schedule_render)
+        self._canvas.bind("<Configure>", self._schedule_render, add='+')
+
+    def get_body(self):
+        return self.body
+
+    # =========================== Layout ===============================
+
+    def _adopt(self, node):
+        # tk widgets added as children need to be re-laid out when their size changes
+        if not isinstance(node, VirtualTreeView.Node) and not getattr(node, "_virtual_bound", False):
+            node.bind("<Configure>", self.invalidate, add='+')
+            node._virtual_bound = True
+        for item in self._subtree(node):
+            if isinstance(item, VirtualTreeView.Node):
+                self._index.add(item, *self._search_terms(item))
+            else:
+                self._embedded.add(item)
+
+    def _orphan(self, node):
+        for item in self._subtree(node):
+            self._index.remove(item)
+            self._embedded.discard(item)
+            self._hidden.discard(item)
+            item._visible = True
+
+    def _subtree(self, node):
+        stack = [node]
+        while stack:
+            item = stack.pop()
+            yield item
+            if isinstance(item, VirtualTreeView.Node):
+                stack.extend(item.nodes)
+
+    def _search_terms(self, node):
+        """
+        Get the strings a node can be searched by. Override to make
+        nodes searchable by more than their name
+
+        :param node: node to be indexed
+        :return: tuple of strings
+        """
+        return node.name,
+
+    def _reindex(self, node):
+        if node in self._index:
+            self._index.update(node, *self._search_terms(node))
+
+    def invalidate(self, *_):
+        """
+        Schedule the tree to be laid out again. Multiple changes
+        are coalesced into a single layout pass
+        """
+        if self._layout_pending:
+            return
+        self._layout_pending = True
+        self.after_idle(self.layout)
+
+    def _schedule_render(self, *_):
+        # the viewport changed but the layout is still valid
+        if self._render_pending or self._layout_pending:
+            return
+        self._render_pending = True
+        self.after_idle(self._deferred_render)
+
+    def _deferred_render(self):
+        self._render_pending = False
+        try:
+            self.render(refresh=False)
+        except tk.TclError:
+            pass
+
+    def _item_height(self, item):
+        if isinstance(item, VirtualTreeView.Node):
+            return self.ROW_HEIGHT
+        return item.winfo_reqheight()
+
+    def _flatten(self):
+        items, offsets = [], [0]
+        stack = list(reversed(self.nodes))
+        while stack:
+            item = stack.pop()
+            if not getattr(item, "_visible", True):
+                continue
+            items.append(item)
+            offsets.append(offsets[-1] + self._item_height(item))
+            if isinstance(item, VirtualTreeView.Node) and item._expanded:
+                stack.extend(reversed(item.nodes))
+        return items, offsets
+
+    def layout(self):
+        self._layout_pending = False
+        try:
+            self._items, self._offsets = self._flatten()
+            self.get_body().configure(height=max(self._offsets[-1], 1))
+            self.render()
+        except tk.TclError:
+            # tree has been destroyed
+            pass
+
+    def _visible_range(self):
+        top, bottom = self.viewport()
+        first = bisect.bisect_right(self._offsets, top) - 1
+        last = bisect.bisect_left(self._offsets, bottom)
+        return max(first - self.OVERSCAN, 0), min(last + self.OVERSCAN, len(self._items))
+
+    def _acquire_row(self, node):
+        row = self._free_rows.pop() if self._free_rows else self.Row(self)
+        row.bind_node(node)
+        return row
+
+    def _release(self, item, widget):
+        widget.place_forget()
+        if widget is not item:
+            widget.node = None
+            self._free_rows.append(widget)
+
+    def render(self, refresh=True):
+        """
+        Place the rows in the viewport recycling rows that are out of view
+
+        :param refresh: set to False to skip updating rows that were already
+          rendered if the state of their nodes is known to be unchanged
+        """
+        first, last = self._visible_range()
+        visible = self._items[first:last]
+        visible_set = set(visible)
+        for item in list(self._rendered):
+            if item not in visible_set:
+                self._release(item, self._rendered.pop(item))
+
+        for index, item in enumerate(visible, start=first):
+            top = self._offsets[index]
+            if isinstance(item, VirtualTreeView.Node):
+                row = self._rendered.get(item)
+                if row is None:
+                    row = self._rendered[item] = self._acquire_row(item)
+                elif refresh:
+                    row.refresh()
+                row.place(x=0, y=top, relwidth=1, height=self.ROW_HEIGHT)
+            else:
+                self._rendered[item] = item
+                item.place(in_=self.get_body(), x=0, y=top, relwidth=1)
+
+    # =========================== Tree =================================
+
+    def add(self, node):
+        self.nodes.append(node)
+        node.parent_node = self
+        node.depth = self.depth + 1
+        self._adopt(node)
+        self.invalidate()
+
+    def add_as_node(self, **options):
+        node = self.__class__.Node(self, **options)
+        self.add(node)
+        return node
+
+    def remove(self, node):
+        if node in self.nodes:
+            self.nodes.remove(node)
+            self._orphan(node)
+            self.invalidate()
+
+    def redraw(self):
+        self.invalidate()
+
+    def insert(self, index=None, *nodes):
+        if index is None:
+            index = len(self.nodes)
+        for node in nodes:
+            if node in self.nodes:
+                old_index = self.nodes.index(node)
+                index = index if old_index >= index else index - 1
+            if node.parent_node is not None:
+                node.remove()
+            self.nodes.insert(index, node)
+            index += 1
+            node.parent_node = self
+            node.depth = self.depth + 1
+            self._adopt(node)
+        self.invalidate()
+        return nodes
+
+    def search(self, query):
+        """
+        Show only the nodes matching the query and their ancestors. Matches
+        are looked up in the index and only nodes whose visibility changes
+        are touched
+
+        :param query: string to search for. Use an empty string to end search
+        :return: ``True`` if any node matches the query
+        """
+        shown = set()
+        matches = list(self._index.search(query))
+        changed = False
+        for item in self._embedded:
+            visible = bool(item.search(query)) or not query
+            changed = changed or visible != getattr(item, "_visible", True)
+            item._visible = visible
+            if visible and query:
+                matches.append(item)
+
+        for node in matches:
+            parent = node
+            while parent is not self and parent not in shown:
+                shown.add(parent)
+                parent = parent.parent_node
+                if query and parent is not self and not parent._expanded:
+                    parent._expanded = True
+                    changed = True
+
+        hidden = self._index.keys() - shown if query else set()
+        for node in self._hidden ^ hidden:
+            node._visible = node not in hidden
+            changed = True
+        self._hidden = hidden
+        if changed:
+            self.invalidate()
+        return bool(shown)
+
+    def see(self, node):
+        """
+        Expand all nodes from the root to the given node and scroll
+        the node into view
+
+        :param node: The node to be expanded to
+        """
+        parent = node.parent_node
+        while isinstance(parent, VirtualTreeView.Node):
+            parent.expand()
+            parent = parent.parent_node
+        self.layout()
+        if node not in self._items:
+            return
+        index = self._items.index(node)
+        top, bottom = self.viewport()
+        if top <= self._offsets[index] and self._offsets[index + 1] <= bottom:
+            return
+        self.on_configure()
+        self.yview_moveto(self._offsets[index] / max(self._offsets[-1], 1))
+
+    # =========================== Drag and drop ========================
+
+    def on_structure_change(self, callback, *args, **kwargs):
+        self._on_structure_change = lambda: callback(*args, **kwargs)
+
+    def _structure_changed(self):
+        if self._on_structure_change:
+            self._on_structure_change()
+
+    def _drop_target(self, event):
+        y = event.y_root - self.get_body().winfo_rooty()
+        index = bisect.bisect_right(self._offsets, y) - 1
+        if not 0 <= index < len(self._items):
+            return None
+        item = self._items[index]
+        if not isinstance(item, VirtualTreeView.Node) or item in self._selected:
+            return None
+        offset = y - self._offsets[index]
+        if offset < 5:
+            return item, InsertType.INSERT_BEFORE, self._offsets[index]
+        if offset < self.ROW_HEIGHT - 5 and not item.is_terminal:
+            return item, InsertType.INSERT_INTO, self._offsets[index + 1] - 2
+        return item, InsertType.INSERT_AFTER, self._offsets[index + 1] - 2
+
+    def drag(self, node, event):
+        if not node.editable or node not in self._selected or not event.state & EventMask.MOUSE_BUTTON_1:
+            return
+        self._drag_active = True
+        self._drag_target = self._drop_target(event)
+        if self._drag_target is None:
+            self._drop_indicator.place_forget()
+            return
+        self._drop_indicator.place(x=0, y=self._drag_target[2], relwidth=1, height=2)
+        self._drop_indicator.lift()
+
+    def end_drag(self, _):
+        """
+        Complete any drag in progress. Returns ``True`` if a drag was active
+        """
+        if not self._drag_active:
+            return False
+        self._drag_active = False
+        self._drop_indicator.place_forget()
+        if self._drag_target is not None:
+            target, action, _ = self._drag_target
+            nodes = list(self._selected)
+            if action == InsertType.INSERT_BEFORE:
+                target.insert_before(*nodes)
+            elif action == InsertType.INSERT_INTO:
+                target.insert(None, *nodes)
+            else:
+                target.insert_after(*nodes)
+            self._drag_target = None
+            self._structure_changed()
+        return True
@@ -144,6 +144,8 @@ class SideBar(Canvas):
 
 
 class SearchBar(Frame):
+    # delay in milliseconds after the last keystroke before a query is run
+    DEBOUNCE = 150
 
     def __init__(self, master=None, **cnf):
         super().__init__(master, **cnf)
@@ -158,6 +160,7 @@ class SearchBar(Frame):
         self._entry.on_entry(self._change)
         self._on_change = None
         self._on_clear = None
+        self._pending = None
 
     def focus_set(self):
         super().focus_set()
@@ -169,11 +172,23 @@ class SearchBar(Frame):
     def on_query_clear(self, func, *args, **kwargs):
         self._on_clear = lambda: func(*args, **kwargs)
 
+    def _cancel_pending(self):
+        if self._pending is not None:
+            self.after_cancel(self._pending)
+            self._pending = None
+
     def _clear(self, *_):
+        self._cancel_pending()
         if self._on_clear:
             self._on_clear()
 
     def _change(self, *_):
+        # coalesce rapid keystrokes into a single query
+        self._cancel_pending()
+        self._pending = self.after(self.DEBOUNCE, self._run_query)
+
+    def _run_query(self):
+        self._pending = None
         if self._on_change:
             self._on_change(self._entry.get())
 